@@ -86,10 +86,13 @@ async def example_interactive():
         "create release for components backend, frontend from main",
     ]
 
-    for message in messages:
+    # Messages are independent, so handle them concurrently
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(orchestrator.handle_message(m)) for m in messages]
+
+    for message, task in zip(messages, tasks):
         print(f"\nUser: {message}")
-        response = await orchestrator.handle_message(message)
-        print(f"Agent: {response}")
+        print(f"Agent: {task.result()}")
 
     await orchestrator.cleanup()
 
@@ -0,0 +1,54 @@
+"""Fast repository structure scan used by code repository agents."""
+
+import os
+from collections import deque
+from pathlib import Path
+from typing import Union
+
+# Directories that never contain project sources worth scanning
+# (build output, VCS and IDE metadata, Maven wrapper downloads)
+SCAN_PRUNE = frozenset({b".git", b"target", b"build", b"node_modules", b".idea", b".mvn"})
+
+_MAIN_JAVA = os.path.join(b"main", b"java")
+_TEST_JAVA = os.path.join(b"test", b"java")
+
+
+def scan(root: Union[bytes, str, Path]) -> tuple[int, int, int]:
+    """
+    Count Maven projects and Java source/test roots in a single directory walk.
+
+    The walk works on bytes paths end to end, so directory entries are never
+    decoded to str and no Path objects are created per entry.
+
+    Args:
+        root: Repository root
+
+    Returns:
+        Tuple of (pom.xml files, src/main/java dirs, src/test/java dirs)
+    """
+    pom_files = src_dirs = test_dirs = 0
+    pending = deque([os.fsencode(root)])
+    isdir = os.path.isdir
+    join = os.path.join
+
+    while pending:
+        path = pending.pop()
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if name in SCAN_PRUNE:
+                            continue
+                        if name == b"src":
+                            if isdir(join(entry.path, _MAIN_JAVA)):
+                                src_dirs += 1
+                            if isdir(join(entry.path, _TEST_JAVA)):
+                                test_dirs += 1
+                        pending.append(entry.path)
+                    elif name == b"pom.xml":
+                        pom_files += 1
+        except OSError:
+            continue
+
+    return pom_files, src_dirs, test_dirs
@@ -1,15 +1,19 @@
 """Base agent class with memory and LLM capabilities."""
 
+import asyncio
 import time
 import uuid
 from abc import ABC, abstractmethod
-from datetime import datetime
+from collections import OrderedDict, deque
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Coroutine, Iterable, Optional
 
+from sdlc_agents.config import settings
 from sdlc_agents.llm import LLMMessage, LLMProvider, LLMResponse, MessageRole, get_llm_provider
+from sdlc_agents.llm.batcher import batch_scheduler
+from sdlc_agents.llm.cache import ResponseCache
 from sdlc_agents.logging_config import logger
-from sdlc_agents.memory import ClickHouseMemory, MemoryEntry
+from sdlc_agents.memory import ClickHouseMemory, MemoryEntry, get_default_memory
 
 
 class AgentCapability(str, Enum):
@@ -29,11 +33,35 @@ class AgentCapability(str, Enum):
 class Agent(ABC):
     """Base class for all agents in the system."""
 
+    __slots__ = (
+        "agent_id",
+        "name",
+        "capabilities",
+        "system_prompt",
+        "llm",
+        "memory",
+        "session_id",
+        "_memory_cache",
+        "_pending_writes",
+        "_system_msg",
+        "_memory_context_msg",
+        "_memory_context_session",
+        "_memory_dirty",
+        "_context_cache",
+        "_response_cache",
+    )
+
+    # Recent memories kept in-process per session, and number of sessions cached
+    MEMORY_CACHE_SIZE = 10
+    MEMORY_CACHE_SESSIONS = 8
+    # Rendered context messages kept for reuse
+    CONTEXT_CACHE_SIZE = 32
+
     def __init__(
         self,
         agent_id: str,
         name: str,
-        capabilities: list[AgentCapability],
+        capabilities: Iterable[AgentCapability],
         system_prompt: str,
         llm_provider: Optional[LLMProvider] = None,
         memory: Optional[ClickHouseMemory] = None,
@@ -44,18 +72,37 @@ class Agent(ABC):
         Args:
             agent_id: Unique identifier for this agent
             name: Human-readable name
-            capabilities: List of agent capabilities
+            capabilities: Agent capabilities
             system_prompt: System prompt defining agent behavior
             llm_provider: LLM provider (creates default if None)
-            memory: Memory store (creates default if None)
+            memory: Memory store (uses the shared default if None)
         """
         self.agent_id = agent_id
         self.name = name
-        self.capabilities = capabilities
+        self.capabilities = frozenset(capabilities)
         self.system_prompt = system_prompt
         self.llm = llm_provider or get_llm_provider()
-        self.memory = memory or ClickHouseMemory()
+        self.memory = memory or get_default_memory()
         self.session_id = str(uuid.uuid4())
+        # A fresh session has no stored memories, so its cache starts warm
+        self._memory_cache: OrderedDict[str, deque[MemoryEntry]] = OrderedDict(
+            [(self.session_id, deque(maxlen=self.MEMORY_CACHE_SIZE))]
+        )
+        self._pending_writes: set[asyncio.Task] = set()
+
+        # Stable prompt prefix, reused across think() calls
+        self._system_msg = LLMMessage(role=MessageRole.SYSTEM, content=system_prompt)
+        self._memory_context_msg: Optional[LLMMessage] = None
+        self._memory_context_session: Optional[str] = None
+        self._memory_dirty = True
+        self._context_cache: OrderedDict[
+            int, tuple[dict[str, Any], dict[str, Any], LLMMessage]
+        ] = OrderedDict()
+        # Responses to think(cache=True) prompts, on disk
+        self._response_cache = ResponseCache(
+            settings.workspace_dir / "llm-cache",
+            ttl_seconds=settings.llm_cache_ttl_hours * 3600,
+        )
 
         logger.info(f"Initialized agent: {name} ({agent_id})")
 
@@ -68,13 +115,83 @@ class Agent(ABC):
         """Store a memory entry."""
         entry = MemoryEntry(
             agent_id=self.agent_id,
-            timestamp=datetime.now(),
+            timestamp=time.time_ns(),
             memory_type=memory_type,
             content=content,
             metadata=metadata or {},
             session_id=self.session_id,
         )
-        self.memory.store_memory(entry)
+        if self._in_event_loop():
+            # Don't block the caller on ClickHouse; cleanup() waits for these
+            self._schedule_write(self._store_memory_async(entry))
+        else:
+            self.memory.store_memory(entry)
+
+        # Write-through so think() doesn't need to read back from ClickHouse
+        cached = self._memory_cache.get(self.session_id)
+        if cached is not None:
+            cached.append(entry)
+            self._memory_cache.move_to_end(self.session_id)
+        self._memory_dirty = True
+
+    async def _store_memory_async(self, entry: MemoryEntry) -> None:
+        """Hand a memory entry to the memory store's write buffer."""
+        await self.memory.store_memory_async(entry)
+
+    def _schedule_write(self, write: Coroutine[Any, Any, None]) -> None:
+        """Run a memory write in the background, tracked until it completes."""
+        task = asyncio.create_task(write)
+        self._pending_writes.add(task)
+        task.add_done_callback(self._pending_writes.discard)
+
+    def _recent_memories(self, limit: int = 5) -> list[MemoryEntry]:
+        """
+        Get the most recent memories for the current session.
+
+        Served from the in-process cache; ClickHouse is only queried the first
+        time a session is seen (e.g. when resuming an existing session).
+
+        Args:
+            limit: Maximum number of entries
+
+        Returns:
+            Memory entries, newest first
+        """
+        cached = self._memory_cache.get(self.session_id)
+        if cached is None:
+            recent = self.memory.get_recent_memories(
+                agent_id=self.agent_id,
+                limit=self.MEMORY_CACHE_SIZE,
+                session_id=self.session_id,
+                hours=24,
+            )
+            # ClickHouse returns newest first; the deque is kept oldest first
+            cached = deque(reversed(recent), maxlen=self.MEMORY_CACHE_SIZE)
+            self._memory_cache[self.session_id] = cached
+            while len(self._memory_cache) > self.MEMORY_CACHE_SESSIONS:
+                self._memory_cache.popitem(last=False)
+        else:
+            self._memory_cache.move_to_end(self.session_id)
+
+        return list(reversed(cached))[:limit]
+
+    def _memory_context_message(self) -> Optional[LLMMessage]:
+        """Get the recent-memory system message, rebuilding it only after new memories."""
+        if self._memory_dirty or self._memory_context_session != self.session_id:
+            recent_memories = self._recent_memories(limit=5)
+            if recent_memories:
+                memory_context = "Recent context:\n" + "\n".join(
+                    [f"- {m.content_preview}" for m in recent_memories]
+                )
+                self._memory_context_msg = LLMMessage(
+                    role=MessageRole.SYSTEM, content=memory_context
+                )
+            else:
+                self._memory_context_msg = None
+            self._memory_context_session = self.session_id
+            self._memory_dirty = False
+
+        return self._memory_context_msg
 
     def _log_action(
         self,
@@ -85,8 +202,19 @@ class Agent(ABC):
         success: bool,
         duration_ms: int,
     ) -> None:
-        """Log an agent action."""
-        self.memory.log_action(
+        """
+        Log an agent action.
+
+        Args:
+            action_type: Kind of action
+            target: What the action operated on
+            parameters: Action inputs
+            result: Action outcome
+            success: Whether the action succeeded
+            duration_ms: Elapsed milliseconds, measured with the monotonic
+                ``time.perf_counter_ns()`` clock
+        """
+        action = dict(
             agent_id=self.agent_id,
             action_type=action_type,
             target=target,
@@ -96,12 +224,79 @@ class Agent(ABC):
             duration_ms=duration_ms,
             session_id=self.session_id,
         )
+        if self._in_event_loop():
+            self._schedule_write(self._log_action_async(action))
+        else:
+            self.memory.log_action(**action)
+
+    async def _log_action_async(self, action: dict[str, Any]) -> None:
+        """Hand an action to the memory store's write buffer."""
+        await self.memory.log_action_async(**action)
+
+    @staticmethod
+    def _in_event_loop() -> bool:
+        """Check whether we're running inside an event loop."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
+
+    def _context_message(self, context: dict[str, Any]) -> LLMMessage:
+        """
+        Render a context dict as a system message, reusing it for repeated contexts.
+
+        Entries are keyed by the dict's identity and hold a reference to it, so the id
+        can't be recycled while cached; a snapshot comparison catches in-place edits.
+
+        Args:
+            context: Context passed to think()
+
+        Returns:
+            Context system message
+        """
+        key = id(context)
+        cached = self._context_cache.get(key)
+        if cached is not None and cached[0] is context and cached[1] == context:
+            self._context_cache.move_to_end(key)
+            return cached[2]
+
+        context_str = "\n".join([f"{k}: {v}" for k, v in context.items()])
+        message = LLMMessage(role=MessageRole.SYSTEM, content=f"Context:\n{context_str}")
+        self._context_cache[key] = (context, dict(context), message)
+        self._context_cache.move_to_end(key)
+        if len(self._context_cache) > self.CONTEXT_CACHE_SIZE:
+            self._context_cache.popitem(last=False)
+        return message
+
+    def _build_messages(
+        self, user_message: str, context: Optional[dict[str, Any]] = None
+    ) -> list[LLMMessage]:
+        """Assemble the message history for an LLM call."""
+        # Build message history
+        if self._system_msg.content is not self.system_prompt:
+            self._system_msg = LLMMessage(role=MessageRole.SYSTEM, content=self.system_prompt)
+        messages = [self._system_msg]
+
+        # Add relevant memories
+        memory_context_msg = self._memory_context_message()
+        if memory_context_msg is not None:
+            messages.append(memory_context_msg)
+
+        # Add context if provided
+        if context:
+            messages.append(self._context_message(context))
+
+        # Add user message
+        messages.append(LLMMessage(role=MessageRole.USER, content=user_message))
+        return messages
 
     async def think(
         self,
         user_message: str,
         context: Optional[dict[str, Any]] = None,
         temperature: float = 0.7,
+        cache: bool = False,
     ) -> LLMResponse:
         """
         Generate a response using the LLM.
@@ -110,43 +305,35 @@ class Agent(ABC):
             user_message: User's input
             context: Additional context
             temperature: LLM temperature
+            cache: Reuse a previous response for the same system prompt, message,
+                context, model and temperature. Only for prompts whose inputs fully
+                determine the answer; agent memories are not part of the key.
 
         Returns:
             LLM response
         """
-        start_time = time.time()
-
-        # Build message history
-        messages = [LLMMessage(role=MessageRole.SYSTEM, content=self.system_prompt)]
-
-        # Add relevant memories
-        recent_memories = self.memory.get_recent_memories(
-            agent_id=self.agent_id,
-            limit=10,
-            session_id=self.session_id,
-            hours=24,
-        )
-
-        if recent_memories:
-            memory_context = "Recent context:\n" + "\n".join(
-                [f"- {m.content[:200]}" for m in recent_memories[:5]]
-            )
-            messages.append(LLMMessage(role=MessageRole.SYSTEM, content=memory_context))
-
-        # Add context if provided
-        if context:
-            context_str = "\n".join([f"{k}: {v}" for k, v in context.items()])
-            messages.append(
-                LLMMessage(role=MessageRole.SYSTEM, content=f"Context:\n{context_str}")
-            )
-
-        # Add user message
-        messages.append(LLMMessage(role=MessageRole.USER, content=user_message))
+        start_ns = time.perf_counter_ns()
+        messages = self._build_messages(user_message, context)
 
         try:
-            response = await self.llm.generate(messages, temperature=temperature)
-
-            duration_ms = int((time.time() - start_time) * 1000)
+            response = None
+            if cache:
+                cache_key = ResponseCache.make_key(
+                    self.system_prompt,
+                    user_message,
+                    getattr(self.llm, "model", type(self.llm).__name__),
+                    temperature,
+                    self._context_message(context).content if context else "",
+                )
+                response = await asyncio.to_thread(self._response_cache.get, cache_key)
+
+            if response is None:
+                # Concurrent identical prompts across agents are coalesced into one call
+                response = await batch_scheduler.submit(self.llm, messages, temperature)
+                if cache:
+                    await asyncio.to_thread(self._response_cache.put, cache_key, response)
+
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
             # Store conversation in memory
             self._store_memory(
@@ -166,7 +353,7 @@ class Agent(ABC):
 
             return response
         except Exception as e:
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             logger.error(f"Agent {self.name} think failed: {e}")
 
             self._log_action(
@@ -179,6 +366,77 @@ class Agent(ABC):
             )
             raise
 
+    async def think_stream(
+        self,
+        user_message: str,
+        context: Optional[dict[str, Any]] = None,
+        temperature: float = 0.7,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a response from the LLM.
+
+        The conversation is recorded once the stream finishes or is closed early
+        by the caller; closing early also closes the provider stream.
+
+        Args:
+            user_message: User's input
+            context: Additional context
+            temperature: LLM temperature
+
+        Yields:
+            Chunks of generated text
+        """
+        start_ns = time.perf_counter_ns()
+        messages = self._build_messages(user_message, context)
+        stream = self.llm.stream_generate(messages, temperature=temperature)
+        chunks: list[str] = []
+
+        try:
+            async for chunk in stream:
+                chunks.append(chunk)
+                yield chunk
+        except GeneratorExit:
+            # Caller stopped reading; record what was generated so far
+            self._record_stream(user_message, "".join(chunks), start_ns)
+            raise
+        except Exception as e:
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            logger.error(f"Agent {self.name} think_stream failed: {e}")
+
+            self._log_action(
+                action_type="think",
+                target="llm",
+                parameters={"message": user_message[:200], "stream": True},
+                result={"error": str(e)},
+                success=False,
+                duration_ms=duration_ms,
+            )
+            raise
+        else:
+            content = "".join(chunks)
+            self._record_stream(user_message, content, start_ns)
+        finally:
+            await stream.aclose()
+
+    def _record_stream(self, user_message: str, content: str, start_ns: int) -> None:
+        """Record a streamed conversation once it has ended."""
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+
+        self._store_memory(
+            memory_type="conversation",
+            content=f"User: {user_message}\nAssistant: {content}",
+            metadata={"stream": True},
+        )
+
+        self._log_action(
+            action_type="think",
+            target="llm",
+            parameters={"message": user_message[:200], "stream": True},
+            result={"content": content[:200]},
+            success=True,
+            duration_ms=duration_ms,
+        )
+
     async def observe(self, observation: str, metadata: Optional[dict[str, Any]] = None) -> None:
         """
         Record an observation.
@@ -265,5 +523,7 @@ class Agent(ABC):
 
     async def cleanup(self) -> None:
         """Cleanup resources."""
-        if hasattr(self.llm, "close"):
-            await self.llm.close()
+        if self._pending_writes:
+            await asyncio.gather(*self._pending_writes, return_exceptions=True)
+        await self.memory.flush()
+        # The LLM provider is shared by all agents, so it's closed by the owner of the system
@@ -1,17 +1,268 @@
 """Build Monitor Agent - watches CI/CD pipelines and handles failures."""
 
 import asyncio
-from typing import Any, Optional
+import contextlib
+import functools
+import hashlib
+import heapq
+import itertools
+import re
+from datetime import timedelta
+from typing import Any, AsyncIterator, Callable, Optional
+
+import orjson
 
 from sdlc_agents.agents.base import Agent, AgentCapability
 from sdlc_agents.config import settings
 from sdlc_agents.integrations import ADOClient
 from sdlc_agents.logging_config import logger
 
+_JSON_START = re.compile(r"\{")
+
+# Keywords in a free-text LLM answer that indicate an intermittent failure
+_FLAKY_RE = re.compile(
+    r"intermittent|flaky|timeout|timed out|race condition|transient|ECONNRESET",
+    re.IGNORECASE,
+)
+
+# Run-specific noise stripped from build logs before fingerprinting
+_TIMESTAMP_RE = re.compile(r"\d{4}-\d{2}-\d{2}[T ][\d:.,]+Z?")
+_TEMP_PATH_RE = re.compile(r"(?:/tmp|/var/folders|/home/[^/\s]+|/Users/[^/\s]+)/\S*")
+_NUMERIC_ID_RE = re.compile(r"\b\d{3,}\b")
+_WHITESPACE_RE = re.compile(r"[ \t]+")
+
+# Longest wait between two polls of the same build, in seconds
+_POLL_MAX_INTERVAL = 30
+
+# Unambiguous failure signals that don't need an LLM to classify
+_INTERMITTENT_RE = re.compile(
+    r"\b(ECONNRESET|ETIMEDOUT|connection reset|connection timed out|429|"
+    r"Too Many Requests|socket hang up|network is unreachable)\b",
+    re.IGNORECASE,
+)
+_COMPILE_ERR_RE = re.compile(
+    r"\b(error [CT]S\d+|SyntaxError|cannot find module|undefined reference|"
+    r"COMPILATION ERROR|cannot find symbol)\b",
+    re.IGNORECASE,
+)
+
+
+class _PrioritySemaphore:
+    """Semaphore that hands free slots to the waiter with the lowest priority key."""
+
+    def __init__(self, value: int):
+        """
+        Initialize the semaphore.
+
+        Args:
+            value: Number of concurrent holders allowed
+        """
+        self._value = value
+        self._waiters: list[tuple[Any, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+
+    async def acquire(self, priority: Any = (0.0, 0)) -> None:
+        """Wait for a slot; lower priority keys are served first."""
+        if self._value > 0 and not self._waiters:
+            self._value -= 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # The slot may have been handed over just before cancellation
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Hand the slot to the next live waiter, or return it to the pool."""
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._value += 1
+
+    @contextlib.asynccontextmanager
+    async def slot(self, priority: Any = (0.0, 0)) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the block."""
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+
+@functools.cache
+def _ado_semaphore() -> _PrioritySemaphore:
+    """
+    Get the semaphore capping concurrent Azure DevOps calls across all build monitors.
+
+    Created on first use, so reading the limit doesn't load settings at import.
+    """
+    return _PrioritySemaphore(settings.ado_max_concurrency)
+
+
+class _JsonObjectScanner:
+    """
+    Incrementally find the first balanced JSON object in streamed text.
+
+    Counts braces outside of string literals from the first ``{``, so nested
+    objects and surrounding prose or markdown fences don't require regex
+    backtracking, and the object is known to be complete as soon as its closing
+    brace arrives.
+    """
+
+    def __init__(self):
+        """Initialize an empty scanner."""
+        self._chunks: list[str] = []
+        self._offset = 0
+        self._start: Optional[int] = None
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    @property
+    def text(self) -> str:
+        """All text fed so far."""
+        return "".join(self._chunks)
+
+    def feed(self, chunk: str) -> Optional[str]:
+        """
+        Scan the next chunk of text.
+
+        Args:
+            chunk: Next piece of text
+
+        Returns:
+            The complete JSON object once its closing brace is seen, else None
+        """
+        base = self._offset
+        self._chunks.append(chunk)
+        self._offset += len(chunk)
+
+        pos = 0
+        if self._start is None:
+            start_match = _JSON_START.search(chunk)
+            if not start_match:
+                return None
+            pos = start_match.start()
+            self._start = base + pos
+
+        for i in range(pos, len(chunk)):
+            char = chunk[i]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    return self.text[self._start : base + i + 1]
+
+        return None
+
+
+def _extract_json_object(text: str) -> Optional[str]:
+    """
+    Extract the first balanced JSON object from text.
+
+    Args:
+        text: Text that may contain a JSON object
+
+    Returns:
+        The JSON object substring, or None if no balanced object is found
+    """
+    return _JsonObjectScanner().feed(text)
+
+
+def _preclassify_failure(logs: str) -> Optional[dict[str, Any]]:
+    """
+    Classify a build failure from unambiguous log signals.
+
+    Args:
+        logs: Build logs
+
+    Returns:
+        Analysis in the same shape the LLM produces, or None if the logs
+        need a full analysis
+    """
+    intermittent = _INTERMITTENT_RE.findall(logs)
+    compile_errors = _COMPILE_ERR_RE.findall(logs)
+
+    if len(intermittent) >= 2 and not compile_errors:
+        signals = sorted(set(intermittent))
+        return {
+            "failure_type": "intermittent_failure",
+            "is_intermittent": True,
+            "confidence": 0.9,
+            "root_cause": f"Transient network/infrastructure errors: {', '.join(signals)}",
+            "affected_components": [],
+            "recommended_action": "retry",
+            "fix_suggestions": [],
+            "reasoning": f"Matched {len(intermittent)} intermittent failure signals in logs",
+        }
+
+    if compile_errors and not intermittent:
+        signals = sorted(set(compile_errors))
+        return {
+            "failure_type": "compilation_error",
+            "is_intermittent": False,
+            "confidence": 0.9,
+            "root_cause": f"Compilation errors: {', '.join(signals)}",
+            "affected_components": [],
+            "recommended_action": "fix_code",
+            "fix_suggestions": ["Fix the compilation errors reported in the build logs"],
+            "reasoning": f"Matched {len(compile_errors)} compilation error signals in logs",
+        }
+
+    return None
+
+
+def _log_fingerprint(logs: str) -> str:
+    """
+    Fingerprint build logs so repeated failures map to the same key.
+
+    Timestamps, temporary/absolute paths and numeric IDs vary between runs of the
+    same failure, so they are stripped before hashing.
+
+    Args:
+        logs: Raw build logs
+
+    Returns:
+        Hex digest of the normalized logs
+    """
+    normalized = _TIMESTAMP_RE.sub("", logs)
+    normalized = _TEMP_PATH_RE.sub("<path>", normalized)
+    normalized = _NUMERIC_ID_RE.sub("<n>", normalized)
+    normalized = _WHITESPACE_RE.sub(" ", normalized)
+    return hashlib.sha1(normalized[:4096].encode()).hexdigest()
+
 
 class BuildMonitorAgent(Agent):
     """Agent that monitors builds and handles failures."""
 
+    __slots__ = (
+        "ado_client",
+        "_build_ids",
+        "_build_pr_ids",
+        "_build_status",
+        "_build_retry_count",
+        "_build_index",
+        "_retried_builds",
+        "_active_builds",
+    )
+
     def __init__(self):
         """Initialize the build monitor agent."""
         system_prompt = """You are the Build Monitor Agent for an automated SDLC system.
@@ -43,8 +294,124 @@ Be proactive in keeping builds green and identifying problematic patterns."""
             system_prompt=system_prompt,
         )
 
-        self.ado_client = ADOClient()
-        self.monitored_builds: dict[int, dict[str, Any]] = {}
+        self.ado_client = ADOClient.get_default()
+
+        # Monitored builds as parallel arrays, one row per build
+        self._build_ids: list[int] = []
+        self._build_pr_ids: list[Optional[int]] = []
+        self._build_status: list[str] = []
+        self._build_retry_count: list[int] = []
+        self._build_index: dict[int, int] = {}
+
+        # Running counts so statistics don't have to scan the arrays
+        self._retried_builds = 0
+        self._active_builds = 0
+
+    def _track_build(
+        self,
+        build_id: int,
+        pr_id: Optional[int],
+        status: str = "inProgress",
+        retry_count: int = 0,
+    ) -> int:
+        """
+        Start tracking a build, or reset its row if already tracked.
+
+        Args:
+            build_id: Build identifier
+            pr_id: Pull request the build belongs to
+            status: Current build status
+            retry_count: Retries so far in this build's retry chain
+
+        Returns:
+            Row index of the build
+        """
+        index = self._build_index.get(build_id)
+        if index is None:
+            index = len(self._build_ids)
+            self._build_index[build_id] = index
+            self._build_ids.append(build_id)
+            self._build_pr_ids.append(pr_id)
+            self._build_status.append("")
+            self._build_retry_count.append(0)
+        else:
+            self._build_pr_ids[index] = pr_id
+        self._set_build_status(index, status)
+        self._set_retry_count(index, retry_count)
+        return index
+
+    def _set_build_status(self, index: int, status: str) -> None:
+        """Update a build's status, keeping the active count in sync."""
+        self._active_builds += (status == "inProgress") - (
+            self._build_status[index] == "inProgress"
+        )
+        self._build_status[index] = status
+
+    def _set_retry_count(self, index: int, retry_count: int) -> None:
+        """Update a build's retry count, keeping the retried count in sync."""
+        self._retried_builds += (retry_count > 0) - (self._build_retry_count[index] > 0)
+        self._build_retry_count[index] = retry_count
+
+    @property
+    def monitored_builds(self) -> dict[int, dict[str, Any]]:
+        """Monitored builds keyed by build ID (a snapshot built on demand)."""
+        return {
+            build_id: {"pr_id": pr_id, "status": status, "retry_count": retry_count}
+            for build_id, pr_id, status, retry_count in zip(
+                self._build_ids,
+                self._build_pr_ids,
+                self._build_status,
+                self._build_retry_count,
+            )
+        }
+
+    async def _ado_call(
+        self, func: Callable[..., Any], *args: Any, priority: Any = (0.0, 0), **kwargs: Any
+    ) -> Any:
+        """
+        Run a blocking ADO client call under the shared concurrency limit.
+
+        Args:
+            func: ADO client method
+            *args: Positional arguments for the call
+            priority: Scheduling key; lower keys get a free slot first
+            **kwargs: Keyword arguments for the call
+
+        Returns:
+            The call's return value
+        """
+        async with _ado_semaphore().slot(priority):
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def _wait_for_build(self, build_id: int) -> Optional[dict[str, Any]]:
+        """
+        Poll a build with exponential backoff until it completes or times out.
+
+        Builds that have been running longer are closer to finishing, so their
+        polls are served first when ADO calls are contended.
+
+        Args:
+            build_id: Build to poll
+
+        Returns:
+            Last known build details, or None if the build wasn't found
+        """
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        delay = 1.0
+
+        while True:
+            await asyncio.sleep(delay)
+            elapsed = loop.time() - start
+            progress = min(elapsed / settings.build_timeout, 1.0)
+
+            build = await self._ado_call(
+                self.ado_client.get_build, build_id, priority=(-progress, build_id)
+            )
+            if not build or build["status"] == "completed" or elapsed >= settings.build_timeout:
+                return build
+
+            delay = min(delay * 2, _POLL_MAX_INTERVAL, settings.build_timeout - elapsed)
 
     async def process_task(self, task: dict[str, Any]) -> dict[str, Any]:
         """
@@ -84,21 +451,16 @@ Be proactive in keeping builds green and identifying problematic patterns."""
         build_id = task.get("build_id", 12345)
 
         # Track this build
-        self.monitored_builds[build_id] = {
-            "pr_id": pr_id,
-            "status": "inProgress",
-            "retry_count": 0,
-        }
-
-        # Wait for completion (in real implementation, poll periodically)
-        await asyncio.sleep(1)
+        index = self._track_build(build_id, pr_id)
 
-        # Check build status
-        build = self.ado_client.get_build(build_id)
+        # Wait for completion
+        build = await self._wait_for_build(build_id)
 
         if not build:
             return {"success": False, "error": f"Build {build_id} not found"}
 
+        self._set_build_status(index, build["status"])
+
         if build["result"] == "failed":
             # Analyze the failure
             analysis = await self._analyze_build_failure({"build_id": build_id})
@@ -125,7 +487,7 @@ Be proactive in keeping builds green and identifying problematic patterns."""
         """Analyze a build failure."""
         build_id = task.get("build_id")
 
-        build = self.ado_client.get_build(build_id)
+        build = await self._ado_call(self.ado_client.get_build, build_id)
         if not build:
             return {"success": False, "error": "Build not found"}
 
@@ -134,6 +496,22 @@ Be proactive in keeping builds green and identifying problematic patterns."""
         # Get build logs (in real implementation)
         build_logs = task.get("build_logs", "Build logs would be fetched here")
 
+        # Obvious flakiness or compile errors don't need an LLM round-trip
+        preclassified = _preclassify_failure(build_logs)
+        if preclassified is not None:
+            logger.info(
+                f"Pre-classified build {build_id} as {preclassified['failure_type']}"
+            )
+            return await self._analysis_result(build_id, preclassified, source="pre-classifier")
+
+        # Repeated failures produce the same normalized logs; reuse the earlier analysis.
+        # ClickHouse calls are blocking, so they run off the event loop
+        fingerprint = _log_fingerprint(build_logs)
+        cached = await asyncio.to_thread(self.memory.get_cached_analysis, fingerprint)
+        if cached is not None:
+            logger.info(f"Using cached analysis for build {build_id} ({fingerprint[:12]})")
+            return await self._analysis_result(build_id, cached, source="cache")
+
         # Analyze with LLM
         analysis_prompt = f"""Analyze this build failure and respond with a JSON object:
 
@@ -162,34 +540,79 @@ Be specific and actionable. Focus on:
 - Network timeouts, race conditions, and flaky tests indicate intermittent failures
 - Provide concrete fix suggestions when recommending code fixes"""
 
-        response = await self.think(analysis_prompt, temperature=0.3)
-
-        # Parse JSON response
-        import json
-        import re
-
         # Extract JSON from response (handle markdown code blocks)
-        content = response.content
-        json_match = re.search(r'\{.*\}', content, re.DOTALL)
+        content, json_text = await self._stream_analysis(analysis_prompt)
 
-        if json_match:
+        if json_text:
             try:
-                analysis_result = json.loads(json_match.group())
+                analysis_result = orjson.loads(json_text)
                 is_intermittent = analysis_result.get("is_intermittent", False)
                 failure_type = analysis_result.get("failure_type", "unknown")
-            except json.JSONDecodeError:
+                await asyncio.to_thread(
+                    self.memory.store_cached_analysis,
+                    fingerprint,
+                    analysis_result,
+                    ttl=timedelta(hours=settings.build_analysis_cache_ttl_hours),
+                )
+            except orjson.JSONDecodeError:
                 # Fallback to keyword matching if JSON parsing fails
                 logger.warning(f"Failed to parse JSON from LLM response for build {build_id}")
-                is_intermittent = "intermittent" in content.lower() or "flaky" in content.lower()
+                is_intermittent = bool(_FLAKY_RE.search(content))
                 failure_type = "unknown"
                 analysis_result = {"raw_response": content}
         else:
             # Fallback to keyword matching
             logger.warning(f"No JSON found in LLM response for build {build_id}")
-            is_intermittent = "intermittent" in content.lower() or "flaky" in content.lower()
+            is_intermittent = bool(_FLAKY_RE.search(content))
             failure_type = "unknown"
             analysis_result = {"raw_response": content}
 
+        return await self._analysis_result(
+            build_id, analysis_result, is_intermittent, failure_type
+        )
+
+    async def _stream_analysis(self, prompt: str) -> tuple[str, Optional[str]]:
+        """
+        Stream the LLM analysis and stop once its JSON object is complete.
+
+        Args:
+            prompt: Analysis prompt
+
+        Returns:
+            Response text received and the JSON object, if one was found
+        """
+        scanner = _JsonObjectScanner()
+        stream = self.think_stream(prompt, temperature=0.3)
+        json_text = None
+
+        try:
+            async for chunk in stream:
+                json_text = scanner.feed(chunk)
+                if json_text is not None:
+                    # Anything after the object is commentary we don't need
+                    break
+        except NotImplementedError:
+            response = await self.think(prompt, temperature=0.3)
+            return response.content, _extract_json_object(response.content)
+        finally:
+            await stream.aclose()
+
+        return scanner.text, json_text
+
+    async def _analysis_result(
+        self,
+        build_id: int,
+        analysis_result: dict[str, Any],
+        is_intermittent: Optional[bool] = None,
+        failure_type: Optional[str] = None,
+        source: str = "llm",
+    ) -> dict[str, Any]:
+        """Build the analysis task result and record it."""
+        if is_intermittent is None:
+            is_intermittent = analysis_result.get("is_intermittent", False)
+        if failure_type is None:
+            failure_type = analysis_result.get("failure_type", "unknown")
+
         result = {
             "success": True,
             "build_id": build_id,
@@ -199,7 +622,8 @@ Be specific and actionable. Focus on:
         }
 
         await self.record_result(
-            f"Analyzed build {build_id}: type={failure_type}, intermittent={is_intermittent}"
+            f"Analyzed build {build_id}: type={failure_type}, intermittent={is_intermittent}",
+            metadata={"source": source},
         )
 
         return result
@@ -208,12 +632,13 @@ Be specific and actionable. Focus on:
         """Retry a build."""
         build_id = task.get("build_id")
 
-        if build_id not in self.monitored_builds:
+        index = self._build_index.get(build_id)
+        if index is None:
             return {"success": False, "error": "Build not being monitored"}
 
-        build_info = self.monitored_builds[build_id]
+        retry_count = self._build_retry_count[index]
 
-        if build_info["retry_count"] >= settings.max_retries:
+        if retry_count >= settings.max_retries:
             await self.decide(f"Max retries reached for build {build_id}, escalating")
             return {
                 "success": False,
@@ -222,12 +647,13 @@ Be specific and actionable. Focus on:
             }
 
         # Get original build
-        original_build = self.ado_client.get_build(build_id)
+        original_build = await self._ado_call(self.ado_client.get_build, build_id)
         if not original_build:
             return {"success": False, "error": "Original build not found"}
 
         # Queue new build
-        new_build = self.ado_client.queue_build(
+        new_build = await self._ado_call(
+            self.ado_client.queue_build,
             definition_name=original_build["definition"],
             branch=original_build["source_branch"].replace("refs/heads/", ""),
         )
@@ -235,30 +661,31 @@ Be specific and actionable. Focus on:
         if not new_build:
             return {"success": False, "error": "Failed to queue retry build"}
 
-        # Update tracking
-        build_info["retry_count"] += 1
-        self.monitored_builds[new_build["id"]] = build_info
+        # Update tracking; the retry continues the original build's chain
+        retry_count += 1
+        self._set_retry_count(index, retry_count)
+        self._track_build(
+            new_build["id"],
+            self._build_pr_ids[index],
+            self._build_status[index],
+            retry_count,
+        )
 
         await self.record_action(
-            f"Retried build {build_id} as {new_build['id']} (attempt {build_info['retry_count']})"
+            f"Retried build {build_id} as {new_build['id']} (attempt {retry_count})"
         )
 
         return {
             "success": True,
             "original_build_id": build_id,
             "new_build_id": new_build["id"],
-            "retry_count": build_info["retry_count"],
+            "retry_count": retry_count,
         }
 
     def get_build_statistics(self) -> dict[str, Any]:
         """Get statistics about monitored builds."""
-        total = len(self.monitored_builds)
-        retries = sum(1 for b in self.monitored_builds.values() if b["retry_count"] > 0)
-
         return {
-            "total_monitored": total,
-            "builds_retried": retries,
-            "active_monitors": sum(
-                1 for b in self.monitored_builds.values() if b["status"] == "inProgress"
-            ),
+            "total_monitored": len(self._build_ids),
+            "builds_retried": self._retried_builds,
+            "active_monitors": self._active_builds,
         }
@@ -1,31 +1,30 @@
 """Code Repository Agent - manages code changes for a specific repository."""
 
 import asyncio
-import subprocess
+import os
+import re
+import sys
+from collections import deque
+from itertools import islice
 from pathlib import Path
-from typing import Any, Optional
-
-from git import Repo
+from typing import TYPE_CHECKING, Any, Optional
 
+from sdlc_agents._repo_scan import scan as _scan_repo
 from sdlc_agents.agents.base import Agent, AgentCapability
 from sdlc_agents.config import settings
 from sdlc_agents.integrations import ADOClient
 from sdlc_agents.logging_config import logger
 
+if TYPE_CHECKING:
+    from git import Repo
 
-class CodeRepositoryAgent(Agent):
-    """Agent responsible for a specific code repository."""
+# Maven output lines worth handing to _fix_build, matched on raw bytes
+_ERROR_RE = re.compile(rb"^(?:\[ERROR\]|.*BUILD FAILURE).*$", re.MULTILINE)
+_MAX_ERROR_LINES = 200
+_MAX_ERROR_LINE_LEN = 512
 
-    def __init__(self, repo_name: str, repo_url: str, repo_path: Optional[Path] = None):
-        """
-        Initialize code repository agent.
-
-        Args:
-            repo_name: Repository name
-            repo_url: Git repository URL
-            repo_path: Local path to repository
-        """
-        system_prompt = f"""You are a Code Repository Agent for the '{repo_name}' repository.
+# Only the repository name varies between code agents
+_SYSTEM_PROMPT_TMPL = """You are a Code Repository Agent for the '{repo_name}' repository.
 
 Your responsibilities:
 1. Understand the repository structure and codebase
@@ -49,6 +48,76 @@ When implementing changes:
 
 You are an expert Java developer with strong Maven and testing skills."""
 
+
+def _read_tail(path: Path, limit: int = 65536) -> str:
+    """
+    Read the end of a log file.
+
+    Args:
+        path: Log file
+        limit: Maximum number of bytes to read
+
+    Returns:
+        Decoded tail of the file
+    """
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        f.seek(max(f.tell() - limit, 0))
+        return f.read().decode(errors="replace")
+
+
+async def _tee_build_output(
+    stream: asyncio.StreamReader, log_file: Any, errors: deque[bytes]
+) -> None:
+    """
+    Copy build output to a log file, keeping only error lines in memory.
+
+    Args:
+        stream: Process stdout
+        log_file: Binary file the full output is written to
+        errors: Bounded deque receiving matching lines
+    """
+    pending = b""
+    while chunk := await stream.read(65536):
+        log_file.write(chunk)
+        pending += chunk
+        end = pending.rfind(b"\n") + 1
+        if end:
+            errors.extend(
+                m.group().rstrip(b"\r")[:_MAX_ERROR_LINE_LEN]
+                for m in _ERROR_RE.finditer(pending, 0, end)
+            )
+            pending = pending[end:]
+
+    if pending:
+        errors.extend(m.group()[:_MAX_ERROR_LINE_LEN] for m in _ERROR_RE.finditer(pending))
+
+
+class CodeRepositoryAgent(Agent):
+    """Agent responsible for a specific code repository."""
+
+    __slots__ = (
+        "repo_name",
+        "repo_url",
+        "repo_path",
+        "repo",
+        "ado_client",
+        "_structure_cache",
+        "_repo_lock",
+    )
+
+    def __init__(self, repo_name: str, repo_url: str, repo_path: Optional[Path] = None):
+        """
+        Initialize code repository agent.
+
+        Args:
+            repo_name: Repository name
+            repo_url: Git repository URL
+            repo_path: Local path to repository
+        """
+        # Interned so agents created for the same repository share one prompt string
+        system_prompt = sys.intern(_SYSTEM_PROMPT_TMPL.format(repo_name=repo_name))
+
         super().__init__(
             agent_id=f"code_repo_{repo_name}",
             name=f"Code Agent ({repo_name})",
@@ -64,8 +133,12 @@ You are an expert Java developer with strong Maven and testing skills."""
         self.repo_name = repo_name
         self.repo_url = repo_url
         self.repo_path = repo_path or settings.repos_dir / repo_name
-        self.repo: Optional[Repo] = None
-        self.ado_client = ADOClient()
+        self.repo: Optional["Repo"] = None
+        self.ado_client = ADOClient.get_default()
+        # (HEAD sha, structure summary) from the last codebase scan
+        self._structure_cache: Optional[tuple[str, str]] = None
+        # Serializes tasks on this working tree (branch checkouts, builds, commits)
+        self._repo_lock = asyncio.Lock()
 
     async def initialize_repo(self) -> bool:
         """
@@ -73,11 +146,15 @@ You are an expert Java developer with strong Maven and testing skills."""
 
         If repo_path was provided during initialization (from local_path config),
         it will use that existing checkout. Otherwise, it will clone to the default location.
+        Git calls run in a worker thread so other agents keep progressing meanwhile.
         """
+        # GitPython is slow to import and only needed once a repository is opened
+        from git import Repo
+
         try:
             if self.repo_path.exists():
                 # Repository exists (either provided local_path or previously cloned)
-                self.repo = Repo(self.repo_path)
+                self.repo = await asyncio.to_thread(Repo, self.repo_path)
                 await self.observe(f"Opened existing repository at {self.repo_path}")
 
                 # Only pull if this wasn't explicitly configured as a local path
@@ -88,7 +165,7 @@ You are an expert Java developer with strong Maven and testing skills."""
                 if not is_explicit_local:
                     # This is a managed clone, safe to pull
                     origin = self.repo.remotes.origin
-                    origin.pull()
+                    await asyncio.to_thread(origin.pull)
                     logger.info(f"Pulled latest changes for {self.repo_name}")
                 else:
                     # This is a local checkout configured in repositories.yaml
@@ -99,19 +176,25 @@ You are an expert Java developer with strong Maven and testing skills."""
             else:
                 # Clone repository to default location
                 await self.observe(f"Cloning repository from {self.repo_url}")
-                self.repo = Repo.clone_from(self.repo_url, self.repo_path)
+                self.repo = await asyncio.to_thread(Repo.clone_from, self.repo_url, self.repo_path)
                 logger.info(f"Cloned repository to {self.repo_path}")
 
             # Configure git
-            with self.repo.config_writer() as config:
-                config.set_value("user", "name", settings.git_user_name)
-                config.set_value("user", "email", settings.git_user_email)
+            await asyncio.to_thread(self._configure_git)
 
             return True
         except Exception as e:
             logger.error(f"Failed to initialize repository {self.repo_name}: {e}")
             return False
 
+    def _configure_git(self) -> None:
+        """Set the commit identity and working-tree caches in the repository config."""
+        with self.repo.config_writer() as config:
+            config.set_value("user", "name", settings.git_user_name)
+            config.set_value("user", "email", settings.git_user_email)
+            # Lets `git add -A` skip unchanged directories when looking for new files
+            config.set_value("core", "untrackedCache", "true")
+
     async def process_task(self, task: dict[str, Any]) -> dict[str, Any]:
         """
         Process a code implementation task.
@@ -124,16 +207,17 @@ You are an expert Java developer with strong Maven and testing skills."""
         """
         task_type = task.get("type")
 
-        if not self.repo:
-            if not await self.initialize_repo():
-                return {"success": False, "error": "Failed to initialize repository"}
+        async with self._repo_lock:
+            if not self.repo:
+                if not await self.initialize_repo():
+                    return {"success": False, "error": "Failed to initialize repository"}
 
-        if task_type == "implement":
-            return await self._implement_changes(task)
-        elif task_type == "fix_build":
-            return await self._fix_build(task)
-        else:
-            return {"success": False, "error": f"Unknown task type: {task_type}"}
+            if task_type == "implement":
+                return await self._implement_changes(task)
+            elif task_type == "fix_build":
+                return await self._fix_build(task)
+            else:
+                return {"success": False, "error": f"Unknown task type: {task_type}"}
 
     async def _implement_changes(self, task: dict[str, Any]) -> dict[str, Any]:
         """Implement code changes for a work item."""
@@ -221,14 +305,21 @@ do NOT proceed with assumptions - clearly state the issues and ask for clarifica
 
     async def _fix_build(self, task: dict[str, Any]) -> dict[str, Any]:
         """Fix build failures."""
-        build_errors = task.get("build_errors", [])
+        # Either explicit errors or the error lines collected from a failed local build
+        build_errors = task.get("build_errors") or task.get("build", {}).get("errors", [])
 
         await self.observe(f"Fixing build errors: {len(build_errors)} errors")
 
+        # Joined once per task; retries of the same task reuse it. islice also
+        # accepts the bounded deque the build log scanner produces.
+        errors_text = task.get("_errors_text")
+        if errors_text is None:
+            errors_text = task["_errors_text"] = "\n".join(islice(build_errors, 10))
+
         fix_prompt = f"""Analyze these build errors and suggest fixes:
 
 **Errors:**
-{chr(10).join(build_errors[:10])}
+{errors_text}
 
 **Repository:** {self.repo_name}
 
@@ -257,41 +348,56 @@ Focus on compilation errors, test failures, and dependency issues."""
         if not self.repo_path.exists():
             return "Repository not initialized"
 
+        # The tree only changes with HEAD, so reuse the last scan for the same commit
+        head_sha = self.repo.head.commit.hexsha if self.repo else None
+        if head_sha and self._structure_cache and self._structure_cache[0] == head_sha:
+            return self._structure_cache[1]
+
         # Find key files
         structure = []
         structure.append(f"Repository: {self.repo_name}")
         structure.append(f"Path: {self.repo_path}")
 
-        # Find pom.xml
-        pom_files = list(self.repo_path.rglob("pom.xml"))
+        pom_files, src_dirs, test_dirs = await asyncio.to_thread(_scan_repo, self.repo_path)
         if pom_files:
-            structure.append(f"\nMaven projects: {len(pom_files)}")
-
-        # Find source directories
-        src_dirs = list(self.repo_path.rglob("src/main/java"))
+            structure.append(f"\nMaven projects: {pom_files}")
         if src_dirs:
-            structure.append(f"Source directories: {len(src_dirs)}")
-
-        # Find test directories
-        test_dirs = list(self.repo_path.rglob("src/test/java"))
+            structure.append(f"Source directories: {src_dirs}")
         if test_dirs:
-            structure.append(f"Test directories: {len(test_dirs)}")
+            structure.append(f"Test directories: {test_dirs}")
 
-        return "\n".join(structure)
+        summary = "\n".join(structure)
+        if head_sha:
+            self._structure_cache = (head_sha, summary)
+        return summary
 
     async def _create_branch(self, branch_name: str) -> None:
-        """Create a new Git branch."""
+        """
+        Create a new Git branch, or check out the existing one.
+
+        Branch names derive from the work item, so re-running a story finds its
+        branch from the previous run; it is reused rather than reset, keeping any
+        commits made on it.
+        """
         if not self.repo:
             raise RuntimeError("Repository not initialized")
 
-        # Ensure we're on main and up to date
-        main_branch = self.repo.heads.main
-        main_branch.checkout()
-        self.repo.remotes.origin.pull()
+        existing = await asyncio.to_thread(
+            self.repo.git.rev_parse,
+            "--verify",
+            "--quiet",
+            f"refs/heads/{branch_name}",
+            with_exceptions=False,
+        )
+        if existing:
+            await asyncio.to_thread(self.repo.git.checkout, branch_name)
+            logger.info(f"Checked out existing branch: {branch_name}")
+            return
 
-        # Create new branch
-        new_branch = self.repo.create_head(branch_name)
-        new_branch.checkout()
+        # Branch from the latest remote main: one fetch plus one checkout, instead of
+        # checking out and pulling local main before creating the branch
+        await asyncio.to_thread(self.repo.remotes.origin.fetch, "main")
+        await asyncio.to_thread(self.repo.git.checkout, "-b", branch_name, "origin/main")
 
         logger.info(f"Created and checked out branch: {branch_name}")
 
@@ -299,28 +405,56 @@ Focus on compilation errors, test failures, and dependency issues."""
         """Run Maven build and tests."""
         await self.observe("Running Maven build with tests")
 
-        try:
-            # Run mvn clean test
-            process = await asyncio.create_subprocess_exec(
-                "mvn",
-                "clean",
-                "test",
-                cwd=self.repo_path,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
+        log_dir = settings.workspace_dir / "build-logs"
+        log_dir.mkdir(parents=True, exist_ok=True)
+        stdout_path = log_dir / f"{self.repo_name}.stdout.log"
+        stderr_path = log_dir / f"{self.repo_name}.stderr.log"
 
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(), timeout=settings.build_timeout
-            )
+        errors: deque[bytes] = deque(maxlen=_MAX_ERROR_LINES)
+
+        try:
+            mvn = str(settings.maven_home / "bin" / "mvn") if settings.maven_home else "mvn"
+
+            # Run mvn clean test; stdout is scanned for errors as it is copied to disk.
+            # Parallel reactor, no download progress lines, and a capped, tuned JVM.
+            with open(stdout_path, "wb") as stdout_file, open(stderr_path, "wb") as stderr_file:
+                process = await asyncio.create_subprocess_exec(
+                    mvn,
+                    "-T",
+                    settings.maven_thread_factor,
+                    "-ntp",
+                    "clean",
+                    "test",
+                    cwd=self.repo_path,
+                    env={**os.environ, "MAVEN_OPTS": settings.maven_opts},
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=stderr_file,
+                )
+
+                try:
+                    await asyncio.wait_for(
+                        asyncio.gather(
+                            _tee_build_output(process.stdout, stdout_file, errors),
+                            process.wait(),
+                        ),
+                        timeout=settings.build_timeout,
+                    )
+                except asyncio.TimeoutError:
+                    # Kill and reap right away so the JVM and its pipe don't linger
+                    process.kill()
+                    await process.wait()
+                    raise
 
             success = process.returncode == 0
 
             result = {
                 "success": success,
                 "exit_code": process.returncode,
-                "stdout": stdout.decode() if stdout else "",
-                "stderr": stderr.decode() if stderr else "",
+                "errors": [line.decode(errors="replace") for line in errors],
+                "stdout": _read_tail(stdout_path),
+                "stderr": _read_tail(stderr_path),
+                "stdout_path": str(stdout_path),
+                "stderr_path": str(stderr_path),
             }
 
             if success:
@@ -334,6 +468,9 @@ Focus on compilation errors, test failures, and dependency issues."""
             return {
                 "success": False,
                 "error": "Build timed out",
+                "errors": [line.decode(errors="replace") for line in errors],
+                "stdout_path": str(stdout_path),
+                "stderr_path": str(stderr_path),
             }
         except Exception as e:
             logger.error(f"Maven build failed: {e}")
@@ -342,16 +479,57 @@ Focus on compilation errors, test failures, and dependency issues."""
                 "error": str(e),
             }
 
+    def read_blob(self, rev: str, path: str) -> bytes:
+        """
+        Read a file's contents at a given revision.
+
+        Reads go through GitPython's persistent ``git cat-file --batch`` process, so
+        repeated lookups while diffing or fixing builds don't spawn git per blob.
+
+        Args:
+            rev: Commit, branch or tag to read from
+            path: File path relative to the repository root
+
+        Returns:
+            Raw file contents
+        """
+        if not self.repo:
+            raise RuntimeError("Repository not initialized")
+
+        _, _, _, data = self.repo.git.get_object_data(f"{rev}:{path}")
+        return data
+
+    @staticmethod
+    def _commit_env() -> dict[str, str]:
+        """Environment giving `git commit` the agent's author and committer identity."""
+        return {
+            "GIT_AUTHOR_NAME": settings.git_user_name,
+            "GIT_AUTHOR_EMAIL": settings.git_user_email,
+            "GIT_COMMITTER_NAME": settings.git_user_name,
+            "GIT_COMMITTER_EMAIL": settings.git_user_email,
+        }
+
     async def _commit_changes(self, message: str) -> None:
         """Commit all changes."""
         if not self.repo:
             raise RuntimeError("Repository not initialized")
 
-        # Add all changes
-        self.repo.git.add(A=True)
+        # Add all changes; git reuses the index stat cache, so clean files aren't rehashed
+        await asyncio.to_thread(self.repo.git.add, A=True)
 
-        # Commit
-        self.repo.index.commit(message)
+        # `git commit` refuses an empty commit, so skip it when nothing was staged
+        staged = await asyncio.to_thread(
+            self.repo.is_dirty, index=True, working_tree=False, untracked_files=False
+        )
+        if not staged:
+            logger.info("No changes to commit")
+            return
+
+        # Commit with git itself rather than re-parsing the index in Python. The
+        # identity is passed explicitly so hosts without user.name/user.email work too
+        await asyncio.to_thread(
+            self.repo.git.commit, "-q", "-m", message, env=self._commit_env()
+        )
 
         logger.info(f"Committed changes: {message[:50]}")
         await self.record_action(f"Committed: {message}")
@@ -369,7 +547,7 @@ Focus on compilation errors, test failures, and dependency issues."""
 
         # Push branch to remote
         origin = self.repo.remotes.origin
-        origin.push(branch_name)
+        await asyncio.to_thread(origin.push, branch_name)
 
         logger.info(f"Pushed branch {branch_name} to remote")
 
@@ -389,3 +567,9 @@ Focus on compilation errors, test failures, and dependency issues."""
             await self.record_result(f"Created PR: {pr['id']}")
 
         return pr
+
+    async def cleanup(self) -> None:
+        """Cleanup resources, including persistent git processes."""
+        if self.repo:
+            self.repo.close()
+        await super().cleanup()
@@ -4,6 +4,7 @@ import asyncio
 from typing import Any, Optional
 
 from sdlc_agents.agents.base import Agent, AgentCapability
+from sdlc_agents.config import settings
 from sdlc_agents.integrations import ADOClient
 from sdlc_agents.logging_config import logger
 
@@ -11,6 +12,8 @@ from sdlc_agents.logging_config import logger
 class OrchestratorAgent(Agent):
     """Main orchestrator that coordinates all specialized agents."""
 
+    __slots__ = ("ado_client", "active_agents", "_build_sema")
+
     def __init__(self):
         """Initialize the orchestrator agent."""
         system_prompt = """You are the Orchestrator Agent for an automated SDLC system.
@@ -84,8 +87,10 @@ Be decisive, practical, and focused on delivering working software. However, nev
             system_prompt=system_prompt,
         )
 
-        self.ado_client = ADOClient()
+        self.ado_client = ADOClient.get_default()
         self.active_agents: dict[str, Agent] = {}
+        # Bounds concurrent Maven builds when fanning out across repositories
+        self._build_sema = asyncio.Semaphore(settings.max_parallel_builds)
 
     def register_agent(self, agent: Agent) -> None:
         """Register a specialized agent."""
@@ -130,6 +135,11 @@ Be decisive, practical, and focused on delivering working software. However, nev
         if not work_item:
             return {"success": False, "error": f"Story {story_id} not found"}
 
+        # Prefetch child tasks in one batch so delegated agents don't re-query them
+        child_ids = work_item.get("child_ids")
+        if child_ids:
+            work_item["children"] = list(self.ado_client.get_work_items_batch(child_ids).values())
+
         # Ask LLM to analyze requirements and determine affected components
         analysis_prompt = f"""Analyze this story and determine implementation approach:
 
@@ -145,7 +155,7 @@ Determine:
 
 Provide a structured implementation plan."""
 
-        response = await self.think(analysis_prompt)
+        response = await self.think(analysis_prompt, cache=True)
         await self.record_action(f"Analyzed story {story_id}: {response.content[:200]}")
 
         # Get requirements agent to create detailed tasks
@@ -156,18 +166,27 @@ Provide a structured implementation plan."""
                 "work_item": work_item,
             })
 
-            # Delegate to code agents for each affected repository
+            # Delegate to code agents for each affected repository in parallel
+            code_task = {
+                "type": "implement",
+                "work_item": work_item,
+                "requirements": req_result.get("requirements"),
+            }
+            code_agents = [
+                self.active_agents[f"code_repo_{repo}"]
+                for repo in req_result.get("affected_repos", [])
+                if f"code_repo_{repo}" in self.active_agents
+            ]
+            results = await asyncio.gather(
+                *(self._run_code_task(agent, code_task) for agent in code_agents),
+                return_exceptions=True,
+            )
             code_results = []
-            for repo in req_result.get("affected_repos", []):
-                agent_id = f"code_repo_{repo}"
-                if agent_id in self.active_agents:
-                    code_agent = self.active_agents[agent_id]
-                    result = await code_agent.process_task({
-                        "type": "implement",
-                        "work_item": work_item,
-                        "requirements": req_result.get("requirements"),
-                    })
-                    code_results.append(result)
+            for agent, result in zip(code_agents, results):
+                if isinstance(result, Exception):
+                    logger.error(f"{agent.name} failed: {result}")
+                    result = {"success": False, "error": str(result)}
+                code_results.append(result)
 
             return {
                 "success": True,
@@ -183,13 +202,18 @@ Provide a structured implementation plan."""
             "analysis": response.content,
         }
 
+    async def _run_code_task(self, agent: Agent, task: dict[str, Any]) -> dict[str, Any]:
+        """Run a code agent task, bounded by the parallel build limit."""
+        async with self._build_sema:
+            return await agent.process_task(task)
+
     async def _split_feature(self, task: dict[str, Any]) -> dict[str, Any]:
         """Split a feature into stories."""
         feature_id = task.get("feature_id")
         story_count = task.get("story_count", 3)
 
         # Get feature details
-        feature = self.ado_client.get_work_item(feature_id)
+        feature = self.ado_client.get_work_item(feature_id, fields=ADOClient.SUMMARY_FIELDS)
         if not feature:
             return {"success": False, "error": f"Feature {feature_id} not found"}
 
@@ -207,10 +231,10 @@ Provide:
 
 Format as a structured list."""
 
-        response = await self.think(split_prompt)
+        response = await self.think(split_prompt, cache=True)
 
         # Create stories in ADO
-        stories = self.ado_client.split_feature_into_stories(feature_id, story_count)
+        stories = await self.ado_client.split_feature_into_stories(feature_id, story_count)
 
         # Update story descriptions based on LLM suggestions
         # (In a real implementation, parse the LLM response and update each story)
@@ -1,15 +1,82 @@
 """Release Manager Agent - handles release creation and management."""
 
-from typing import Any, Optional
+import asyncio
+import functools
+from datetime import date
+from textwrap import dedent
+from typing import TYPE_CHECKING, Any, Optional
 
 from sdlc_agents.agents.base import Agent, AgentCapability
 from sdlc_agents.integrations import ADOClient
 from sdlc_agents.logging_config import logger
 
+if TYPE_CHECKING:
+    import jinja2
+
+# Known header lines are rendered here rather than by the model; the date is left
+# out of the prompt so it (and its cached response) stays date-independent
+_NOTES_HEADER = dedent("""\
+    # Release Notes
+
+    **Release Date**: {release_date}
+    **Components**: {components}
+    **Source Branch**: {source_branch}
+
+    """)
+
+# Formatting rules live in the system prompt
+_NOTES_TEMPLATE = dedent("""\
+    Generate release notes for components {{ components | join(', ') }} from branch
+    {{ source_branch }}. The title, date, components and branch header is added
+    separately, so start directly with the first section below and use this EXACT
+    markdown format:
+
+    ## 🎉 New Features
+    - [Feature name](work-item-link): Brief description of what was added
+    - [Another feature](work-item-link): Brief description
+
+    ## 🐛 Bug Fixes
+    - [Bug name](work-item-link): Brief description of what was fixed
+    - [Another bug](work-item-link): Brief description
+
+    ## 🔧 Improvements
+    - [Improvement](work-item-link): Brief description of enhancement
+    - [Another improvement](work-item-link): Brief description
+
+    ## ⚠️ Breaking Changes
+    - [Breaking change](work-item-link): Description and migration guide
+    - If no breaking changes, write "None"
+
+    ## 📝 Known Issues
+    - [Issue description]: Workaround if available
+    - If no known issues, write "None"
+
+    ## 📦 Deployment Notes
+    - Any special deployment steps or configuration changes required
+    - If none, write "Standard deployment process"
+
+    In a real scenario, we would provide:
+    - List of merged PRs since last release
+    - Closed work items with details
+    - Full commit history
+    - Test coverage changes
+
+    For this demonstration, generate sample items that follow the format above.""")
+
+
+@functools.cache
+def _notes_template() -> "jinja2.Template":
+    """Compile the release-notes template on first use, importing jinja2 lazily."""
+    import jinja2
+
+    return jinja2.Template(_NOTES_TEMPLATE, autoescape=False)
+
 
 class ReleaseManagerAgent(Agent):
     """Agent responsible for creating and managing releases."""
 
+    __slots__ = ("ado_client",)
+
     def __init__(self):
         """Initialize the release manager agent."""
         system_prompt = """You are the Release Manager Agent for an automated SDLC system.
@@ -30,6 +97,13 @@ When creating a release:
 - Ensure dependencies are compatible
 - Document breaking changes
 
+When writing release notes:
+- Use the exact format requested, with proper markdown headings and emoji
+- Each item should be a bullet point starting with a dash (-)
+- Include work item links in square brackets when applicable
+- Keep descriptions brief (1-2 sentences maximum)
+- If a section has no items, write "None" instead of omitting the section
+
 Be thorough, cautious, and ensure release quality."""
 
         super().__init__(
@@ -43,7 +117,7 @@ Be thorough, cautious, and ensure release quality."""
             system_prompt=system_prompt,
         )
 
-        self.ado_client = ADOClient()
+        self.ado_client = ADOClient.get_default()
 
     async def process_task(self, task: dict[str, Any]) -> dict[str, Any]:
         """
@@ -74,8 +148,8 @@ Be thorough, cautious, and ensure release quality."""
 
         if not release_name:
             # Generate release name
-            from datetime import datetime
-            release_name = f"Release-{datetime.now().strftime('%Y.%m.%d')}"
+            today = date.today()
+            release_name = f"Release-{today.year}.{today.month:02d}.{today.day:02d}"
 
         await self.observe(f"Creating release: {release_name}")
 
@@ -140,30 +214,15 @@ Be thorough, cautious, and ensure release quality."""
 
         await self.observe(f"Verifying release readiness for {len(components)} components")
 
-        readiness_checks = []
+        # Latest completed build of every component in one batched query, off the loop
+        latest_builds = await asyncio.to_thread(
+            self.ado_client.get_latest_builds, components, source_branch
+        )
 
-        for component in components:
-            # In real implementation:
-            # 1. Check if builds are passing
-            # 2. Check if all PRs are merged
-            # 3. Check if tests are passing
-            # 4. Check for open critical bugs
-
-            # Simulate checks
-            component_ready = True
-            issues = []
-
-            # Check builds (simulated)
-            build_status = "succeeded"  # Would call ADO API
-            if build_status != "succeeded":
-                component_ready = False
-                issues.append(f"Build not passing: {build_status}")
-
-            readiness_checks.append({
-                "component": component,
-                "ready": component_ready,
-                "issues": issues,
-            })
+        readiness_checks = [
+            self._check_component(component, source_branch, latest_builds.get(component))
+            for component in components
+        ]
 
         all_ready = all(check["ready"] for check in readiness_checks)
 
@@ -179,6 +238,40 @@ Be thorough, cautious, and ensure release quality."""
 
         return result
 
+    def _check_component(
+        self, component: str, source_branch: str, build: Optional[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """
+        Check whether a single component is ready for release.
+
+        Args:
+            component: Component name
+            source_branch: Branch the release is cut from
+            build: Latest completed build of the component, if any
+
+        Returns:
+            Readiness check result
+        """
+        # In real implementation, also:
+        # 1. Check if all PRs are merged
+        # 2. Check if tests are passing
+        # 3. Check for open critical bugs
+        component_ready = True
+        issues = []
+
+        if build is None:
+            component_ready = False
+            issues.append(f"No completed build on {source_branch}")
+        elif build["result"] != "succeeded":
+            component_ready = False
+            issues.append(f"Build not passing: {build['result']}")
+
+        return {
+            "component": component,
+            "ready": component_ready,
+            "issues": issues,
+        }
+
     async def _generate_release_notes(self, task: dict[str, Any]) -> dict[str, Any]:
         """Generate release notes."""
         components = task.get("components", [])
@@ -191,62 +284,22 @@ Be thorough, cautious, and ensure release quality."""
         # 2. Get all closed work items
         # 3. Categorize changes (features, bugs, breaking changes)
 
-        # Use LLM to generate notes
-        from datetime import datetime
-        release_date = datetime.now().strftime('%Y-%m-%d')
-
-        notes_prompt = f"""Generate release notes in the following EXACT markdown format:
-
-# Release Notes
-
-**Release Date**: {release_date}
-**Components**: {', '.join(components)}
-**Source Branch**: {source_branch}
-
-## 🎉 New Features
-- [Feature name](work-item-link): Brief description of what was added
-- [Another feature](work-item-link): Brief description
+        # Use LLM to generate the sections
+        release_date = date.today().isoformat()
 
-## 🐛 Bug Fixes
-- [Bug name](work-item-link): Brief description of what was fixed
-- [Another bug](work-item-link): Brief description
+        notes_prompt = _notes_template().render(components=components, source_branch=source_branch)
 
-## 🔧 Improvements
-- [Improvement](work-item-link): Brief description of enhancement
-- [Another improvement](work-item-link): Brief description
-
-## ⚠️ Breaking Changes
-- [Breaking change](work-item-link): Description and migration guide
-- If no breaking changes, write "None"
-
-## 📝 Known Issues
-- [Issue description]: Workaround if available
-- If no known issues, write "None"
-
-## 📦 Deployment Notes
-- Any special deployment steps or configuration changes required
-- If none, write "Standard deployment process"
-
-**IMPORTANT**:
-- Use the exact format above with proper markdown headings and emoji
-- Each item should be a bullet point starting with a dash (-)
-- Include work item links in square brackets when applicable
-- Keep descriptions brief (1-2 sentences maximum)
-- If a section has no items, write "None" instead of omitting the section
-
-In a real scenario, we would provide:
-- List of merged PRs since last release
-- Closed work items with details
-- Full commit history
-- Test coverage changes
-
-For this demonstration, generate sample items that follow the format above."""
-
-        response = await self.think(notes_prompt)
+        response = await self.think(notes_prompt, cache=True)
 
         await self.record_result("Generated release notes")
 
+        header = _NOTES_HEADER.format(
+            release_date=release_date,
+            components=", ".join(components),
+            source_branch=source_branch,
+        )
+
         return {
             "success": True,
-            "notes": response.content,
+            "notes": header + response.content.lstrip(),
         }
@@ -1,15 +1,117 @@
 """Requirements Agent - analyzes and interprets requirements from ADO."""
 
-from typing import Any
+import re
+from typing import Any, Optional
 
 from sdlc_agents.agents.base import Agent, AgentCapability
 from sdlc_agents.integrations import ADOClient
 from sdlc_agents.logging_config import logger
 
+_REPO_KEYWORDS = ("backend", "frontend", "api", "web", "mobile", "shared")
+_COMPLEXITY_INDICATORS = (
+    "complex",
+    "difficult",
+    "multiple",
+    "integration",
+    "migration",
+    "refactor",
+)
+
+
+def _keyword_pattern(keywords: tuple[str, ...]) -> re.Pattern[str]:
+    """
+    Compile keywords into one pattern matching any of them in a single pass.
+
+    The alternation sits in a lookahead so overlapping occurrences are all found,
+    matching the semantics of one substring check per keyword.
+    """
+    return re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))")
+
+
+_REPO_KEYWORD_RE = _keyword_pattern(_REPO_KEYWORDS)
+_COMPLEXITY_RE = _keyword_pattern(_COMPLEXITY_INDICATORS)
+
+# Distinct indicators at which complexity tops out; the scan stops there
+_MAX_COMPLEXITY_INDICATORS = 3
+
+# Requirements analysis prompt; only the work item fields vary per call
+_ANALYSIS_PROMPT = """Analyze these requirements in detail:
+
+**Type:** {type}
+**Title:** {title}
+**Description:**
+{description}
+
+**Acceptance Criteria:**
+{acceptance_criteria}
+
+**Tags:** {tags}
+
+Provide:
+1. **Technical Requirements**: Specific implementation details needed
+2. **Affected Components**: Which repositories/modules need changes
+3. **Data Model Changes**: New or modified entities
+4. **API Changes**: New or modified endpoints
+5. **UI Changes**: Frontend modifications needed
+6. **Test Scenarios**: How to verify the implementation
+7. **Ambiguities**: Unclear points that need clarification
+8. **Assumptions Made**: Explicitly list ALL assumptions you're making due to missing information
+9. **Missing Information**: What critical details are not provided that should be clarified
+10. **Risks**: Potential implementation challenges
+
+**Critical Instructions:**
+- For ANY missing information, explicitly list what assumptions you're making
+- Do NOT make silent assumptions - document every assumption clearly
+- If acceptance criteria are incomplete, specify exactly what's missing
+- Highlight any edge cases not covered by the requirements
+
+Be specific and actionable. When information is incomplete, explicitly state what clarifications are needed before implementation can proceed safely."""
+
+_CLARIFICATION_PROMPT = """Based on this work item, generate clarifying questions:
+
+**Title:** {title}
+**Description:** {description}
+
+**Identified Ambiguities:**
+{ambiguities}
+
+Generate specific questions that would help resolve these ambiguities.
+Focus on technical details needed for implementation."""
+
+# Entity labels that can name a component in an analysis
+_REPO_ENTITY_LABELS = frozenset({"ORG", "PRODUCT"})
+
+# Loaded spaCy pipeline; False once loading failed so it isn't retried
+_nlp: Any = None
+
+
+def _get_nlp() -> Any:
+    """
+    Get the shared spaCy pipeline, loading it on first use.
+
+    spaCy is an optional dependency (the ``nlp`` extra). Only the NER component
+    is kept, the parser and lemmatizer are disabled to save memory and time.
+
+    Returns:
+        spaCy pipeline, or None if spaCy or its English model is unavailable
+    """
+    global _nlp
+    if _nlp is None:
+        try:
+            import spacy
+
+            _nlp = spacy.load("en_core_web_sm", disable=["parser", "lemmatizer"])
+        except (ImportError, OSError) as e:
+            logger.info(f"spaCy NER unavailable, using keyword matching: {e}")
+            _nlp = False
+    return _nlp or None
+
 
 class RequirementsAgent(Agent):
     """Agent specialized in analyzing and interpreting requirements."""
 
+    __slots__ = ("ado_client",)
+
     def __init__(self):
         """Initialize the requirements agent."""
         system_prompt = """You are the Requirements Agent for an automated SDLC system.
@@ -41,7 +143,7 @@ Be thorough, ask questions, and ensure nothing is overlooked."""
             system_prompt=system_prompt,
         )
 
-        self.ado_client = ADOClient()
+        self.ado_client = ADOClient.get_default()
 
     async def process_task(self, task: dict[str, Any]) -> dict[str, Any]:
         """
@@ -69,48 +171,27 @@ Be thorough, ask questions, and ensure nothing is overlooked."""
         await self.observe(f"Analyzing work item {work_item['id']}: {work_item['title']}")
 
         # Build detailed analysis prompt
-        analysis_prompt = f"""Analyze these requirements in detail:
-
-**Type:** {work_item['type']}
-**Title:** {work_item['title']}
-**Description:**
-{work_item['description']}
-
-**Acceptance Criteria:**
-{work_item.get('acceptance_criteria', 'Not specified')}
-
-**Tags:** {work_item.get('tags', 'None')}
-
-Provide:
-1. **Technical Requirements**: Specific implementation details needed
-2. **Affected Components**: Which repositories/modules need changes
-3. **Data Model Changes**: New or modified entities
-4. **API Changes**: New or modified endpoints
-5. **UI Changes**: Frontend modifications needed
-6. **Test Scenarios**: How to verify the implementation
-7. **Ambiguities**: Unclear points that need clarification
-8. **Assumptions Made**: Explicitly list ALL assumptions you're making due to missing information
-9. **Missing Information**: What critical details are not provided that should be clarified
-10. **Risks**: Potential implementation challenges
-
-**Critical Instructions:**
-- For ANY missing information, explicitly list what assumptions you're making
-- Do NOT make silent assumptions - document every assumption clearly
-- If acceptance criteria are incomplete, specify exactly what's missing
-- Highlight any edge cases not covered by the requirements
-
-Be specific and actionable. When information is incomplete, explicitly state what clarifications are needed before implementation can proceed safely."""
+        analysis_prompt = _ANALYSIS_PROMPT.format(
+            type=work_item["type"],
+            title=work_item["title"],
+            description=work_item["description"],
+            acceptance_criteria=work_item.get("acceptance_criteria", "Not specified"),
+            tags=work_item.get("tags", "None"),
+        )
 
         response = await self.think(analysis_prompt)
 
         # Parse the response to extract structured data
         # In a real implementation, use structured output or parse carefully
+        # Case-fold once and share it between both keyword scans
+        analysis_lower = response.content.casefold()
+
         requirements = {
             "work_item_id": work_item["id"],
             "title": work_item["title"],
             "analysis": response.content,
-            "affected_repos": self._extract_affected_repos(response.content),
-            "complexity": self._estimate_complexity(response.content),
+            "affected_repos": self._extract_affected_repos(response.content, analysis_lower),
+            "complexity": self._estimate_complexity(response.content, analysis_lower),
         }
 
         await self.record_result(f"Analyzed requirements for {work_item['id']}")
@@ -135,16 +216,11 @@ Be specific and actionable. When information is incomplete, explicitly state wha
         work_item = task.get("work_item")
         ambiguities = task.get("ambiguities", [])
 
-        clarification_prompt = f"""Based on this work item, generate clarifying questions:
-
-**Title:** {work_item['title']}
-**Description:** {work_item['description']}
-
-**Identified Ambiguities:**
-{chr(10).join(f'- {a}' for a in ambiguities)}
-
-Generate specific questions that would help resolve these ambiguities.
-Focus on technical details needed for implementation."""
+        clarification_prompt = _CLARIFICATION_PROMPT.format(
+            title=work_item["title"],
+            description=work_item["description"],
+            ambiguities="\n".join(f"- {a}" for a in ambiguities),
+        )
 
         response = await self.think(clarification_prompt)
 
@@ -153,53 +229,60 @@ Focus on technical details needed for implementation."""
             "questions": response.content,
         }
 
-    def _extract_affected_repos(self, analysis: str) -> list[str]:
+    def _extract_affected_repos(
+        self, analysis: str, analysis_lower: Optional[str] = None
+    ) -> list[str]:
         """
         Extract affected repositories from analysis text.
 
         Args:
             analysis: Analysis text
+            analysis_lower: Case-folded analysis, if the caller already has it
 
         Returns:
             List of repository names
         """
-        # In a real implementation, use NER or structured extraction
-        # For now, return placeholder
-        repos = []
-
-        # Simple keyword matching (improve this!)
-        keywords = ["backend", "frontend", "api", "web", "mobile", "shared"]
-        for keyword in keywords:
-            if keyword.lower() in analysis.lower():
-                repos.append(keyword)
+        # Prefer named entities when spaCy is installed: a component mentioned as an
+        # organisation or product is a stronger signal than a keyword anywhere
+        nlp = _get_nlp()
+        found: set[str] = set()
+        if nlp is not None:
+            for ent in nlp(analysis).ents:
+                if ent.label_ in _REPO_ENTITY_LABELS:
+                    found.update(m.group(1) for m in _REPO_KEYWORD_RE.finditer(ent.text.casefold()))
+
+        # Otherwise simple keyword matching, one scan for all keywords
+        if not found:
+            if analysis_lower is None:
+                analysis_lower = analysis.casefold()
+            found = {m.group(1) for m in _REPO_KEYWORD_RE.finditer(analysis_lower)}
+        repos = [keyword for keyword in _REPO_KEYWORDS if keyword in found]
 
         return repos if repos else ["main"]
 
-    def _estimate_complexity(self, analysis: str) -> str:
+    def _estimate_complexity(self, analysis: str, analysis_lower: Optional[str] = None) -> str:
         """
         Estimate implementation complexity.
 
         Args:
             analysis: Analysis text
+            analysis_lower: Case-folded analysis, if the caller already has it
 
         Returns:
             Complexity level (Low, Medium, High, Very High)
         """
-        # Simple heuristic based on length and keywords
-        complexity_indicators = [
-            "complex",
-            "difficult",
-            "multiple",
-            "integration",
-            "migration",
-            "refactor",
-        ]
-
-        indicator_count = sum(
-            1 for indicator in complexity_indicators if indicator in analysis.lower()
-        )
-
-        if indicator_count >= 3:
+        # Simple heuristic based on distinct indicator keywords, found in one scan
+        # that stops as soon as the highest level is reached
+        if analysis_lower is None:
+            analysis_lower = analysis.casefold()
+        indicators: set[str] = set()
+        for match in _COMPLEXITY_RE.finditer(analysis_lower):
+            indicators.add(match.group(1))
+            if len(indicators) >= _MAX_COMPLEXITY_INDICATORS:
+                break
+        indicator_count = len(indicators)
+
+        if indicator_count >= _MAX_COMPLEXITY_INDICATORS:
             return "Very High"
         elif indicator_count >= 2:
             return "High"
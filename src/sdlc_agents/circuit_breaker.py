@@ -0,0 +1,140 @@
+"""Circuit breaker for calls to external services."""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Optional
+
+from sdlc_agents.logging_config import logger
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a service whose circuit is open."""
+
+
+def is_outage_status(status: int) -> bool:
+    """Whether an HTTP status means the service is unavailable rather than the request bad."""
+    return status == 429 or status >= 500
+
+
+class CircuitBreaker:
+    """
+    Fail fast while an external service is down.
+
+    After ``failure_threshold`` failures within ``window_seconds`` the circuit
+    opens and calls raise CircuitOpenError without any network I/O. Once
+    ``cooldown_seconds`` have passed, a single probe call is let through
+    (half-open): success closes the circuit, failure opens it again.
+
+    Use it as a context manager (sync or async) around the call; an exception
+    leaving the block is re-raised, and counts as a failure if ``is_failure``
+    says it is one. Any other exception means the service answered, so it is
+    recorded like a success. Cancellation is not counted.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        window_seconds: float = 30.0,
+        cooldown_seconds: float = 60.0,
+        is_failure: Optional[Callable[[Exception], bool]] = None,
+    ):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            name: Service name used in errors and logs
+            failure_threshold: Failures within the window that open the circuit
+            window_seconds: Window over which failures are counted
+            cooldown_seconds: How long the circuit stays open before a probe
+            is_failure: Whether an exception means the service is down, e.g. a
+                timeout or 5xx rather than a 404; every exception by default
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.window_seconds = window_seconds
+        self.cooldown_seconds = cooldown_seconds
+        self.is_failure = is_failure
+        self._failures: deque[float] = deque()
+        self._opened_at: Optional[float] = None
+        self._probing = False
+        # Sync calls run in worker threads
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """Whether calls are currently being rejected."""
+        return self._opened_at is not None
+
+    def before_call(self) -> None:
+        """
+        Admit a call, or reject it if the circuit is open.
+
+        Raises:
+            CircuitOpenError: If the circuit is open or a probe is already running
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if self._probing or time.monotonic() - self._opened_at < self.cooldown_seconds:
+                raise CircuitOpenError(f"{self.name} circuit open, failing fast")
+            self._probing = True
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the circuit."""
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info(f"{self.name} circuit closed")
+            self._failures.clear()
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit at the threshold."""
+        with self._lock:
+            now = time.monotonic()
+            if self._opened_at is not None:
+                # Failed probe: stay open for another cooldown
+                self._opened_at = now
+                self._probing = False
+                return
+
+            self._failures.append(now)
+            while now - self._failures[0] > self.window_seconds:
+                self._failures.popleft()
+            if len(self._failures) >= self.failure_threshold:
+                self._opened_at = now
+                self._failures.clear()
+                logger.warning(
+                    f"{self.name} circuit opened after {self.failure_threshold} failures, "
+                    f"failing fast for {self.cooldown_seconds:.0f}s"
+                )
+
+    def __enter__(self) -> "CircuitBreaker":
+        """Admit the call."""
+        self.before_call()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        """Record the outcome of the call."""
+        if exc_type is None:
+            self.record_success()
+        elif issubclass(exc_type, Exception):
+            if self.is_failure is None or self.is_failure(exc):
+                self.record_failure()
+            else:
+                # Client error: the service is up, it just rejected this request
+                self.record_success()
+        else:
+            # Cancelled or interrupted: no verdict, let another probe through later
+            with self._lock:
+                self._probing = False
+
+    async def __aenter__(self) -> "CircuitBreaker":
+        """Admit the call."""
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        """Record the outcome of the call."""
+        self.__exit__(exc_type, exc, tb)
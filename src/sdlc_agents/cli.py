@@ -1,9 +1,10 @@
 """Command-line interface for SDLC agents."""
 
 import asyncio
+import re
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import click
 from rich.console import Console
@@ -12,28 +13,56 @@ from rich.panel import Panel
 from rich.prompt import Prompt
 from rich.table import Table
 
-from sdlc_agents.agents.build_monitor_agent import BuildMonitorAgent
-from sdlc_agents.agents.code_repo_agent import CodeRepositoryAgent
-from sdlc_agents.agents.orchestrator import OrchestratorAgent
-from sdlc_agents.agents.release_manager_agent import ReleaseManagerAgent
-from sdlc_agents.agents.requirements_agent import RequirementsAgent
 from sdlc_agents.config import settings
-from sdlc_agents.logging_config import logger
+from sdlc_agents.logging_config import logger, setup_logging
 from sdlc_agents.repository_config import RepositoryConfigManager, repo_config_manager
 
+if TYPE_CHECKING:
+    from sdlc_agents.agents.build_monitor_agent import BuildMonitorAgent
+    from sdlc_agents.agents.code_repo_agent import CodeRepositoryAgent
+    from sdlc_agents.agents.orchestrator import OrchestratorAgent
+    from sdlc_agents.agents.release_manager_agent import ReleaseManagerAgent
+    from sdlc_agents.agents.requirements_agent import RequirementsAgent
+
 console = Console()
 
+# Concurrent clones/pulls at startup, kept low to avoid git server throttling
+_REPO_INIT_CONCURRENCY = 8
+
+# Work item IDs in chat commands
+_DIGITS_RE = re.compile(r"\d+")
+
+# Chat command intents, recognised in a single scan; the group name is the intent
+_INTENT_RE = re.compile(
+    r"(?P<implement_story>implement (?:story|work item))"
+    r"|(?P<split_feature>split feature)"
+    r"|(?P<create_release>create (?:a )?release)",
+    re.IGNORECASE,
+)
+
+# "create release for components a, b and c from develop" -> ("a, b and c", "develop")
+_COMPONENT_RE = re.compile(
+    r"\brelease\s+(?:for\s+)?(?:components?\s+)?(.+?)(?:\s+from\s+(\S+))?\s*$",
+    re.IGNORECASE,
+)
+_COMPONENT_SPLIT_RE = re.compile(r"[,\s]+")
+_COMPONENT_STOPWORDS = frozenset({"and", "component", "components", "for", "the"})
+
+# Interactive chat control words
+_EXIT_COMMANDS = frozenset({"exit", "quit", "q"})
+_HELP_COMMANDS = frozenset({"help", "h"})
+
 
 class SDLCAgentSystem:
     """Main system coordinating all agents."""
 
     def __init__(self):
         """Initialize the agent system."""
-        self.orchestrator: Optional[OrchestratorAgent] = None
-        self.requirements_agent: Optional[RequirementsAgent] = None
-        self.build_monitor: Optional[BuildMonitorAgent] = None
-        self.release_manager: Optional[ReleaseManagerAgent] = None
-        self.code_agents: dict[str, CodeRepositoryAgent] = {}
+        self.orchestrator: Optional["OrchestratorAgent"] = None
+        self.requirements_agent: Optional["RequirementsAgent"] = None
+        self.build_monitor: Optional["BuildMonitorAgent"] = None
+        self.release_manager: Optional["ReleaseManagerAgent"] = None
+        self.code_agents: dict[str, "CodeRepositoryAgent"] = {}
 
     async def initialize(self, repos: Optional[list[dict[str, str]]] = None) -> None:
         """
@@ -43,6 +72,14 @@ class SDLCAgentSystem:
             repos: Optional list of repositories with 'name' and 'url'.
                    If None, loads from repositories.yaml
         """
+        # Agents (and their LLM, git and ADO dependencies) are only imported by
+        # commands that start the system, so `--help`, `info` and `repos` stay fast
+        from sdlc_agents.agents.build_monitor_agent import BuildMonitorAgent
+        from sdlc_agents.agents.code_repo_agent import CodeRepositoryAgent
+        from sdlc_agents.agents.orchestrator import OrchestratorAgent
+        from sdlc_agents.agents.release_manager_agent import ReleaseManagerAgent
+        from sdlc_agents.agents.requirements_agent import RequirementsAgent
+
         console.print("[bold blue]Initializing SDLC Agent System...[/bold blue]")
 
         # Create orchestrator
@@ -62,19 +99,36 @@ class SDLCAgentSystem:
         repo_list = repos if repos is not None else self._load_repos_from_config()
 
         # Create code agents for each repository
+        pending = []
         for repo in repo_list:
             # Extract local_path if provided
             local_path = None
             if "local_path" in repo and repo["local_path"]:
                 local_path = Path(repo["local_path"]).expanduser()
 
-            code_agent = CodeRepositoryAgent(
+            pending.append(CodeRepositoryAgent(
                 repo_name=repo["name"],
                 repo_url=repo["url"],
                 repo_path=local_path,
-            )
-            await code_agent.initialize_repo()
-            self.code_agents[repo["name"]] = code_agent
+            ))
+
+        # Clone/open all repositories concurrently, then register the ones that succeeded
+        init_sema = asyncio.Semaphore(_REPO_INIT_CONCURRENCY)
+
+        async def init_repo(agent: CodeRepositoryAgent) -> bool:
+            async with init_sema:
+                return await agent.initialize_repo()
+
+        results = await asyncio.gather(
+            *(init_repo(agent) for agent in pending), return_exceptions=True
+        )
+        for code_agent, ok in zip(pending, results):
+            if ok is not True:
+                # initialize_repo() logs its own failure details
+                logger.warning(f"Skipping repository {code_agent.repo_name}: initialization failed")
+                console.print(f"[yellow]Could not initialize {code_agent.repo_name}[/yellow]")
+                continue
+            self.code_agents[code_agent.repo_name] = code_agent
             self.orchestrator.register_agent(code_agent)
 
         console.print("[bold green]System initialized![/bold green]")
@@ -122,13 +176,13 @@ class SDLCAgentSystem:
             return "System not initialized"
 
         # Parse message intent
-        message_lower = message.lower()
+        intent_match = _INTENT_RE.search(message)
+        intent = intent_match.lastgroup if intent_match else None
 
         # Handle specific command patterns
-        if "implement story" in message_lower or "implement work item" in message_lower:
+        if intent == "implement_story":
             # Extract work item ID
-            import re
-            match = re.search(r'\d+', message)
+            match = _DIGITS_RE.search(message)
             if match:
                 story_id = int(match.group())
                 result = await self.orchestrator.process_task({
@@ -137,10 +191,9 @@ class SDLCAgentSystem:
                 })
                 return self._format_result(result)
 
-        elif "split feature" in message_lower:
+        elif intent == "split_feature":
             # Extract feature ID
-            import re
-            match = re.search(r'\d+', message)
+            match = _DIGITS_RE.search(message)
             if match:
                 feature_id = int(match.group())
                 result = await self.orchestrator.process_task({
@@ -149,20 +202,25 @@ class SDLCAgentSystem:
                 })
                 return self._format_result(result)
 
-        elif "create release" in message_lower or "create a release" in message_lower:
-            # Extract component names
+        elif intent == "create_release":
+            # Extract component names and optional source branch
             # Simple parsing - in real impl, use better NLP
             components = []
-            for word in message.split():
-                if word.endswith(','):
-                    components.append(word[:-1])
-                elif word not in ["create", "release", "for", "a", "and", "from", "components"]:
-                    components.append(word)
+            source_branch = "main"
+            match = _COMPONENT_RE.search(message)
+            if match:
+                components = [
+                    name
+                    for name in _COMPONENT_SPLIT_RE.split(match.group(1))
+                    if name and name.casefold() not in _COMPONENT_STOPWORDS
+                ]
+                source_branch = match.group(2) or source_branch
 
             if components:
                 result = await self.orchestrator.process_task({
                     "type": "create_release",
                     "components": components,
+                    "source_branch": source_branch,
                 })
                 return self._format_result(result)
 
@@ -179,12 +237,23 @@ class SDLCAgentSystem:
 
     async def cleanup(self) -> None:
         """Cleanup resources."""
+        from sdlc_agents.llm.factory import reset_llm_provider
+
         if self.orchestrator:
             await self.orchestrator.cleanup()
 
         for agent in self.code_agents.values():
             await agent.cleanup()
 
+        # Shared by all agents, so closed once here after they are done with them
+        if self.orchestrator:
+            self.orchestrator.ado_client.close()
+            llm = self.orchestrator.llm
+            if hasattr(llm, "close"):
+                await llm.close()
+            # The closed provider must not be handed out again
+            reset_llm_provider()
+
 
 async def interactive_chat(system: SDLCAgentSystem) -> None:
     """Run interactive chat loop."""
@@ -207,11 +276,13 @@ async def interactive_chat(system: SDLCAgentSystem) -> None:
             if not message.strip():
                 continue
 
-            if message.lower() in ["exit", "quit", "q"]:
+            command = message.strip().casefold()
+
+            if command in _EXIT_COMMANDS:
                 console.print("[yellow]Goodbye![/yellow]")
                 break
 
-            if message.lower() in ["help", "h"]:
+            if command in _HELP_COMMANDS:
                 console.print(Panel.fit(
                     "Available commands:\n"
                     "  • implement story <id>\n"
@@ -244,7 +315,8 @@ async def interactive_chat(system: SDLCAgentSystem) -> None:
 @click.group()
 def cli():
     """SDLC Multi-Agent System CLI."""
-    pass
+    # Not done at import, so --help doesn't read the environment
+    setup_logging()
 
 
 @cli.command()
@@ -1,8 +1,10 @@
 """Configuration management for SDLC agents."""
 
+import os
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -32,6 +34,8 @@ class Settings(BaseSettings):
     openai_api_key: Optional[str] = Field(default=None)
     openai_model: str = Field(default="gpt-4")
     openai_base_url: str = Field(default="https://api.openai.com/v1")
+    llm_max_concurrency: int = Field(default=10)
+    llm_requests_per_minute: Optional[int] = Field(default=None)
 
     # ClickHouse Configuration
     clickhouse_host: str = Field(default="localhost")
@@ -39,12 +43,17 @@ class Settings(BaseSettings):
     clickhouse_user: str = Field(default="default")
     clickhouse_password: str = Field(default="")
     clickhouse_database: str = Field(default="sdlc_agents")
+    clickhouse_compression: str = Field(default="lz4")
+    clickhouse_batch_size: int = Field(default=10_000)
+    clickhouse_flush_interval_ms: int = Field(default=1000)
 
     # Azure DevOps Configuration
     ado_organization: str = Field(default="")
     ado_project: str = Field(default="")
     ado_pat: str = Field(default="")
     ado_base_url: str = Field(default="https://dev.azure.com")
+    ado_max_concurrency: int = Field(default=8)
+    ado_cache_ttl_seconds: float = Field(default=60.0)
 
     # Git Configuration
     git_user_name: str = Field(default="SDLC Agent")
@@ -52,27 +61,64 @@ class Settings(BaseSettings):
 
     # Maven Configuration
     maven_home: Optional[Path] = Field(default=None)
-    maven_opts: str = Field(default="-Xmx2g")
+    maven_opts: str = Field(default="-Xmx2g -XX:+UseParallelGC -XX:TieredStopAtLevel=1")
+    maven_thread_factor: str = Field(default="1C")
+    max_parallel_builds: int = Field(default_factory=lambda: max(1, (os.cpu_count() or 2) // 2))
 
     # Agent Configuration
     max_retries: int = Field(default=3)
     build_timeout: int = Field(default=600)
     agent_memory_retention_days: int = Field(default=90)
+    build_analysis_cache_ttl_hours: int = Field(default=24)
+    llm_cache_ttl_hours: int = Field(default=24)
 
     # Logging
     log_level: str = Field(default="INFO")
     log_file: str = Field(default="sdlc_agents.log")
+    debug: bool = Field(default=False)
 
     # Workspace
     workspace_dir: Path = Field(default=Path("workspace"))
     repos_dir: Path = Field(default=Path("repos"))
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        # Ensure directories exist
-        self.workspace_dir.mkdir(parents=True, exist_ok=True)
-        self.repos_dir.mkdir(parents=True, exist_ok=True)
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings, reading the environment and .env once.
 
-# Global settings instance
-settings = Settings()
+    Directories are not created here; code that writes under workspace_dir or
+    repos_dir creates what it needs on first write.
+
+    Returns:
+        Shared settings instance
+    """
+    return Settings()
+
+
+class _LazySettings:
+    """
+    Stand-in for the global settings that loads them on first attribute access.
+
+    Modules import ``settings`` at import time, so a plain instance (or a module
+    ``__getattr__``) would parse the environment as soon as any of them is imported.
+    Reads, writes and deletes are forwarded to get_settings().
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_settings(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(get_settings(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(get_settings(), name)
+
+    def __repr__(self) -> str:
+        return repr(get_settings())
+
+
+# Global settings; the environment is read the first time an attribute is used
+settings: Settings = _LazySettings()  # type: ignore[assignment]
@@ -1,74 +1,358 @@
 """Azure DevOps integration client."""
 
-from typing import Any, Optional
+import asyncio
+import re
+import threading
+import time
+from functools import cached_property
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
-from azure.devops.connection import Connection
-from azure.devops.v7_1.build import BuildClient
-from azure.devops.v7_1.git import GitClient
-from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
-from msrest.authentication import BasicAuthentication
+import orjson
 
+from sdlc_agents.circuit_breaker import CircuitBreaker, is_outage_status
 from sdlc_agents.config import settings
 from sdlc_agents.logging_config import logger
 
+# The azure-devops SDK registers hundreds of msrest models on import, so it is
+# only loaded once a client is built and each area client on first use
+if TYPE_CHECKING:
+    from azure.devops.client import Client
+    from azure.devops.v7_1.build import BuildClient
+    from azure.devops.v7_1.git import GitClient
+    from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+    from azure.devops.v7_1.work_item_tracking.models import JsonPatchOperation
+
+# Maximum number of IDs accepted by the workitemsbatch endpoint
+_WORK_ITEMS_BATCH_SIZE = 200
+_CHILD_LINK = "System.LinkTypes.Hierarchy-Forward"
+
+# Status the SDK puts in the message of errors it has no structured details for
+_STATUS_CODE_RE = re.compile(r"returned a (\d{3}) status code")
+
+
+def _is_outage(exc: Exception) -> bool:
+    """
+    Whether an SDK exception means ADO is unreachable or overloaded.
+
+    Structured errors reported by ADO itself (a missing work item, an invalid
+    patch) and authentication errors are the caller's problem and don't trip
+    the circuit breaker; transport errors, timeouts, 429 and 5xx do.
+    """
+    import requests
+    from azure.devops.exceptions import AzureDevOpsServiceError
+    from msrest.exceptions import AuthenticationError, ClientRequestError
+
+    if isinstance(exc, (AzureDevOpsServiceError, AuthenticationError)):
+        return False
+    if isinstance(exc, ClientRequestError):
+        if isinstance(exc.inner_exception, requests.RequestException):
+            return True
+        match = _STATUS_CODE_RE.search(str(exc))
+        return is_outage_status(int(match.group(1))) if match else True
+    return isinstance(exc, (requests.RequestException, OSError))
+
+
+def _work_item_dict(work_item: Any) -> dict[str, Any]:
+    """Convert an SDK work item into the dict shape returned by ADOClient."""
+    fields = work_item.fields or {}
+    return {
+        "id": work_item.id,
+        "type": fields.get("System.WorkItemType"),
+        "title": fields.get("System.Title"),
+        "description": fields.get("System.Description", ""),
+        "state": fields.get("System.State"),
+        "assigned_to": fields.get("System.AssignedTo", {}).get("displayName"),
+        "tags": fields.get("System.Tags", ""),
+        "acceptance_criteria": fields.get("Microsoft.VSTS.Common.AcceptanceCriteria", ""),
+        "child_ids": [
+            int(relation.url.rsplit("/", 1)[-1])
+            for relation in work_item.relations or []
+            if relation.rel == _CHILD_LINK
+        ],
+        "fields": fields,
+    }
+
+
+def _field_patch(fields: dict[str, Any]) -> list["JsonPatchOperation"]:
+    """Build the JSON Patch document setting each field."""
+    from azure.devops.v7_1.work_item_tracking.models import JsonPatchOperation
+
+    return [
+        JsonPatchOperation(op="add", path=f"/fields/{field}", value=value)
+        for field, value in fields.items()
+    ]
+
+
+def _build_dict(build: Any) -> dict[str, Any]:
+    """Convert an SDK build into the dict shape returned by ADOClient."""
+    return {
+        "id": build.id,
+        "build_number": build.build_number,
+        "status": build.status,
+        "result": build.result,
+        "source_branch": build.source_branch,
+        "source_version": build.source_version,
+        "definition": build.definition.name if build.definition else None,
+        "queue_time": build.queue_time,
+        "start_time": build.start_time,
+        "finish_time": build.finish_time,
+    }
+
 
 class ADOClient:
     """Client for interacting with Azure DevOps."""
 
+    _default: Optional["ADOClient"] = None
+
+    # Fields read into the work item dict; pass as ``fields`` when relations
+    # (child_ids) aren't needed to fetch only these
+    SUMMARY_FIELDS = (
+        "System.WorkItemType",
+        "System.Title",
+        "System.Description",
+        "System.State",
+        "System.AssignedTo",
+        "System.Tags",
+        "Microsoft.VSTS.Common.AcceptanceCriteria",
+    )
+
+    @classmethod
+    def get_default(cls) -> "ADOClient":
+        """
+        Get the process-wide client shared by agents.
+
+        Sharing one connection means agents reuse its HTTP session and
+        keep-alive connections instead of each paying for a TLS handshake.
+
+        Returns:
+            Shared ADO client
+        """
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
     def __init__(self):
         """Initialize ADO client."""
         if not settings.ado_pat or not settings.ado_organization:
             raise ValueError("Azure DevOps configuration missing")
 
+        import requests
+        from azure.devops.connection import Connection
+        from msrest.authentication import BasicAuthentication
+        from requests.adapters import HTTPAdapter
+
         credentials = BasicAuthentication("", settings.ado_pat)
         self.connection = Connection(
             base_url=f"{settings.ado_base_url}/{settings.ado_organization}",
             creds=credentials,
         )
 
-        self.work_item_client: WorkItemTrackingClient = (
-            self.connection.clients.get_work_item_tracking_client()
-        )
-        self.build_client: BuildClient = self.connection.clients.get_build_client()
-        self.git_client: GitClient = self.connection.clients.get_git_client()
+        # One pooled keep-alive session for every SDK client, so calls reuse open
+        # TLS connections instead of handshaking each time
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        # Read cache: key -> (expiry on the monotonic clock, value)
+        self._cache: dict[str, tuple[float, Any]] = {}
+        # Calls run in worker threads; the lock is not held while loading
+        self._cache_lock = threading.Lock()
+        # Build definition name -> (id, name); definitions are effectively static
+        self._definition_cache: dict[str, tuple[int, str]] = {}
+        # Fails calls fast while ADO is unreachable
+        self._breaker = CircuitBreaker("Azure DevOps", is_failure=_is_outage)
+
+        logger.info("Connected to ADO: %s/%s", settings.ado_organization, settings.ado_project)
+
+    @cached_property
+    def work_item_client(self) -> "WorkItemTrackingClient":
+        """Work item tracking client, created on first use."""
+        client = self.connection.clients.get_work_item_tracking_client()
+        self._use_session(client)
+        return client
+
+    @cached_property
+    def build_client(self) -> "BuildClient":
+        """Build client, created on first use."""
+        client = self.connection.clients.get_build_client()
+        self._use_session(client)
+        return client
+
+    @cached_property
+    def git_client(self) -> "GitClient":
+        """Git client, created on first use."""
+        client = self.connection.clients.get_git_client()
+        self._use_session(client)
+        return client
+
+    def _use_session(self, client: "Client") -> None:
+        """
+        Route an SDK client's requests through the shared session.
+
+        msrest closes its per-client session after every request unless the
+        client is kept alive, so keep-alive is switched on as well. Its sender
+        keeps the session in a ``threading.local``, which would give every
+        ``asyncio.to_thread`` worker a private, never-closed session; the storage
+        is replaced by a plain namespace so all threads share the pooled one.
+
+        Args:
+            client: azure-devops SDK client
+        """
+        service_client = client._client
+        service_client.config.keep_alive = True
+        driver = service_client.config.pipeline._sender.driver
+        default_session = vars(driver._session_mapping).get("session")
+        if default_session is not None:
+            default_session.close()
+        driver._session_mapping = SimpleNamespace()
+        driver.session = self._session
+
+    def _cached(
+        self,
+        key: str,
+        loader: Callable[[], Optional[dict[str, Any]]],
+        cacheable: Optional[Callable[[dict[str, Any]], bool]] = None,
+    ) -> Optional[dict[str, Any]]:
+        """
+        Return a cached read, loading and caching it when missing or expired.
+
+        Failed lookups (None) are not cached. Copies are handed out so callers
+        can annotate the result without changing the cached entry.
 
-        logger.info(f"Connected to ADO: {settings.ado_organization}/{settings.ado_project}")
+        Args:
+            key: Cache key, e.g. ``wi:<id>``
+            loader: Fetches the value from ADO
+            cacheable: Decides whether a loaded value may be cached
 
-    def get_work_item(self, work_item_id: int) -> Optional[dict[str, Any]]:
+        Returns:
+            Loaded or cached value
+        """
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    return dict(entry[1])
+                del self._cache[key]
+
+        value = loader()
+        if value is None:
+            return None
+        if cacheable is None or cacheable(value):
+            with self._cache_lock:
+                self._cache[key] = (now + settings.ado_cache_ttl_seconds, value)
+        return dict(value)
+
+    def _forget_work_item(self, work_item_id: int) -> None:
+        """Drop every cached read of a work item."""
+        self.clear_cache(rf"^wi:{work_item_id}(:|$)")
+
+    def clear_cache(self, pattern: Optional[str] = None) -> None:
+        """
+        Drop cached reads.
+
+        Args:
+            pattern: Regex matched against cache keys; all entries are dropped
+                when omitted
+        """
+        key_re = re.compile(pattern) if pattern is not None else None
+        with self._cache_lock:
+            if key_re is None:
+                self._cache.clear()
+                return
+            for key in [key for key in self._cache if key_re.search(key)]:
+                del self._cache[key]
+
+    def close(self) -> None:
+        """Close the pooled HTTP connections."""
+        self._session.close()
+
+    def __enter__(self) -> "ADOClient":
+        """Use the client as a context manager that closes its connections."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the pooled HTTP connections."""
+        self.close()
+
+    def get_work_item(
+        self, work_item_id: int, fields: Optional[tuple[str, ...]] = None
+    ) -> Optional[dict[str, Any]]:
         """
         Get work item details.
 
         Args:
             work_item_id: Work item ID
+            fields: Fetch only these fields (e.g. SUMMARY_FIELDS) and no relations;
+                by default all fields and relations are fetched
 
         Returns:
             Work item details or None if not found
         """
+        key = f"wi:{work_item_id}:{','.join(fields)}" if fields else f"wi:{work_item_id}"
+        return self._cached(key, lambda: self._fetch_work_item(work_item_id, fields))
+
+    def _fetch_work_item(
+        self, work_item_id: int, fields: Optional[tuple[str, ...]] = None
+    ) -> Optional[dict[str, Any]]:
+        """Fetch a work item, bypassing the cache."""
         try:
-            work_item = self.work_item_client.get_work_item(
-                id=work_item_id, expand="All"
-            )
+            # ADO rejects expand together with a field projection
+            with self._breaker:
+                if fields:
+                    work_item = self.work_item_client.get_work_item(
+                        id=work_item_id, fields=list(fields)
+                    )
+                else:
+                    work_item = self.work_item_client.get_work_item(
+                        id=work_item_id, expand="Relations"
+                    )
 
             if not work_item:
                 return None
 
-            return {
-                "id": work_item.id,
-                "type": work_item.fields.get("System.WorkItemType"),
-                "title": work_item.fields.get("System.Title"),
-                "description": work_item.fields.get("System.Description", ""),
-                "state": work_item.fields.get("System.State"),
-                "assigned_to": work_item.fields.get("System.AssignedTo", {}).get("displayName"),
-                "tags": work_item.fields.get("System.Tags", ""),
-                "acceptance_criteria": work_item.fields.get("Microsoft.VSTS.Common.AcceptanceCriteria", ""),
-                "fields": work_item.fields,
-            }
+            return _work_item_dict(work_item)
         except Exception as e:
-            logger.error(f"Failed to get work item {work_item_id}: {e}")
+            logger.error("Failed to get work item %s: %s", work_item_id, e)
             return None
 
+    def get_work_items_batch(self, work_item_ids: list[int]) -> dict[int, dict[str, Any]]:
+        """
+        Get several work items with one workitemsbatch request per 200 IDs.
+
+        Args:
+            work_item_ids: Work item IDs
+
+        Returns:
+            Work item details keyed by ID; missing items are omitted
+        """
+        from azure.devops.v7_1.work_item_tracking.models import WorkItemBatchGetRequest
+
+        work_items: dict[int, dict[str, Any]] = {}
+        for start in range(0, len(work_item_ids), _WORK_ITEMS_BATCH_SIZE):
+            chunk = work_item_ids[start:start + _WORK_ITEMS_BATCH_SIZE]
+            try:
+                with self._breaker:
+                    batch = self.work_item_client.get_work_items_batch(
+                        WorkItemBatchGetRequest(
+                            ids=chunk, expand="Relations", error_policy="Omit"
+                        ),
+                        project=settings.ado_project,
+                    )
+            except Exception as e:
+                logger.error("Failed to get work items %s: %s", chunk, e)
+                continue
+
+            for work_item in batch or []:
+                if work_item:
+                    work_items[work_item.id] = _work_item_dict(work_item)
+
+        return work_items
+
     def update_work_item(
-        self, work_item_id: int, fields: dict[str, Any]
+        self, work_item_id: int, fields: dict[str, Any], fetch: bool = True
     ) -> Optional[dict[str, Any]]:
         """
         Update work item fields.
@@ -76,32 +360,26 @@ class ADOClient:
         Args:
             work_item_id: Work item ID
             fields: Fields to update
+            fetch: Re-read the item with all relations; if False, the updated item
+                returned by the PATCH is used, saving a round trip
 
         Returns:
             Updated work item or None if failed
         """
+        self._forget_work_item(work_item_id)
         try:
-            from azure.devops.v7_1.work_item_tracking.models import JsonPatchOperation
-
-            document = []
-            for field, value in fields.items():
-                document.append(
-                    JsonPatchOperation(
-                        op="add",
-                        path=f"/fields/{field}",
-                        value=value,
-                    )
+            with self._breaker:
+                work_item = self.work_item_client.update_work_item(
+                    document=_field_patch(fields),
+                    id=work_item_id,
+                    project=settings.ado_project,
                 )
 
-            work_item = self.work_item_client.update_work_item(
-                document=document,
-                id=work_item_id,
-                project=settings.ado_project,
-            )
-
+            if not fetch:
+                return _work_item_dict(work_item)
             return self.get_work_item(work_item.id)
         except Exception as e:
-            logger.error(f"Failed to update work item {work_item_id}: {e}")
+            logger.error("Failed to update work item %s: %s", work_item_id, e)
             return None
 
     def create_work_item(
@@ -109,6 +387,7 @@ class ADOClient:
         work_item_type: str,
         title: str,
         description: str = "",
+        fetch: bool = True,
         **fields: Any,
     ) -> Optional[dict[str, Any]]:
         """
@@ -118,53 +397,43 @@ class ADOClient:
             work_item_type: Type (Story, Task, Bug, etc.)
             title: Work item title
             description: Description
+            fetch: Re-read the item with all relations; if False, the created item
+                returned by the POST is used, saving a round trip
             **fields: Additional fields
 
         Returns:
             Created work item or None if failed
         """
         try:
-            from azure.devops.v7_1.work_item_tracking.models import JsonPatchOperation
-
-            document = [
-                JsonPatchOperation(
-                    op="add",
-                    path="/fields/System.Title",
-                    value=title,
-                ),
-                JsonPatchOperation(
-                    op="add",
-                    path="/fields/System.Description",
-                    value=description,
-                ),
-            ]
-
-            for field, value in fields.items():
-                document.append(
-                    JsonPatchOperation(
-                        op="add",
-                        path=f"/fields/{field}",
-                        value=value,
-                    )
+            with self._breaker:
+                work_item = self.work_item_client.create_work_item(
+                    document=_field_patch({
+                        "System.Title": title,
+                        "System.Description": description,
+                        **fields,
+                    }),
+                    project=settings.ado_project,
+                    type=work_item_type,
                 )
 
-            work_item = self.work_item_client.create_work_item(
-                document=document,
-                project=settings.ado_project,
-                type=work_item_type,
-            )
-
+            if not fetch:
+                return _work_item_dict(work_item)
             return self.get_work_item(work_item.id)
         except Exception as e:
-            logger.error(f"Failed to create work item: {e}")
+            logger.error("Failed to create work item: %s", e)
             return None
 
-    def split_feature_into_stories(
+    async def split_feature_into_stories(
         self, feature_id: int, story_count: int = 3
     ) -> list[dict[str, Any]]:
         """
         Split a feature into multiple stories.
 
+        The stories are created concurrently and then linked to the feature
+        concurrently, so latency stays close to one create and one link round
+        trip regardless of story_count. The SDK is synchronous, so each call runs
+        in a worker thread.
+
         Args:
             feature_id: Feature work item ID
             story_count: Number of stories to create
@@ -172,21 +441,27 @@ class ADOClient:
         Returns:
             List of created stories
         """
-        feature = self.get_work_item(feature_id)
+        feature = await asyncio.to_thread(self.get_work_item, feature_id, self.SUMMARY_FIELDS)
         if not feature:
             return []
 
-        stories = []
-        for i in range(story_count):
-            story = self.create_work_item(
+        created = await asyncio.gather(*(
+            asyncio.to_thread(
+                self.create_work_item,
                 work_item_type="User Story",
                 title=f"{feature['title']} - Story {i + 1}",
                 description=f"Part {i + 1} of {story_count} for feature {feature_id}",
+                fetch=False,
             )
-            if story:
-                # Link to parent feature
-                self.link_work_items(story["id"], feature_id, "Parent")
-                stories.append(story)
+            for i in range(story_count)
+        ))
+        stories = [story for story in created if story]
+
+        # Link to parent feature
+        await asyncio.gather(*(
+            asyncio.to_thread(self.link_work_items, story["id"], feature_id, "Parent")
+            for story in stories
+        ))
 
         return stories
 
@@ -204,6 +479,7 @@ class ADOClient:
         Returns:
             True if successful
         """
+        self._forget_work_item(source_id)
         try:
             from azure.devops.v7_1.work_item_tracking.models import JsonPatchOperation
 
@@ -218,14 +494,15 @@ class ADOClient:
                 )
             ]
 
-            self.work_item_client.update_work_item(
-                document=document,
-                id=source_id,
-                project=settings.ado_project,
-            )
+            with self._breaker:
+                self.work_item_client.update_work_item(
+                    document=document,
+                    id=source_id,
+                    project=settings.ado_project,
+                )
             return True
         except Exception as e:
-            logger.error(f"Failed to link work items: {e}")
+            logger.error("Failed to link work items: %s", e)
             return False
 
     def get_build(self, build_id: int) -> Optional[dict[str, Any]]:
@@ -238,28 +515,71 @@ class ADOClient:
         Returns:
             Build details or None
         """
+        # Running builds are polled for progress, so only finished ones are cached
+        return self._cached(
+            f"build:{build_id}",
+            lambda: self._fetch_build(build_id),
+            cacheable=lambda build: build["status"] == "completed",
+        )
+
+    def _fetch_build(self, build_id: int) -> Optional[dict[str, Any]]:
+        """Fetch a build, bypassing the cache."""
         try:
-            build = self.build_client.get_build(
-                project=settings.ado_project,
-                build_id=build_id,
-            )
+            with self._breaker:
+                build = self.build_client.get_build(
+                    project=settings.ado_project,
+                    build_id=build_id,
+                )
 
-            return {
-                "id": build.id,
-                "build_number": build.build_number,
-                "status": build.status,
-                "result": build.result,
-                "source_branch": build.source_branch,
-                "source_version": build.source_version,
-                "definition": build.definition.name if build.definition else None,
-                "queue_time": build.queue_time,
-                "start_time": build.start_time,
-                "finish_time": build.finish_time,
-            }
+            return _build_dict(build)
         except Exception as e:
-            logger.error(f"Failed to get build {build_id}: {e}")
+            logger.error("Failed to get build %s: %s", build_id, e)
             return None
 
+    def get_latest_builds(
+        self, definition_names: list[str], branch: str = "main"
+    ) -> dict[str, Optional[dict[str, Any]]]:
+        """
+        Get the latest completed build of several definitions in two requests.
+
+        Args:
+            definition_names: Build definition names
+            branch: Source branch
+
+        Returns:
+            Latest build details keyed by definition name, or None when the
+            definition is unknown or has no completed build on the branch
+        """
+        latest: dict[str, Optional[dict[str, Any]]] = dict.fromkeys(definition_names)
+        try:
+            with self._breaker:
+                definitions = self.build_client.get_definitions(project=settings.ado_project)
+            ids_by_name = {
+                definition.name: definition.id
+                for definition in definitions
+                if definition.name in latest
+            }
+            if not ids_by_name:
+                return latest
+
+            with self._breaker:
+                builds = self.build_client.get_builds(
+                    project=settings.ado_project,
+                    definitions=list(ids_by_name.values()),
+                    branch_name=f"refs/heads/{branch}",
+                    status_filter="completed",
+                    max_builds_per_definition=1,
+                    query_order="finishTimeDescending",
+                )
+            for build in builds:
+                name = build.definition.name if build.definition else None
+                if name in latest and latest[name] is None:
+                    latest[name] = _build_dict(build)
+        except Exception as e:
+            logger.error("Failed to get latest builds for %s: %s", definition_names, e)
+
+        return latest
+
     def queue_build(
         self, definition_name: str, branch: str = "main", **parameters: Any
     ) -> Optional[dict[str, Any]]:
@@ -275,34 +595,40 @@ class ADOClient:
             Queued build details or None
         """
         try:
-            from azure.devops.v7_1.build.models import Build
-
-            # Get definition
-            definitions = self.build_client.get_definitions(
-                project=settings.ado_project,
-                name=definition_name,
-            )
+            from azure.devops.v7_1.build.models import Build, DefinitionReference
+
+            # Get definition, once per name
+            definition = self._definition_cache.get(definition_name)
+            if definition is None:
+                with self._breaker:
+                    definitions = self.build_client.get_definitions(
+                        project=settings.ado_project,
+                        name=definition_name,
+                    )
 
-            if not definitions:
-                logger.error(f"Build definition not found: {definition_name}")
-                return None
+                if not definitions:
+                    logger.error("Build definition not found: %s", definition_name)
+                    return None
 
-            definition = definitions[0]
+                definition = (definitions[0].id, definitions[0].name)
+                self._definition_cache[definition_name] = definition
 
             build = Build(
-                definition=definition,
+                definition=DefinitionReference(id=definition[0], name=definition[1]),
                 source_branch=f"refs/heads/{branch}",
-                parameters=str(parameters) if parameters else None,
+                # ADO expects the parameters as a JSON object string
+                parameters=orjson.dumps(parameters, default=str).decode() if parameters else None,
             )
 
-            queued_build = self.build_client.queue_build(
-                build=build,
-                project=settings.ado_project,
-            )
+            with self._breaker:
+                queued_build = self.build_client.queue_build(
+                    build=build,
+                    project=settings.ado_project,
+                )
 
             return self.get_build(queued_build.id)
         except Exception as e:
-            logger.error(f"Failed to queue build: {e}")
+            logger.error("Failed to queue build: %s", e)
             return None
 
     def get_pull_request(
@@ -318,12 +644,22 @@ class ADOClient:
         Returns:
             PR details or None
         """
+        return self._cached(
+            f"pr:{repository_id}:{pull_request_id}",
+            lambda: self._fetch_pull_request(repository_id, pull_request_id),
+        )
+
+    def _fetch_pull_request(
+        self, repository_id: str, pull_request_id: int
+    ) -> Optional[dict[str, Any]]:
+        """Fetch a pull request, bypassing the cache."""
         try:
-            pr = self.git_client.get_pull_request(
-                repository_id=repository_id,
-                pull_request_id=pull_request_id,
-                project=settings.ado_project,
-            )
+            with self._breaker:
+                pr = self.git_client.get_pull_request(
+                    repository_id=repository_id,
+                    pull_request_id=pull_request_id,
+                    project=settings.ado_project,
+                )
 
             return {
                 "id": pr.pull_request_id,
@@ -336,7 +672,7 @@ class ADOClient:
                 "creation_date": pr.creation_date,
             }
         except Exception as e:
-            logger.error(f"Failed to get PR {pull_request_id}: {e}")
+            logger.error("Failed to get PR %s: %s", pull_request_id, e)
             return None
 
     def create_pull_request(
@@ -370,13 +706,14 @@ class ADOClient:
                 description=description,
             )
 
-            created_pr = self.git_client.create_pull_request(
-                git_pull_request_to_create=pr,
-                repository_id=repository_id,
-                project=settings.ado_project,
-            )
+            with self._breaker:
+                created_pr = self.git_client.create_pull_request(
+                    git_pull_request_to_create=pr,
+                    repository_id=repository_id,
+                    project=settings.ado_project,
+                )
 
             return self.get_pull_request(repository_id, created_pr.pull_request_id)
         except Exception as e:
-            logger.error(f"Failed to create PR: {e}")
+            logger.error("Failed to create PR: %s", e)
             return None
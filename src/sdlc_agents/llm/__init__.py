@@ -1,6 +1,15 @@
 """LLM provider abstraction layer."""
 
 from sdlc_agents.llm.base import LLMMessage, LLMProvider, LLMResponse, MessageRole
-from sdlc_agents.llm.factory import get_llm_provider
+from sdlc_agents.llm.batcher import BatchScheduler
+from sdlc_agents.llm.factory import get_llm_provider, reset_llm_provider
 
-__all__ = ["LLMMessage", "LLMProvider", "LLMResponse", "MessageRole", "get_llm_provider"]
+__all__ = [
+    "BatchScheduler",
+    "LLMMessage",
+    "LLMProvider",
+    "LLMResponse",
+    "MessageRole",
+    "get_llm_provider",
+    "reset_llm_provider",
+]
@@ -1,7 +1,10 @@
 """Base classes and types for LLM providers."""
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Optional
 
@@ -31,6 +34,120 @@ class LLMResponse:
     tokens_used: Optional[int] = None
     finish_reason: Optional[str] = None
     raw_response: Optional[dict[str, Any]] = None
+    # Provider response object, serialized by raw() only when someone asks
+    raw_source: Any = field(default=None, repr=False, compare=False)
+
+    def raw(self) -> Optional[dict[str, Any]]:
+        """
+        Get the provider's raw response as a dict.
+
+        Returns:
+            Raw response, serialized from raw_source on first call if needed
+        """
+        if self.raw_response is None and self.raw_source is not None:
+            self.raw_response = self.raw_source.model_dump()
+        return self.raw_response
+
+
+class MessageEncoder:
+    """
+    Converts messages to the role/content dicts sent to chat APIs.
+
+    Agents reuse the same message objects for their system prompt and cached
+    context, so consecutive calls of one conversation share a prefix. The dicts
+    for an identical (same objects) prefix are reused and only the new trailing
+    messages are converted. A conversation is identified by its first message.
+    """
+
+    def __init__(self, max_conversations: int = 32):
+        """
+        Initialize the encoder.
+
+        Args:
+            max_conversations: Conversations whose encoding is kept
+        """
+        self.max_conversations = max_conversations
+        # id(first message) -> (source messages, encoded dicts); holding the
+        # sources keeps the ids from being reused while the entry exists
+        self._conversations: OrderedDict[
+            int, tuple[list[LLMMessage], list[dict[str, str]]]
+        ] = OrderedDict()
+
+    def encode(self, messages: list[LLMMessage]) -> list[dict[str, str]]:
+        """
+        Encode a conversation for a chat API.
+
+        Args:
+            messages: Conversation history
+
+        Returns:
+            One role/content dict per message
+        """
+        if not messages:
+            return []
+
+        key = id(messages[0])
+        encoded: list[dict[str, str]] = []
+        cached = self._conversations.get(key)
+        if cached is not None:
+            sources, cached_encoded = cached
+            limit = min(len(sources), len(messages))
+            reused = 0
+            while reused < limit and sources[reused] is messages[reused]:
+                reused += 1
+            encoded = cached_encoded[:reused]
+            self._conversations.move_to_end(key)
+
+        # MessageRole members are strs and serialize as their value, so no .value lookup
+        encoded.extend(
+            {"role": msg.role, "content": msg.content} for msg in messages[len(encoded):]
+        )
+
+        self._conversations[key] = (list(messages), encoded)
+        if len(self._conversations) > self.max_conversations:
+            self._conversations.popitem(last=False)
+        return encoded
+
+
+class RequestLimiter:
+    """
+    Async context manager bounding the requests in flight to an LLM backend.
+
+    At most ``max_concurrency`` requests run at once. With a requests-per-minute
+    limit, request starts are also spaced evenly so a fan-out of agent tasks
+    doesn't burst into 429s.
+    """
+
+    def __init__(self, max_concurrency: int, requests_per_minute: Optional[int] = None):
+        """
+        Initialize the limiter.
+
+        Args:
+            max_concurrency: Maximum concurrent requests
+            requests_per_minute: Optional cap on request starts per minute
+        """
+        self._sema = asyncio.Semaphore(max_concurrency)
+        self._interval = 60.0 / requests_per_minute if requests_per_minute else 0.0
+        self._next_start = 0.0
+
+    async def __aenter__(self) -> "RequestLimiter":
+        """Wait for a free slot and, when rate limited, for the next start time."""
+        await self._sema.acquire()
+        if self._interval:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self._interval
+            if start > now:
+                try:
+                    await asyncio.sleep(start - now)
+                except BaseException:
+                    self._sema.release()
+                    raise
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Release the slot."""
+        self._sema.release()
 
 
 class LLMProvider(ABC):
@@ -58,6 +175,42 @@ class LLMProvider(ABC):
         """
         pass
 
+    async def generate_batch(
+        self,
+        batch: list[list[LLMMessage]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> list[Any]:
+        """
+        Generate responses for several independent conversations.
+
+        The default implementation issues the requests concurrently; providers with a
+        native batch endpoint can override it.
+
+        Args:
+            batch: One conversation history per request
+            temperature: Sampling temperature (0.0 to 1.0)
+            max_tokens: Maximum tokens to generate
+            return_exceptions: Return failures in place instead of raising the first one
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            One LLMResponse (or exception, if return_exceptions) per conversation
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.generate(
+                        messages, temperature=temperature, max_tokens=max_tokens, **kwargs
+                    )
+                    for messages in batch
+                ),
+                return_exceptions=return_exceptions,
+            )
+        )
+
     @abstractmethod
     async def stream_generate(
         self,
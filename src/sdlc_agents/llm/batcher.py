@@ -0,0 +1,159 @@
+"""Batching scheduler that coalesces concurrent LLM calls."""
+
+import asyncio
+import hashlib
+from dataclasses import dataclass
+from typing import Optional
+
+from sdlc_agents.llm.base import LLMMessage, LLMProvider, LLMResponse
+
+
+@dataclass
+class _PendingRequest:
+    """A generate request waiting to be dispatched."""
+
+    provider: LLMProvider
+    messages: list[LLMMessage]
+    temperature: float
+    future: asyncio.Future
+
+
+class BatchScheduler:
+    """
+    Coalesce concurrent generate requests into provider batches.
+
+    Requests submitted within a short window are grouped by provider and temperature
+    and sent through a single ``LLMProvider.generate_batch`` call. Identical requests
+    that are already in flight attach to the same future, so N agents asking the same
+    question issue one call.
+    """
+
+    def __init__(self, window_seconds: float = 0.02, max_batch_size: int = 16):
+        """
+        Initialize the scheduler.
+
+        Args:
+            window_seconds: How long to wait for more requests before dispatching
+            max_batch_size: Dispatch immediately once this many requests are queued
+        """
+        self.window_seconds = window_seconds
+        self.max_batch_size = max_batch_size
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue[_PendingRequest]] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._in_flight: dict[str, asyncio.Future] = {}
+        self._batches: set[asyncio.Task] = set()
+
+    @staticmethod
+    def _request_key(
+        provider: LLMProvider, messages: list[LLMMessage], temperature: float
+    ) -> str:
+        """Content hash identifying a request for deduplication."""
+        digest = hashlib.sha256(f"{id(provider)}:{temperature}".encode())
+        for msg in messages:
+            digest.update(b"\x00")
+            digest.update(msg.role.encode())
+            digest.update(b"\x01")
+            digest.update(msg.content.encode())
+        return digest.hexdigest()
+
+    def _bind_loop(self) -> asyncio.AbstractEventLoop:
+        """Reset per-loop state when used from a new event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = None
+            self._in_flight = {}
+            self._batches = set()
+        return loop
+
+    async def submit(
+        self,
+        provider: LLMProvider,
+        messages: list[LLMMessage],
+        temperature: float = 0.7,
+    ) -> LLMResponse:
+        """
+        Submit a request and wait for its response.
+
+        Args:
+            provider: LLM provider to run the request on
+            messages: Conversation history
+            temperature: Sampling temperature
+
+        Returns:
+            LLM response
+        """
+        loop = self._bind_loop()
+        key = self._request_key(provider, messages, temperature)
+
+        future = self._in_flight.get(key)
+        if future is None:
+            future = loop.create_future()
+            self._in_flight[key] = future
+            future.add_done_callback(lambda f, k=key: self._forget(k, f))
+            self._queue.put_nowait(_PendingRequest(provider, messages, temperature, future))
+
+            if self._worker is None or self._worker.done():
+                self._worker = loop.create_task(self._drain())
+
+        # Shield so one cancelled caller does not cancel the shared request
+        return await asyncio.shield(future)
+
+    def _forget(self, key: str, future: asyncio.Future) -> None:
+        """Drop a completed request from the in-flight map."""
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+
+    async def _drain(self) -> None:
+        """Collect queued requests into batches until the queue is empty."""
+        loop = asyncio.get_running_loop()
+
+        while not self._queue.empty():
+            batch = [self._queue.get_nowait()]
+            deadline = loop.time() + self.window_seconds
+
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            groups: dict[tuple[int, float], list[_PendingRequest]] = {}
+            for request in batch:
+                groups.setdefault((id(request.provider), request.temperature), []).append(
+                    request
+                )
+
+            for requests in groups.values():
+                task = loop.create_task(self._execute(requests))
+                self._batches.add(task)
+                task.add_done_callback(self._batches.discard)
+
+    async def _execute(self, requests: list[_PendingRequest]) -> None:
+        """Run one batch on its provider and resolve the waiting futures."""
+        provider = requests[0].provider
+        try:
+            responses = await provider.generate_batch(
+                [r.messages for r in requests],
+                temperature=requests[0].temperature,
+                return_exceptions=True,
+            )
+        except Exception as e:
+            responses = [e] * len(requests)
+
+        for request, response in zip(requests, responses):
+            if request.future.done():
+                continue
+            if isinstance(response, BaseException):
+                request.future.set_exception(response)
+            else:
+                request.future.set_result(response)
+
+
+# Global scheduler shared by all agents
+batch_scheduler = BatchScheduler()
@@ -0,0 +1,127 @@
+"""Disk-backed cache for deterministic LLM prompts."""
+
+import hashlib
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+import orjson
+
+from sdlc_agents.llm.base import LLMResponse
+from sdlc_agents.logging_config import logger
+
+
+class ResponseCache:
+    """
+    Content-addressed cache of LLM responses stored as JSON files.
+
+    Entries are keyed on everything that determines the answer (system prompt,
+    user prompt, rendered context, model and temperature), so re-running the same
+    story or release reuses the previous response instead of calling the model.
+    Entries expire ``ttl_seconds`` after they were written, so a bad generation
+    is not replayed forever; expired files are deleted when next looked up.
+
+    File I/O is blocking, so async callers should run get() and put() in a thread.
+    """
+
+    def __init__(self, cache_dir: Path, ttl_seconds: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding one JSON file per cached response
+            ttl_seconds: Lifetime of an entry, or None to keep entries forever
+        """
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def make_key(
+        system_prompt: str,
+        user_message: str,
+        model: str,
+        temperature: float,
+        context: str = "",
+    ) -> str:
+        """
+        Compute the cache key for a prompt.
+
+        Args:
+            system_prompt: Agent system prompt
+            user_message: User's input
+            model: Model name
+            temperature: Sampling temperature
+            context: Rendered context message, if any
+
+        Returns:
+            Hex digest identifying the prompt
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (system_prompt, user_message, context, model, str(temperature)):
+            digest.update(part.encode())
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[LLMResponse]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached response, or None on a miss or an expired entry
+        """
+        path = self.cache_dir / f"{key}.json"
+        try:
+            if (
+                self.ttl_seconds is not None
+                and time.time() - path.stat().st_mtime > self.ttl_seconds
+            ):
+                path.unlink(missing_ok=True)
+                return None
+            data = orjson.loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable LLM cache entry {key}: {e}")
+            return None
+
+        return LLMResponse(
+            content=data["content"],
+            model=data["model"],
+            tokens_used=data.get("tokens_used"),
+            finish_reason=data.get("finish_reason"),
+        )
+
+    def put(self, key: str, response: LLMResponse) -> None:
+        """
+        Store a response, replacing any previous entry atomically.
+
+        Args:
+            key: Cache key from make_key()
+            response: Response to cache
+        """
+        payload = orjson.dumps({
+            "content": response.content,
+            "model": response.model,
+            "tokens_used": response.tokens_used,
+            "finish_reason": response.finish_reason,
+        })
+
+        tmp_path = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, self.cache_dir / f"{key}.json")
+            tmp_path = None
+        except OSError as e:
+            logger.warning(f"Failed to write LLM cache entry {key}: {e}")
+        finally:
+            # Only set if the entry was not moved into place
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
@@ -1,5 +1,8 @@
 """Factory for creating LLM providers."""
 
+from functools import lru_cache
+from typing import Optional
+
 from sdlc_agents.config import LLMProvider as LLMProviderType
 from sdlc_agents.config import settings
 from sdlc_agents.llm.base import LLMProvider
@@ -9,7 +12,10 @@ from sdlc_agents.llm.openai_provider import OpenAIProvider
 
 def get_llm_provider() -> LLMProvider:
     """
-    Create an LLM provider based on configuration.
+    Get the LLM provider for the current configuration.
+
+    Providers are shared, so every agent uses the same client and its pool of
+    open connections.
 
     Returns:
         Configured LLM provider instance
@@ -18,17 +24,58 @@ def get_llm_provider() -> LLMProvider:
         ValueError: If provider type is unsupported
     """
     if settings.llm_provider == LLMProviderType.OLLAMA:
-        return OllamaProvider(
-            base_url=settings.ollama_base_url,
-            model=settings.ollama_model,
+        return _ollama_provider(
+            settings.ollama_base_url,
+            settings.ollama_model,
+            settings.llm_max_concurrency,
+            settings.llm_requests_per_minute,
         )
     elif settings.llm_provider == LLMProviderType.OPENAI:
         if not settings.openai_api_key:
             raise ValueError("OpenAI API key not configured")
-        return OpenAIProvider(
-            api_key=settings.openai_api_key,
-            model=settings.openai_model,
-            base_url=settings.openai_base_url,
+        return _openai_provider(
+            settings.openai_api_key,
+            settings.openai_model,
+            settings.openai_base_url,
+            settings.llm_max_concurrency,
+            settings.llm_requests_per_minute,
         )
     else:
         raise ValueError(f"Unsupported LLM provider: {settings.llm_provider}")
+
+
+def reset_llm_provider() -> None:
+    """Forget the shared providers, so the next get_llm_provider() builds new ones."""
+    _ollama_provider.cache_clear()
+    _openai_provider.cache_clear()
+
+
+@lru_cache(maxsize=4)
+def _ollama_provider(
+    base_url: str, model: str, max_concurrency: int, requests_per_minute: Optional[int]
+) -> OllamaProvider:
+    """Create the shared Ollama provider for a server, model and request limits."""
+    return OllamaProvider(
+        base_url=base_url,
+        model=model,
+        max_concurrency=max_concurrency,
+        requests_per_minute=requests_per_minute,
+    )
+
+
+@lru_cache(maxsize=4)
+def _openai_provider(
+    api_key: str,
+    model: str,
+    base_url: Optional[str],
+    max_concurrency: int,
+    requests_per_minute: Optional[int],
+) -> OpenAIProvider:
+    """Create the shared OpenAI provider for a key, model, endpoint and request limits."""
+    return OpenAIProvider(
+        api_key=api_key,
+        model=model,
+        base_url=base_url,
+        max_concurrency=max_concurrency,
+        requests_per_minute=requests_per_minute,
+    )
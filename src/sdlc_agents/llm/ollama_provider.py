@@ -4,30 +4,92 @@ import asyncio
 from typing import Any, AsyncIterator, Optional
 
 import aiohttp
-
-from sdlc_agents.llm.base import LLMMessage, LLMProvider, LLMResponse, MessageRole
+import orjson
+
+from sdlc_agents.circuit_breaker import CircuitBreaker, is_outage_status
+from sdlc_agents.llm.base import (
+    LLMMessage,
+    LLMProvider,
+    LLMResponse,
+    MessageEncoder,
+    MessageRole,
+    RequestLimiter,
+)
 from sdlc_agents.logging_config import logger
 
+# Pool tuned for bursts of concurrent requests to one (usually local) server
+_CONNECTOR_LIMIT = 100
+_CONNECTOR_LIMIT_PER_HOST = 32
+_KEEPALIVE_SECONDS = 60
+_DNS_CACHE_SECONDS = 300
+_TIMEOUT = aiohttp.ClientTimeout(total=300, sock_connect=5)
+
+
+def _chunk_content(line: bytes) -> Optional[str]:
+    """
+    Extract the generated text from one NDJSON line of an Ollama stream.
+
+    Args:
+        line: Raw line without its newline
+
+    Returns:
+        Message content, or None for blank, malformed or content-less lines
+    """
+    if not line.strip():
+        return None
+    try:
+        data = orjson.loads(line)
+    except orjson.JSONDecodeError:
+        return None
+    message = data.get("message")
+    return message.get("content") if message else None
+
+
+def _is_outage(exc: Exception) -> bool:
+    """Whether a request error means the server is down or overloaded, not the request bad."""
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return is_outage_status(exc.status)
+    return isinstance(exc, (aiohttp.ClientError, asyncio.TimeoutError))
+
 
 class OllamaProvider(LLMProvider):
     """LLM provider for Ollama."""
 
-    def __init__(self, base_url: str, model: str):
+    def __init__(
+        self,
+        base_url: str,
+        model: str,
+        max_concurrency: int = 10,
+        requests_per_minute: Optional[int] = None,
+    ):
         """
         Initialize Ollama provider.
 
         Args:
             base_url: Base URL for Ollama API
             model: Model name to use
+            max_concurrency: Maximum concurrent requests to the server
+            requests_per_minute: Optional cap on requests per minute
         """
         self.base_url = base_url.rstrip("/")
         self.model = model
         self.session: Optional[aiohttp.ClientSession] = None
+        self._limiter = RequestLimiter(max_concurrency, requests_per_minute)
+        self._encoder = MessageEncoder()
+        self._breaker = CircuitBreaker("Ollama", is_failure=_is_outage)
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session."""
         if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession()
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=_CONNECTOR_LIMIT,
+                    limit_per_host=_CONNECTOR_LIMIT_PER_HOST,
+                    keepalive_timeout=_KEEPALIVE_SECONDS,
+                    ttl_dns_cache=_DNS_CACHE_SECONDS,
+                ),
+                timeout=_TIMEOUT,
+            )
         return self.session
 
     async def generate(
@@ -41,9 +103,7 @@ class OllamaProvider(LLMProvider):
         session = await self._get_session()
 
         # Convert messages to Ollama format
-        ollama_messages = [
-            {"role": msg.role.value, "content": msg.content} for msg in messages
-        ]
+        ollama_messages = self._encoder.encode(messages)
 
         payload = {
             "model": self.model,
@@ -61,23 +121,24 @@ class OllamaProvider(LLMProvider):
         if kwargs:
             payload["options"].update(kwargs)
 
-        try:
-            async with session.post(
-                f"{self.base_url}/api/chat", json=payload
-            ) as response:
-                response.raise_for_status()
-                data = await response.json()
-
-                return LLMResponse(
-                    content=data["message"]["content"],
-                    model=data.get("model", self.model),
-                    tokens_used=data.get("eval_count"),
-                    finish_reason=data.get("done_reason"),
-                    raw_response=data,
-                )
-        except Exception as e:
-            logger.error(f"Ollama generation failed: {e}")
-            raise
+        async with self._breaker, self._limiter:
+            try:
+                async with session.post(
+                    f"{self.base_url}/api/chat", json=payload
+                ) as response:
+                    response.raise_for_status()
+                    data = await response.json()
+
+                    return LLMResponse(
+                        content=data["message"]["content"],
+                        model=data.get("model", self.model),
+                        tokens_used=data.get("eval_count"),
+                        finish_reason=data.get("done_reason"),
+                        raw_response=data,
+                    )
+            except Exception as e:
+                logger.error("Ollama generation failed: %s", e)
+                raise
 
     async def stream_generate(
         self,
@@ -89,9 +150,7 @@ class OllamaProvider(LLMProvider):
         """Stream responses from Ollama."""
         session = await self._get_session()
 
-        ollama_messages = [
-            {"role": msg.role.value, "content": msg.content} for msg in messages
-        ]
+        ollama_messages = self._encoder.encode(messages)
 
         payload = {
             "model": self.model,
@@ -108,25 +167,31 @@ class OllamaProvider(LLMProvider):
         if kwargs:
             payload["options"].update(kwargs)
 
-        try:
-            async with session.post(
-                f"{self.base_url}/api/chat", json=payload
-            ) as response:
-                response.raise_for_status()
-
-                async for line in response.content:
-                    if line:
-                        import json
-
-                        try:
-                            data = json.loads(line)
-                            if "message" in data and "content" in data["message"]:
-                                yield data["message"]["content"]
-                        except json.JSONDecodeError:
-                            continue
-        except Exception as e:
-            logger.error(f"Ollama streaming failed: {e}")
-            raise
+        async with self._limiter:
+            try:
+                async with session.post(
+                    f"{self.base_url}/api/chat", json=payload
+                ) as response:
+                    response.raise_for_status()
+
+                    # Split NDJSON from raw chunks rather than aiohttp's readline
+                    buf = bytearray()
+                    async for chunk in response.content.iter_any():
+                        buf += chunk
+                        start = 0
+                        while (end := buf.find(b"\n", start)) != -1:
+                            content = _chunk_content(bytes(buf[start:end]))
+                            if content is not None:
+                                yield content
+                            start = end + 1
+                        del buf[:start]
+
+                    content = _chunk_content(bytes(buf))
+                    if content is not None:
+                        yield content
+            except Exception as e:
+                logger.error("Ollama streaming failed: %s", e)
+                raise
 
     async def health_check(self) -> bool:
         """Check if Ollama is available."""
@@ -135,7 +200,7 @@ class OllamaProvider(LLMProvider):
             async with session.get(f"{self.base_url}/api/tags") as response:
                 return response.status == 200
         except Exception as e:
-            logger.error(f"Ollama health check failed: {e}")
+            logger.error("Ollama health check failed: %s", e)
             return False
 
     async def close(self) -> None:
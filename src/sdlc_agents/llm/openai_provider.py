@@ -1,17 +1,59 @@
 """OpenAI and OpenAI-compatible LLM provider implementation."""
 
+import asyncio
+import time
 from typing import Any, AsyncIterator, Optional
 
-from openai import AsyncOpenAI
+import httpx
+import orjson
+from openai import DEFAULT_TIMEOUT, APIConnectionError, APIStatusError, AsyncOpenAI
 
-from sdlc_agents.llm.base import LLMMessage, LLMProvider, LLMResponse, MessageRole
+from sdlc_agents.circuit_breaker import CircuitBreaker, is_outage_status
+from sdlc_agents.llm.base import (
+    LLMMessage,
+    LLMProvider,
+    LLMResponse,
+    MessageEncoder,
+    MessageRole,
+    RequestLimiter,
+)
 from sdlc_agents.logging_config import logger
 
+# Retries on connection errors, 429 and 5xx, with the SDK's exponential backoff
+_MAX_RETRIES = 3
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+# The SDK's own default: long non-streaming completions need its 600s read timeout
+_HTTP_TIMEOUT = DEFAULT_TIMEOUT
+
+# Health checks look up the configured model only, and reuse the result briefly
+_HEALTH_TIMEOUT = 5.0
+_HEALTH_TTL_SECONDS = 30.0
+
+# Batch API job settings
+_BATCH_ENDPOINT = "/v1/chat/completions"
+_BATCH_POLL_SECONDS = 30.0
+_BATCH_FINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+def _is_outage(exc: Exception) -> bool:
+    """Whether an API error means the service is down or overloaded, not the request bad."""
+    if isinstance(exc, APIStatusError):
+        return is_outage_status(exc.status_code)
+    # Includes timeouts
+    return isinstance(exc, (APIConnectionError, httpx.TransportError))
+
 
 class OpenAIProvider(LLMProvider):
     """LLM provider for OpenAI and OpenAI-compatible APIs."""
 
-    def __init__(self, api_key: str, model: str, base_url: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        base_url: Optional[str] = None,
+        max_concurrency: int = 10,
+        requests_per_minute: Optional[int] = None,
+    ):
         """
         Initialize OpenAI provider.
 
@@ -19,11 +61,20 @@ class OpenAIProvider(LLMProvider):
             api_key: OpenAI API key
             model: Model name to use
             base_url: Optional base URL for OpenAI-compatible APIs
+            max_concurrency: Maximum concurrent requests to the API
+            requests_per_minute: Optional cap on requests per minute
         """
         self.model = model
+        self._limiter = RequestLimiter(max_concurrency, requests_per_minute)
+        self._encoder = MessageEncoder()
+        self._breaker = CircuitBreaker("OpenAI", is_failure=_is_outage)
+        # (monotonic expiry, result) of the last health check
+        self._health: Optional[tuple[float, bool]] = None
         self.client = AsyncOpenAI(
             api_key=api_key,
             base_url=base_url,
+            max_retries=_MAX_RETRIES,
+            http_client=httpx.AsyncClient(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT),
         )
 
     async def generate(
@@ -35,29 +86,28 @@ class OpenAIProvider(LLMProvider):
     ) -> LLMResponse:
         """Generate response using OpenAI."""
         # Convert messages to OpenAI format
-        openai_messages = [
-            {"role": msg.role.value, "content": msg.content} for msg in messages
-        ]
+        openai_messages = self._encoder.encode(messages)
 
-        try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=openai_messages,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                **kwargs,
-            )
+        async with self._breaker, self._limiter:
+            try:
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=openai_messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    **kwargs,
+                )
 
-            return LLMResponse(
-                content=response.choices[0].message.content or "",
-                model=response.model,
-                tokens_used=response.usage.total_tokens if response.usage else None,
-                finish_reason=response.choices[0].finish_reason,
-                raw_response=response.model_dump(),
-            )
-        except Exception as e:
-            logger.error(f"OpenAI generation failed: {e}")
-            raise
+                return LLMResponse(
+                    content=response.choices[0].message.content or "",
+                    model=response.model,
+                    tokens_used=response.usage.total_tokens if response.usage else None,
+                    finish_reason=response.choices[0].finish_reason,
+                    raw_source=response,
+                )
+            except Exception as e:
+                logger.error("OpenAI generation failed: %s", e)
+                raise
 
     async def stream_generate(
         self,
@@ -67,35 +117,129 @@ class OpenAIProvider(LLMProvider):
         **kwargs: Any,
     ) -> AsyncIterator[str]:
         """Stream responses from OpenAI."""
-        openai_messages = [
-            {"role": msg.role.value, "content": msg.content} for msg in messages
-        ]
+        openai_messages = self._encoder.encode(messages)
 
-        try:
-            stream = await self.client.chat.completions.create(
-                model=self.model,
-                messages=openai_messages,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                stream=True,
+        async with self._limiter:
+            try:
+                stream = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=openai_messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    stream=True,
+                    **kwargs,
+                )
+
+                async for chunk in stream:
+                    if chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+            except Exception as e:
+                logger.error("OpenAI streaming failed: %s", e)
+                raise
+
+    async def generate_batch_job(
+        self,
+        batch: list[list[LLMMessage]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        poll_interval: float = _BATCH_POLL_SECONDS,
+        **kwargs: Any,
+    ) -> list[LLMResponse]:
+        """
+        Generate responses for many conversations through the Batch API.
+
+        Batch jobs run against a separate, larger quota at reduced cost but may
+        take up to 24 hours, so use this only for offline work such as bulk story
+        generation; interactive paths should keep using generate_batch().
+
+        Args:
+            batch: One conversation history per request
+            temperature: Sampling temperature (0.0 to 1.0)
+            max_tokens: Maximum tokens to generate
+            poll_interval: Seconds between job status checks
+            **kwargs: Additional chat completion parameters
+
+        Returns:
+            One LLMResponse per conversation, in input order
+
+        Raises:
+            RuntimeError: If the job does not complete or a request in it fails
+        """
+        lines = []
+        for index, messages in enumerate(batch):
+            body = {
+                "model": self.model,
+                "messages": self._encoder.encode(messages),
+                "temperature": temperature,
                 **kwargs,
+            }
+            if max_tokens is not None:
+                body["max_tokens"] = max_tokens
+            lines.append(orjson.dumps({
+                "custom_id": str(index),
+                "method": "POST",
+                "url": _BATCH_ENDPOINT,
+                "body": body,
+            }))
+
+        input_file = await self.client.files.create(
+            file=("batch.jsonl", b"\n".join(lines)), purpose="batch"
+        )
+        job = await self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=_BATCH_ENDPOINT,
+            completion_window="24h",
+        )
+        logger.info("Submitted OpenAI batch %s with %s requests", job.id, len(batch))
+
+        while job.status not in _BATCH_FINAL_STATUSES:
+            await asyncio.sleep(poll_interval)
+            job = await self.client.batches.retrieve(job.id)
+
+        if job.status != "completed" or not job.output_file_id:
+            raise RuntimeError(f"OpenAI batch {job.id} ended with status {job.status}")
+
+        output = await self.client.files.content(job.output_file_id)
+        responses: list[Optional[LLMResponse]] = [None] * len(batch)
+        for line in output.content.splitlines():
+            if not line:
+                continue
+            result = orjson.loads(line)
+            response = result.get("response") or {}
+            if response.get("status_code") != 200:
+                continue
+            completion = response["body"]
+            choice = completion["choices"][0]
+            usage = completion.get("usage")
+            responses[int(result["custom_id"])] = LLMResponse(
+                content=choice["message"].get("content") or "",
+                model=completion["model"],
+                tokens_used=usage["total_tokens"] if usage else None,
+                finish_reason=choice.get("finish_reason"),
+                raw_response=completion,
             )
 
-            async for chunk in stream:
-                if chunk.choices[0].delta.content:
-                    yield chunk.choices[0].delta.content
-        except Exception as e:
-            logger.error(f"OpenAI streaming failed: {e}")
-            raise
+        failed = [index for index, response in enumerate(responses) if response is None]
+        if failed:
+            raise RuntimeError(f"OpenAI batch {job.id} failed for requests {failed}")
+
+        return responses  # type: ignore[return-value]
 
     async def health_check(self) -> bool:
-        """Check if OpenAI API is available."""
+        """Check if OpenAI API is available and serves the configured model."""
+        now = time.monotonic()
+        if self._health is not None and self._health[0] > now:
+            return self._health[1]
+
         try:
-            await self.client.models.list()
-            return True
+            await self.client.models.retrieve(self.model, timeout=_HEALTH_TIMEOUT)
+            healthy = True
         except Exception as e:
-            logger.error(f"OpenAI health check failed: {e}")
-            return False
+            logger.error("OpenAI health check failed: %s", e)
+            healthy = False
+
+        self._health = (now + _HEALTH_TTL_SECONDS, healthy)
+        return healthy
 
     async def close(self) -> None:
         """Close the OpenAI client."""
@@ -1,17 +1,47 @@
 """Logging configuration for SDLC agents."""
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import Optional
 
 from rich.console import Console
 from rich.logging import RichHandler
 
 from sdlc_agents.config import settings
 
+# Background thread writing queued records to the console and log file
+_listener: Optional[QueueListener] = None
+
+
+class _LocalQueueHandler(QueueHandler):
+    """Queue handler for an in-process listener."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Pass records through untouched so rich tracebacks keep their frames."""
+        return record
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
 
 def setup_logging() -> logging.Logger:
-    """Configure logging with rich output and file handler."""
+    """
+    Configure logging with rich output and file handler.
+
+    Records are queued and written by a background thread, so logging from async
+    code never blocks the event loop on terminal or disk I/O. Called by the CLI
+    once a command runs, so importing the package doesn't load settings.
+    """
+    global _listener
     # Create logs directory
     log_path = Path(settings.log_file)
     log_path.parent.mkdir(parents=True, exist_ok=True)
@@ -22,15 +52,18 @@ def setup_logging() -> logging.Logger:
 
     # Remove existing handlers
     logger.handlers.clear()
+    _stop_listener()
 
-    # Rich console handler for terminal output
+    # Rich console handler for terminal output; outside debug mode only warnings
+    # and errors are rendered, and tracebacks skip the costly locals dump
     console_handler = RichHandler(
         console=Console(stderr=True),
         rich_tracebacks=True,
-        tracebacks_show_locals=True,
+        tracebacks_show_locals=settings.debug,
     )
     console_handler.setFormatter(logging.Formatter("%(message)s"))
-    logger.addHandler(console_handler)
+    if not settings.debug:
+        console_handler.setLevel(logging.WARNING)
 
     # File handler for persistent logs
     file_handler = logging.FileHandler(log_path)
@@ -40,10 +73,17 @@ def setup_logging() -> logging.Logger:
             datefmt="%Y-%m-%d %H:%M:%S",
         )
     )
-    logger.addHandler(file_handler)
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    logger.addHandler(_LocalQueueHandler(log_queue))
+    _listener = QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    _listener.start()
 
     return logger
 
 
-# Global logger instance
-logger = setup_logging()
+# Global logger instance; handlers are attached by setup_logging()
+logger = logging.getLogger("sdlc_agents")
+atexit.register(_stop_listener)
@@ -1,5 +1,5 @@
 """Agent memory system using ClickHouse."""
 
-from sdlc_agents.memory.clickhouse_memory import ClickHouseMemory, MemoryEntry
+from sdlc_agents.memory.clickhouse_memory import ClickHouseMemory, MemoryEntry, get_default_memory
 
-__all__ = ["ClickHouseMemory", "MemoryEntry"]
+__all__ = ["ClickHouseMemory", "MemoryEntry", "get_default_memory"]
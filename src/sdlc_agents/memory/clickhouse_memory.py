@@ -1,26 +1,446 @@
 """ClickHouse-based persistent memory for agents."""
 
-import json
-from dataclasses import dataclass
+import asyncio
+import atexit
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Optional
+from operator import itemgetter
+from typing import Any, Callable, Iterable, Optional, Sequence
 
 import clickhouse_connect
+import orjson
+from clickhouse_connect.driver.httputil import get_pool_manager
 
 from sdlc_agents.config import settings
 from sdlc_agents.logging_config import logger
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryEntry:
     """A single memory entry."""
 
     agent_id: str
-    timestamp: datetime
+    timestamp: int  # nanoseconds since the Unix epoch (UTC)
     memory_type: str  # conversation, decision, observation, action, result
     content: str
-    metadata: dict[str, Any]
+    metadata: dict[str, Any]  # read back with string values (agent_memory is a Map)
     session_id: Optional[str] = None
+    preview_len: int = field(default=200, repr=False)
+    content_preview: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        """Truncate the content preview once, at creation time."""
+        if self.content_preview is None:
+            self.content_preview = self.content[: self.preview_len]
+
+
+_pool_manager = None
+_default_memory: Optional["ClickHouseMemory"] = None
+# (host, port, database) whose schema this process has already created
+_initialized_schemas: set[tuple[str, int, str]] = set()
+
+
+def _dumps(value: Any) -> str:
+    """Serialize a value to a JSON string, converting non-string keys like json.dumps."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _get_pool_manager():
+    """Get the HTTP connection pool shared by all ClickHouse clients."""
+    global _pool_manager
+    if _pool_manager is None:
+        _pool_manager = get_pool_manager(maxsize=16)
+    return _pool_manager
+
+
+MEMORY_COLUMNS = (
+    "agent_id",
+    "timestamp",
+    "memory_type",
+    "content",
+    "content_preview",
+    "metadata",
+    "session_id",
+)
+
+ACTION_COLUMNS = (
+    "agent_id",
+    "timestamp",
+    "action_type",
+    "target",
+    "parameters",
+    "result",
+    "success",
+    "duration_ms",
+    "session_id",
+)
+
+WORK_ITEM_COLUMNS = (
+    "work_item_id",
+    "timestamp",
+    "item_type",
+    "title",
+    "description",
+    "state",
+    "assigned_agent",
+    "metadata",
+)
+
+# Characters with a special meaning in LIKE patterns
+_LIKE_SPECIAL_RE = re.compile(r"[\\%_]")
+
+# One buffered row, in its table's column order
+Row = tuple[Any, ...]
+
+# Batches are sorted by the table's ORDER BY key so the server can skip its sort
+LOG_SORT_KEY = itemgetter(0, 1)  # agent_memory/agent_actions: (agent_id, timestamp)
+WORK_ITEM_SORT_KEY = itemgetter(0)  # work_items: work_item_id; stable, keeps update order
+
+
+# Server-side batching for the append-only log tables: the server queues each insert and
+# coalesces them into parts, and the client doesn't wait for that. Nothing reads these
+# rows back right away, so the lost read-after-write and insert errors are acceptable.
+ASYNC_INSERT_SETTINGS = {
+    "async_insert": 1,
+    "wait_for_async_insert": 0,
+    "async_insert_max_data_size": 10_000_000,
+    "async_insert_busy_timeout_ms": 1000,
+}
+
+
+def _insert_batch(
+    client: Any,
+    table: str,
+    rows: list[Row],
+    column_names: Sequence[str],
+    insert_settings: Optional[dict[str, Any]],
+    sort_key: Optional[Callable[[Row], Any]],
+) -> None:
+    """
+    Insert buffered rows as one column-oriented batch, logging failures.
+
+    Args:
+        client: ClickHouse client
+        table: Fully qualified table name
+        rows: Rows to insert; sorted in place when sort_key is given
+        column_names: Column order of the rows
+        insert_settings: ClickHouse settings sent with the insert
+        sort_key: Key that orders the batch by the table's sorting key
+    """
+    if not rows:
+        return
+    if sort_key is not None:
+        rows.sort(key=sort_key)
+    # Transposed once here so clickhouse-connect doesn't walk the rows cell by cell
+    columns = [list(column) for column in zip(*rows)]
+    try:
+        client.insert(
+            table,
+            columns,
+            column_names=column_names,
+            column_oriented=True,
+            settings=insert_settings,
+        )
+    except Exception as e:
+        logger.error(f"Failed to flush {len(rows)} rows to {table}: {e}")
+
+
+class BufferedWriter:
+    """
+    Buffer rows for one table from synchronous callers and insert them in batches.
+
+    Rows are flushed as a single insert once ``max_rows`` are queued or, from a
+    background timer, ``flush_interval`` seconds after the first buffered row.
+    Timed flushes are held back until ``min_interval`` seconds have passed since
+    the last insert, keeping the table at about one insert per second as
+    ClickHouse recommends. Safe to use from several threads.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        table: str,
+        column_names: Sequence[str],
+        max_rows: int = 10_000,
+        flush_interval: float = 1.0,
+        insert_settings: Optional[dict[str, Any]] = None,
+        sort_key: Optional[Callable[[Row], Any]] = None,
+        min_interval: float = 1.0,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            client: ClickHouse client
+            table: Fully qualified table name
+            column_names: Column order of buffered rows
+            max_rows: Flush as soon as this many rows are buffered
+            flush_interval: Maximum seconds a row waits before being flushed
+            insert_settings: ClickHouse settings sent with each insert
+            sort_key: Key that orders a batch by the table's sorting key
+            min_interval: Minimum seconds between timed inserts into the table
+        """
+        self.client = client
+        self.table = table
+        self.column_names = column_names
+        self.max_rows = max_rows
+        self.flush_interval = flush_interval
+        self.insert_settings = insert_settings
+        self.sort_key = sort_key
+        self.min_interval = min_interval
+        # time.monotonic() of the last insert
+        self.last_flush = 0.0
+        self._rows: deque[Row] = deque()
+        self._lock = threading.Lock()
+        # Serializes inserts so batches reach ClickHouse in buffer order
+        self._insert_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+    def put(self, row: Row) -> None:
+        """Buffer a row, flushing if the buffer is full."""
+        with self._lock:
+            self._rows.append(row)
+            full = len(self._rows) >= self.max_rows
+            if not full and self._timer is None:
+                self._start_timer(self.flush_interval)
+        if full:
+            self.flush()
+
+    @property
+    def buffer_len(self) -> int:
+        """Number of rows waiting to be inserted."""
+        return len(self._rows)
+
+    def _start_timer(self, delay: float) -> None:
+        """Schedule a timed flush; the caller holds the buffer lock."""
+        self._timer = threading.Timer(delay, self._flush_due)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _flush_due(self) -> None:
+        """Flush from the timer, unless the table was written too recently."""
+        with self._lock:
+            wait = self.last_flush + self.min_interval - time.monotonic()
+            if wait > 0 and len(self._rows) < self.max_rows:
+                logger.debug(
+                    f"Deferring flush of {len(self._rows)} rows to {self.table} by {wait:.2f}s"
+                )
+                self._start_timer(wait)
+                return
+        self.flush()
+
+    def flush(self) -> None:
+        """Insert everything buffered so far."""
+        with self._insert_lock:
+            with self._lock:
+                rows = list(self._rows)
+                self._rows.clear()
+                timer, self._timer = self._timer, None
+            if timer is not None and timer is not threading.current_thread():
+                timer.cancel()
+            if not rows:
+                return
+            _insert_batch(
+                self.client,
+                self.table,
+                rows,
+                self.column_names,
+                self.insert_settings,
+                self.sort_key,
+            )
+            self.last_flush = time.monotonic()
+            logger.debug(
+                f"Flushed {len(rows)} rows to {self.table}, {self.buffer_len} still buffered"
+            )
+
+
+class AsyncBufferedWriter:
+    """
+    Buffer rows for one table and insert them in batches.
+
+    Rows are flushed as a single insert once ``max_rows`` are queued or
+    ``flush_interval`` seconds after the first buffered row, whichever comes first.
+    As with BufferedWriter, timed flushes wait out ``min_interval`` since the last insert.
+    Inserts run in a worker thread so the event loop keeps serving other tasks meanwhile.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        table: str,
+        column_names: Sequence[str],
+        max_rows: int = 512,
+        flush_interval: float = 0.5,
+        insert_settings: Optional[dict[str, Any]] = None,
+        sort_key: Optional[Callable[[Row], Any]] = None,
+        min_interval: float = 1.0,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            client: ClickHouse client
+            table: Fully qualified table name
+            column_names: Column order of buffered rows
+            max_rows: Flush as soon as this many rows are buffered
+            flush_interval: Maximum seconds a row waits before being flushed
+            insert_settings: ClickHouse settings sent with each insert
+            sort_key: Key that orders a batch by the table's sorting key
+            min_interval: Minimum seconds between timed inserts into the table
+        """
+        self.client = client
+        self.table = table
+        self.column_names = column_names
+        self.max_rows = max_rows
+        self.flush_interval = flush_interval
+        self.insert_settings = insert_settings
+        self.sort_key = sort_key
+        self.min_interval = min_interval
+        # time.monotonic() of the last insert
+        self.last_flush = 0.0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue[Row]] = None
+        self._task: Optional[asyncio.Task] = None
+        self._batch: list[Row] = []
+
+    def put_nowait(self, row: Row) -> None:
+        """Buffer a row, starting the flush loop on first use."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Rows buffered on a previous loop are carried over to this one
+            pending = self._take_pending()
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._task = None
+            for pending_row in pending:
+                self._queue.put_nowait(pending_row)
+
+        self._queue.put_nowait(row)
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        """Collect buffered rows into batches until the queue is empty."""
+        loop = asyncio.get_running_loop()
+
+        while not self._queue.empty():
+            self._batch.append(self._queue.get_nowait())
+            holdoff = self.last_flush + self.min_interval - time.monotonic()
+            deadline = loop.time() + max(self.flush_interval, holdoff)
+
+            while len(self._batch) < self.max_rows:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    self._batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            rows, self._batch = self._batch, []
+            await self._insert(rows)
+
+    def _take_pending(self) -> list[Row]:
+        """Remove and return every row not yet inserted."""
+        rows, self._batch = self._batch, []
+        while self._queue is not None and not self._queue.empty():
+            rows.append(self._queue.get_nowait())
+        return rows
+
+    async def _insert(self, rows: list[Row]) -> None:
+        """Insert rows as one batch, in a worker thread."""
+        if not rows:
+            return
+        await asyncio.to_thread(
+            _insert_batch,
+            self.client,
+            self.table,
+            rows,
+            self.column_names,
+            self.insert_settings,
+            self.sort_key,
+        )
+        self.last_flush = time.monotonic()
+        logger.debug(f"Flushed {len(rows)} rows to {self.table}")
+
+    async def flush(self) -> None:
+        """Insert everything buffered so far."""
+        await self._insert(self._take_pending())
+
+    async def close(self) -> None:
+        """Flush remaining rows and stop the flush loop."""
+        await self.flush()
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+
+# Statistics windows start on a bucket boundary, so identical calls within a bucket have
+# identical query text (no now()) and can be answered from the server's query cache
+_STATS_BUCKET_SECONDS = 60
+_STATS_QUERY_SETTINGS = {
+    "use_query_cache": 1,
+    "query_cache_ttl": _STATS_BUCKET_SECONDS,
+    "query_cache_share_between_users": 1,
+}
+
+# Read queries; {db} is filled in once per ClickHouseMemory, values are bound per call
+_QUERIES = {
+    "recent_memories": """
+    SELECT agent_id, toUnixTimestamp64Nano(timestamp), memory_type, content,
+           content_preview, metadata, session_id
+    FROM {db}.agent_memory
+    WHERE agent_id = %(agent_id)s
+      AND timestamp > now() - INTERVAL %(hours)s HOUR
+    """,
+    "agent_statistics": """
+    SELECT
+        action_type,
+        count() as count,
+        avg(duration_ms) as avg_duration,
+        sum(success) as successful,
+        sum(NOT success) as failed
+    FROM {db}.agent_actions
+    WHERE agent_id = %(agent_id)s
+      AND timestamp > fromUnixTimestamp(%(since)s)
+    GROUP BY action_type
+    """,
+    # Latest version in one aggregation pass, whether or not the versions were merged yet
+    "work_item": """
+    SELECT work_item_id, max(timestamp), argMax(item_type, timestamp),
+           argMax(title, timestamp), argMax(description, timestamp),
+           argMax(state, timestamp), argMax(assigned_agent, timestamp),
+           argMax(metadata, timestamp)
+    FROM {db}.work_items
+    WHERE work_item_id = %(work_item_id)s
+    GROUP BY work_item_id
+    """,
+    "cached_analysis": """
+    SELECT analysis
+    FROM {db}.build_analysis_cache
+    WHERE fingerprint = %(fingerprint)s
+      AND expires_at > now()
+    ORDER BY created_at DESC
+    LIMIT 1
+    """,
+    "search_memories": """
+    SELECT agent_id, toUnixTimestamp64Nano(timestamp), memory_type, content,
+           content_preview, metadata, session_id
+    FROM {db}.agent_memory
+    WHERE agent_id = %(agent_id)s
+      AND lowerUTF8(content) LIKE %(pattern)s
+    ORDER BY timestamp DESC
+    LIMIT %(limit)s
+    """,
+}
 
 
 class ClickHouseMemory:
@@ -34,8 +454,65 @@ class ClickHouseMemory:
             username=settings.clickhouse_user,
             password=settings.clickhouse_password,
             database=settings.clickhouse_database,
+            pool_mgr=_get_pool_manager(),
+            # Agents share one client across tasks; sessions would serialize queries
+            autogenerate_session_id=False,
+            # Pin the codec for request bodies and results instead of negotiating one
+            compress=settings.clickhouse_compression,
         )
-        self._initialize_schema()
+        # The DDL is idempotent, so later instances skip its round-trips
+        schema_key = (
+            settings.clickhouse_host,
+            settings.clickhouse_port,
+            settings.clickhouse_database,
+        )
+        if schema_key not in _initialized_schemas:
+            self._initialize_schema()
+            _initialized_schemas.add(schema_key)
+
+        # Fully qualified names and SQL are built once rather than on every call
+        database = settings.clickhouse_database
+        self._analysis_table = f"{database}.build_analysis_cache"
+        self._queries = {name: sql.format(db=database) for name, sql in _QUERIES.items()}
+
+        self._memory_writer = AsyncBufferedWriter(
+            self.client,
+            f"{database}.agent_memory",
+            MEMORY_COLUMNS,
+            insert_settings=ASYNC_INSERT_SETTINGS,
+            sort_key=LOG_SORT_KEY,
+        )
+        self._action_writer = AsyncBufferedWriter(
+            self.client,
+            f"{database}.agent_actions",
+            ACTION_COLUMNS,
+            insert_settings=ASYNC_INSERT_SETTINGS,
+            sort_key=LOG_SORT_KEY,
+        )
+
+        # Synchronous callers share batched inserts the same way
+        batch_options = {
+            "max_rows": settings.clickhouse_batch_size,
+            "flush_interval": settings.clickhouse_flush_interval_ms / 1000,
+        }
+        self._writers = {
+            name: BufferedWriter(
+                self.client,
+                f"{database}.{name}",
+                columns,
+                insert_settings=insert_settings,
+                sort_key=sort_key,
+                **batch_options,
+            )
+            for name, columns, insert_settings, sort_key in (
+                ("agent_memory", MEMORY_COLUMNS, ASYNC_INSERT_SETTINGS, LOG_SORT_KEY),
+                ("agent_actions", ACTION_COLUMNS, ASYNC_INSERT_SETTINGS, LOG_SORT_KEY),
+                # Work items are read back by ID: synchronous inserts, and
+                # get_work_item flushes this buffer before querying
+                ("work_items", WORK_ITEM_COLUMNS, None, WORK_ITEM_SORT_KEY),
+            )
+        }
+        atexit.register(self.flush_buffered)
 
     def _initialize_schema(self) -> None:
         """Create necessary tables if they don't exist."""
@@ -51,15 +528,31 @@ class ClickHouseMemory:
                 timestamp DateTime64(3),
                 memory_type LowCardinality(String),
                 content String,
-                metadata String,
+                content_preview String,
+                metadata Map(LowCardinality(String), String),
                 session_id Nullable(String),
                 INDEX idx_agent_id agent_id TYPE bloom_filter(0.01) GRANULARITY 1,
-                INDEX idx_session_id session_id TYPE bloom_filter(0.01) GRANULARITY 1
+                INDEX idx_session_id session_id TYPE bloom_filter(0.01) GRANULARITY 1,
+                INDEX idx_content_ngram lowerUTF8(content) TYPE ngrambf_v1(3, 256, 2, 0)
+                    GRANULARITY 4
             ) ENGINE = MergeTree()
             ORDER BY (agent_id, timestamp)
             TTL timestamp + INTERVAL {settings.agent_memory_retention_days} DAY
             SETTINGS index_granularity = 8192
         """)
+        self.client.command(f"""
+            ALTER TABLE {settings.clickhouse_database}.agent_memory
+            ADD COLUMN IF NOT EXISTS content_preview String
+            DEFAULT substring(content, 1, 200) AFTER content
+        """)
+        self._migrate_memory_metadata()
+        # Lets search_memories skip granules that can't contain the search text;
+        # parts written before the index existed are still scanned
+        self.client.command(f"""
+            ALTER TABLE {settings.clickhouse_database}.agent_memory
+            ADD INDEX IF NOT EXISTS idx_content_ngram lowerUTF8(content)
+            TYPE ngrambf_v1(3, 256, 2, 0) GRANULARITY 4
+        """)
 
         # Agent actions table for tracking what agents did
         self.client.command(f"""
@@ -93,32 +586,76 @@ class ClickHouseMemory:
             ORDER BY work_item_id
         """)
 
+        # Build failure analyses keyed by normalized log fingerprint
+        self.client.command(f"""
+            CREATE TABLE IF NOT EXISTS {settings.clickhouse_database}.build_analysis_cache (
+                fingerprint String,
+                created_at DateTime64(3),
+                expires_at DateTime,
+                analysis String
+            ) ENGINE = ReplacingMergeTree(created_at)
+            ORDER BY fingerprint
+            TTL expires_at
+        """)
+
         logger.info("ClickHouse schema initialized")
 
-    def store_memory(self, entry: MemoryEntry) -> None:
-        """Store a memory entry."""
-        self.client.insert(
-            f"{settings.clickhouse_database}.agent_memory",
-            [
-                [
-                    entry.agent_id,
-                    entry.timestamp,
-                    entry.memory_type,
-                    entry.content,
-                    json.dumps(entry.metadata),
-                    entry.session_id,
-                ]
-            ],
-            column_names=[
-                "agent_id",
-                "timestamp",
-                "memory_type",
-                "content",
-                "metadata",
-                "session_id",
-            ],
+    def _migrate_memory_metadata(self) -> None:
+        """Replace a JSON String agent_memory.metadata column from older schemas with a Map."""
+        column_type = self.client.command(
+            "SELECT type FROM system.columns "
+            "WHERE database = %(database)s AND table = 'agent_memory' AND name = 'metadata'",
+            parameters={"database": settings.clickhouse_database},
+        )
+        if column_type != "String":
+            return
+
+        # Existing rows keep their JSON and expose it through the new column's default
+        table = f"{settings.clickhouse_database}.agent_memory"
+        self.client.command(f"ALTER TABLE {table} RENAME COLUMN metadata TO metadata_json")
+        self.client.command(f"""
+            ALTER TABLE {table}
+            ADD COLUMN metadata Map(LowCardinality(String), String)
+            DEFAULT CAST(
+                arrayMap(
+                    kv -> (kv.1, if(JSONType(kv.2) = 'String', JSONExtractString(kv.2), kv.2)),
+                    JSONExtractKeysAndValuesRaw(metadata_json)
+                ),
+                'Map(LowCardinality(String), String)'
+            ) AFTER content_preview
+        """)
+        logger.info("Migrated agent_memory.metadata to Map(String, String)")
+
+    @staticmethod
+    def _metadata_map(metadata: dict[str, Any]) -> dict[str, str]:
+        """Convert metadata to Map(String, String) values, JSON-encoding non-strings."""
+        return {
+            key: value if isinstance(value, str) else _dumps(value)
+            for key, value in metadata.items()
+        }
+
+    @classmethod
+    def _memory_row(cls, entry: MemoryEntry) -> Row:
+        """Convert a memory entry to an agent_memory row."""
+        return (
+            entry.agent_id,
+            # DateTime64(3) takes integer milliseconds as-is, with no datetime conversion
+            entry.timestamp // 1_000_000,
+            entry.memory_type,
+            entry.content,
+            entry.content_preview,
+            cls._metadata_map(entry.metadata),
+            entry.session_id,
         )
 
+    def store_memory(self, entry: MemoryEntry) -> None:
+        """Buffer a memory entry for the next batched insert."""
+        self._writers["agent_memory"].put(self._memory_row(entry))
+
+    async def store_memory_async(self, entry: MemoryEntry) -> None:
+        """Buffer a memory entry for the next batched insert."""
+        self._memory_writer.put_nowait(self._memory_row(entry))
+
     def get_recent_memories(
         self,
         agent_id: str,
@@ -140,12 +677,7 @@ class ClickHouseMemory:
         Returns:
             List of memory entries
         """
-        query = f"""
-            SELECT agent_id, timestamp, memory_type, content, metadata, session_id
-            FROM {settings.clickhouse_database}.agent_memory
-            WHERE agent_id = %(agent_id)s
-              AND timestamp > now() - INTERVAL %(hours)s HOUR
-        """
+        query = self._queries["recent_memories"]
 
         params = {"agent_id": agent_id, "hours": hours}
 
@@ -160,22 +692,50 @@ class ClickHouseMemory:
         query += " ORDER BY timestamp DESC LIMIT %(limit)s"
         params["limit"] = limit
 
-        result = self.client.query(query, parameters=params)
-
-        entries = []
-        for row in result.result_rows:
-            entries.append(
-                MemoryEntry(
-                    agent_id=row[0],
-                    timestamp=row[1],
-                    memory_type=row[2],
-                    content=row[3],
-                    metadata=json.loads(row[4]) if row[4] else {},
-                    session_id=row[5],
-                )
+        # Rows are converted as they arrive instead of being collected into result_rows first
+        with self.client.query_rows_stream(query, parameters=params) as rows:
+            return self._memory_entries(rows)
+
+    @staticmethod
+    def _memory_entries(rows: Iterable[Sequence[Any]]) -> list[MemoryEntry]:
+        """Convert agent_memory query rows to memory entries."""
+        # The stored preview is read back, so entries don't re-slice their content
+        return [
+            MemoryEntry(
+                agent_id=row[0],
+                timestamp=row[1],
+                memory_type=row[2],
+                content=row[3],
+                content_preview=row[4],
+                metadata=row[5],
+                session_id=row[6],
             )
+            for row in rows
+        ]
 
-        return entries
+    @staticmethod
+    def _action_row(
+        agent_id: str,
+        action_type: str,
+        target: str,
+        parameters: dict[str, Any],
+        result: Any,
+        success: bool,
+        duration_ms: int,
+        session_id: Optional[str] = None,
+    ) -> Row:
+        """Build an agent_actions row."""
+        return (
+            agent_id,
+            time.time_ns() // 1_000_000,
+            action_type,
+            target,
+            _dumps(parameters),
+            _dumps(result) if result else "",
+            success,
+            duration_ms,
+            session_id,
+        )
 
     def log_action(
         self,
@@ -188,65 +748,79 @@ class ClickHouseMemory:
         duration_ms: int,
         session_id: Optional[str] = None,
     ) -> None:
-        """Log an agent action."""
-        self.client.insert(
-            f"{settings.clickhouse_database}.agent_actions",
-            [
-                [
-                    agent_id,
-                    datetime.now(),
-                    action_type,
-                    target,
-                    json.dumps(parameters),
-                    json.dumps(result) if result else "",
-                    success,
-                    duration_ms,
-                    session_id,
-                ]
-            ],
-            column_names=[
-                "agent_id",
-                "timestamp",
-                "action_type",
-                "target",
-                "parameters",
-                "result",
-                "success",
-                "duration_ms",
-                "session_id",
-            ],
+        """Buffer an agent action for the next batched insert."""
+        self._writers["agent_actions"].put(
+            self._action_row(
+                agent_id,
+                action_type,
+                target,
+                parameters,
+                result,
+                success,
+                duration_ms,
+                session_id,
+            )
+        )
+
+    async def log_action_async(
+        self,
+        agent_id: str,
+        action_type: str,
+        target: str,
+        parameters: dict[str, Any],
+        result: Any,
+        success: bool,
+        duration_ms: int,
+        session_id: Optional[str] = None,
+    ) -> None:
+        """Buffer an agent action for the next batched insert."""
+        self._action_writer.put_nowait(
+            self._action_row(
+                agent_id,
+                action_type,
+                target,
+                parameters,
+                result,
+                success,
+                duration_ms,
+                session_id,
+            )
         )
 
+    def flush_buffered(self) -> None:
+        """Insert all rows buffered by the synchronous store methods."""
+        for writer in self._writers.values():
+            writer.flush()
+
+    async def flush(self) -> None:
+        """Insert all buffered memories and actions and stop the flush loops."""
+        await self._memory_writer.close()
+        await self._action_writer.close()
+        self.flush_buffered()
+
     def get_agent_statistics(
         self, agent_id: str, hours: int = 24
     ) -> dict[str, Any]:
         """Get statistics about agent activity."""
-        query = f"""
-            SELECT
-                action_type,
-                count() as count,
-                avg(duration_ms) as avg_duration,
-                sum(success) as successful,
-                sum(NOT success) as failed
-            FROM {settings.clickhouse_database}.agent_actions
-            WHERE agent_id = %(agent_id)s
-              AND timestamp > now() - INTERVAL %(hours)s HOUR
-            GROUP BY action_type
-        """
-
-        result = self.client.query(query, parameters={"agent_id": agent_id, "hours": hours})
-
-        stats = {}
-        for row in result.result_rows:
-            stats[row[0]] = {
-                "count": row[1],
-                "avg_duration_ms": row[2],
-                "successful": row[3],
-                "failed": row[4],
+        query = self._queries["agent_statistics"]
+        now = int(time.time())
+        since = now - now % _STATS_BUCKET_SECONDS - hours * 3600
+
+        with self.client.query_rows_stream(
+            query,
+            parameters={"agent_id": agent_id, "since": since},
+            settings=_STATS_QUERY_SETTINGS,
+        ) as rows:
+            return {
+                row[0]: {
+                    "count": row[1],
+                    "avg_duration_ms": row[2],
+                    "successful": row[3],
+                    "failed": row[4],
+                }
+                for row in rows
             }
 
-        return stats
-
     def store_work_item(
         self,
         work_item_id: str,
@@ -257,43 +831,24 @@ class ClickHouseMemory:
         assigned_agent: Optional[str] = None,
         metadata: Optional[dict[str, Any]] = None,
     ) -> None:
-        """Store or update a work item."""
-        self.client.insert(
-            f"{settings.clickhouse_database}.work_items",
-            [
-                [
-                    work_item_id,
-                    datetime.now(),
-                    item_type,
-                    title,
-                    description,
-                    state,
-                    assigned_agent,
-                    json.dumps(metadata or {}),
-                ]
-            ],
-            column_names=[
-                "work_item_id",
-                "timestamp",
-                "item_type",
-                "title",
-                "description",
-                "state",
-                "assigned_agent",
-                "metadata",
-            ],
-        )
+        """Buffer a work item insert or update; get_work_item flushes it before reading."""
+        self._writers["work_items"].put((
+            work_item_id,
+            # UTC epoch milliseconds like the other tables, not a naive local datetime
+            time.time_ns() // 1_000_000,
+            item_type,
+            title,
+            description,
+            state,
+            assigned_agent,
+            _dumps(metadata or {}),
+        ))
 
     def get_work_item(self, work_item_id: str) -> Optional[dict[str, Any]]:
         """Retrieve a work item by ID."""
-        query = f"""
-            SELECT work_item_id, timestamp, item_type, title, description,
-                   state, assigned_agent, metadata
-            FROM {settings.clickhouse_database}.work_items
-            WHERE work_item_id = %(work_item_id)s
-            ORDER BY timestamp DESC
-            LIMIT 1
-        """
+        # Read-after-write: pending work item rows must reach the server first
+        self._writers["work_items"].flush()
+        query = self._queries["work_item"]
 
         result = self.client.query(query, parameters={"work_item_id": work_item_id})
 
@@ -309,9 +864,49 @@ class ClickHouseMemory:
             "description": row[4],
             "state": row[5],
             "assigned_agent": row[6],
-            "metadata": json.loads(row[7]) if row[7] else {},
+            "metadata": orjson.loads(row[7]) if row[7] else {},
         }
 
+    def get_cached_analysis(self, fingerprint: str) -> Optional[dict[str, Any]]:
+        """
+        Retrieve a cached build failure analysis.
+
+        Args:
+            fingerprint: Fingerprint of the normalized build logs
+
+        Returns:
+            Cached analysis, or None if missing or expired
+        """
+        query = self._queries["cached_analysis"]
+
+        result = self.client.query(query, parameters={"fingerprint": fingerprint})
+
+        if not result.result_rows:
+            return None
+
+        return orjson.loads(result.result_rows[0][0])
+
+    def store_cached_analysis(
+        self,
+        fingerprint: str,
+        analysis: dict[str, Any],
+        ttl: timedelta = timedelta(hours=24),
+    ) -> None:
+        """
+        Cache a build failure analysis.
+
+        Args:
+            fingerprint: Fingerprint of the normalized build logs
+            analysis: Parsed analysis to cache
+            ttl: How long the analysis stays valid
+        """
+        now = datetime.now()
+        self.client.insert(
+            self._analysis_table,
+            [[fingerprint, now, now + ttl, _dumps(analysis)]],
+            column_names=["fingerprint", "created_at", "expires_at", "analysis"],
+        )
+
     def search_memories(
         self,
         agent_id: str,
@@ -329,35 +924,34 @@ class ClickHouseMemory:
         Returns:
             List of matching memory entries
         """
-        sql = f"""
-            SELECT agent_id, timestamp, memory_type, content, metadata, session_id
-            FROM {settings.clickhouse_database}.agent_memory
-            WHERE agent_id = %(agent_id)s
-              AND positionCaseInsensitive(content, %(query)s) > 0
-            ORDER BY timestamp DESC
-            LIMIT %(limit)s
-        """
+        sql = self._queries["search_memories"]
 
-        result = self.client.query(
-            sql, parameters={"agent_id": agent_id, "query": query, "limit": limit}
-        )
-
-        entries = []
-        for row in result.result_rows:
-            entries.append(
-                MemoryEntry(
-                    agent_id=row[0],
-                    timestamp=row[1],
-                    memory_type=row[2],
-                    content=row[3],
-                    metadata=json.loads(row[4]) if row[4] else {},
-                    session_id=row[5],
-                )
-            )
-
-        return entries
+        # Same expression as idx_content_ngram, with a constant LIKE pattern the index
+        # can use; positionCaseInsensitive() can't be answered from an ngram index
+        pattern = "%" + _LIKE_SPECIAL_RE.sub(r"\\\g<0>", query.lower()) + "%"
+        with self.client.query_rows_stream(
+            sql, parameters={"agent_id": agent_id, "pattern": pattern, "limit": limit}
+        ) as rows:
+            return self._memory_entries(rows)
 
     def close(self) -> None:
-        """Close the ClickHouse connection."""
+        """Flush buffered rows and close the ClickHouse connection."""
         if self.client:
+            self.flush_buffered()
+            atexit.unregister(self.flush_buffered)
             self.client.close()
+
+
+def get_default_memory() -> ClickHouseMemory:
+    """
+    Get the process-wide memory store shared by agents.
+
+    Created on first use so importing agents doesn't connect to ClickHouse.
+
+    Returns:
+        Shared ClickHouse memory
+    """
+    global _default_memory
+    if _default_memory is None:
+        _default_memory = ClickHouseMemory()
+    return _default_memory
@@ -1,6 +1,13 @@
 """Repository configuration management."""
 
+import functools
+import os
+import stat
+from collections import Counter
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Optional
 
 import yaml
@@ -51,6 +58,76 @@ class RepositoriesConfiguration(BaseModel):
     component_groups: dict[str, list[str]] = Field(default_factory=dict)
 
 
+# LibYAML's loader when PyYAML was built with it, the pure-Python one otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_config(path: str, mtime_ns: int, size: int) -> RepositoriesConfiguration:
+    """
+    Parse and validate a repository config file.
+
+    Cached on the file's path, modification time and size, so an unchanged file
+    is only parsed once however many managers load it.
+
+    Args:
+        path: Resolved path of the config file
+        mtime_ns: File modification time, part of the cache key
+        size: File size, part of the cache key
+
+    Returns:
+        Repository configuration; callers must copy it before modifying it
+    """
+    with open(path) as f:
+        data = yaml.load(f, Loader=_YAML_LOADER)
+
+    if not data:
+        logger.warning("Repository config file is empty")
+        return RepositoriesConfiguration()
+
+    config = RepositoriesConfiguration(**data)
+    logger.info(f"Loaded {len(config.repositories)} repositories from {path}")
+    return config
+
+
+# URL schemes accepted for repositories
+_URL_PREFIXES = ("http://", "https://", "git@")
+
+# Upper bound on threads checking local paths; the checks only wait on the filesystem
+_MAX_PATH_CHECK_WORKERS = 32
+
+
+def _check_local_path(repo: RepositoryConfig) -> Optional[str]:
+    """
+    Check that a repository's local path is a directory.
+
+    One stat() answers both "exists" and "is a directory"; the .git check is only
+    made for directories.
+
+    Args:
+        repo: Repository with a local_path
+
+    Returns:
+        Validation error, or None if the path is usable
+    """
+    local_path = os.path.expanduser(repo.local_path)
+    try:
+        mode = os.stat(local_path).st_mode
+    except (OSError, ValueError):
+        return f"Local path for repository {repo.name} does not exist: {repo.local_path}"
+
+    if not stat.S_ISDIR(mode):
+        return f"Local path for repository {repo.name} is not a directory: {repo.local_path}"
+
+    # Check if it's a git repository
+    if not os.path.exists(os.path.join(local_path, ".git")):
+        logger.warning(
+            f"Local path for repository {repo.name} does not appear to be a git repository: "
+            f"{repo.local_path}"
+        )
+    return None
+
+
 class RepositoryConfigManager:
     """Manager for repository configurations."""
 
@@ -63,11 +140,57 @@ class RepositoryConfigManager:
         """
         self.config_path = config_path or Path("repositories.yaml")
         self.config: Optional[RepositoriesConfiguration] = None
+        # Views derived from config.repositories, and the list and length they came from
+        self._by_name: dict[str, RepositoryConfig] = {}
+        self._enabled: tuple[RepositoryConfig, ...] = ()
+        self._indexed: tuple[Optional[list[RepositoryConfig]], int] = (None, 0)
+        # (path, mtime_ns, size) of the file last loaded, and our copy of its contents
+        self._loaded: Optional[tuple[tuple[str, int, int], RepositoriesConfiguration]] = None
+        # Read-only view of config.component_groups, and the dict it wraps
+        self._groups: tuple[Optional[dict[str, list[str]]], Mapping[str, list[str]]] = (
+            None,
+            MappingProxyType({}),
+        )
+
+    def _refresh_index(self) -> None:
+        """
+        Rebuild the name index and enabled list if the repositories have changed.
+
+        They are rebuilt whenever the configuration or its repository list has
+        been replaced or resized since they were built, and after load(),
+        add_repository() and save(). Entries edited in place in between (e.g. a
+        toggled ``enabled`` or a renamed repository) are not picked up until one
+        of those runs. With duplicate names the first one wins.
+        """
+        repos = self.config.repositories
+        if self._indexed[0] is not repos or self._indexed[1] != len(repos):
+            self._by_name = {}
+            for repo in repos:
+                self._by_name.setdefault(repo.name, repo)
+            self._enabled = tuple(repo for repo in repos if repo.enabled)
+            self._indexed = (repos, len(repos))
+
+    def _invalidate_index(self) -> None:
+        """Make the next lookup rebuild the name index and enabled list."""
+        self._indexed = (None, 0)
+
+    def _repositories_by_name(self) -> dict[str, RepositoryConfig]:
+        """
+        Get repositories indexed by name.
+
+        Returns:
+            Repository configurations keyed by name
+        """
+        self._refresh_index()
+        return self._by_name
 
     def load(self) -> RepositoriesConfiguration:
         """
         Load repository configuration from YAML file.
 
+        While the file is unchanged, this manager's copy from the previous load is
+        returned again, including any edits made to its entries in place.
+
         Returns:
             Repository configuration
 
@@ -79,21 +202,22 @@ class RepositoryConfigManager:
             logger.warning(f"Repository config not found at {self.config_path}")
             # Return empty configuration
             self.config = RepositoriesConfiguration()
+            self._loaded = None
+            self._invalidate_index()
             return self.config
 
         try:
-            with open(self.config_path) as f:
-                data = yaml.safe_load(f)
-
-            if not data:
-                logger.warning("Repository config file is empty")
-                self.config = RepositoriesConfiguration()
-                return self.config
-
-            self.config = RepositoriesConfiguration(**data)
-            logger.info(
-                f"Loaded {len(self.config.repositories)} repositories from {self.config_path}"
-            )
+            st = self.config_path.stat()
+            key = (str(self.config_path.resolve()), st.st_mtime_ns, st.st_size)
+            # Our copy of an unchanged file is reused rather than deep-copied again
+            if self._loaded is not None and self._loaded[0] == key:
+                if self.config is self._loaded[1]:
+                    return self.config
+
+            # The parsed configuration is shared; add_repository() mutates ours
+            self.config = _parse_config(*key).model_copy(deep=True)
+            self._loaded = (key, self.config)
+            self._invalidate_index()
 
             return self.config
         except yaml.YAMLError as e:
@@ -101,17 +225,18 @@ class RepositoryConfigManager:
         except Exception as e:
             raise ValueError(f"Failed to load repository config: {e}")
 
-    def get_enabled_repositories(self) -> list[RepositoryConfig]:
+    def get_enabled_repositories(self) -> tuple[RepositoryConfig, ...]:
         """
         Get all enabled repositories.
 
         Returns:
-            List of enabled repository configurations
+            Enabled repository configurations, shared between calls
         """
         if not self.config:
             self.load()
 
-        return [repo for repo in self.config.repositories if repo.enabled]
+        self._refresh_index()
+        return self._enabled
 
     def get_repository(self, name: str) -> Optional[RepositoryConfig]:
         """
@@ -126,11 +251,7 @@ class RepositoryConfigManager:
         if not self.config:
             self.load()
 
-        for repo in self.config.repositories:
-            if repo.name == name:
-                return repo
-
-        return None
+        return self._repositories_by_name().get(name)
 
     def get_component_group(self, group_name: str) -> list[str]:
         """
@@ -147,17 +268,20 @@ class RepositoryConfigManager:
 
         return self.config.component_groups.get(group_name, [])
 
-    def get_all_component_groups(self) -> dict[str, list[str]]:
+    def get_all_component_groups(self) -> Mapping[str, list[str]]:
         """
         Get all component groups.
 
         Returns:
-            Dictionary of group names to repository lists
+            Read-only view of group names to repository lists
         """
         if not self.config:
             self.load()
 
-        return self.config.component_groups
+        groups = self.config.component_groups
+        if self._groups[0] is not groups:
+            self._groups = (groups, MappingProxyType(groups))
+        return self._groups[1]
 
     def add_repository(
         self,
@@ -192,12 +316,17 @@ class RepositoryConfigManager:
         )
 
         self.config.repositories.append(repo)
+        # No longer matches the file, so load() must read it again
+        self._loaded = None
+        self._invalidate_index()
         return repo
 
     def save(self) -> None:
         """Save current configuration to YAML file."""
         if not self.config:
             raise ValueError("No configuration to save")
+        # Entries may have been edited in place before saving
+        self._invalidate_index()
 
         data = self.config.model_dump(exclude_none=True)
 
@@ -218,39 +347,39 @@ class RepositoryConfigManager:
 
         errors = []
 
+        # One pass over the repositories for names, URLs and local paths to check
+        name_counts: Counter[str] = Counter()
+        url_errors = []
+        local_repos = []
+        for repo in self.config.repositories:
+            name_counts[repo.name] += 1
+            if not repo.url.startswith(_URL_PREFIXES):
+                url_errors.append(f"Invalid URL for repository {repo.name}: {repo.url}")
+            if repo.local_path:
+                local_repos.append(repo)
+
         # Check for duplicate names
-        names = [repo.name for repo in self.config.repositories]
-        duplicates = [name for name in names if names.count(name) > 1]
+        duplicates = [name for name, count in name_counts.items() if count > 1]
         if duplicates:
             errors.append(f"Duplicate repository names: {set(duplicates)}")
 
         # Check for invalid URLs
-        for repo in self.config.repositories:
-            if not repo.url.startswith(("http://", "https://", "git@")):
-                errors.append(f"Invalid URL for repository {repo.name}: {repo.url}")
-
-        # Check local paths exist if provided
-        for repo in self.config.repositories:
-            if repo.local_path:
-                local_path = Path(repo.local_path).expanduser()
-                if not local_path.exists():
-                    errors.append(
-                        f"Local path for repository {repo.name} does not exist: {repo.local_path}"
-                    )
-                elif not local_path.is_dir():
-                    errors.append(
-                        f"Local path for repository {repo.name} is not a directory: {repo.local_path}"
-                    )
-                # Check if it's a git repository
-                elif not (local_path / ".git").exists():
-                    logger.warning(
-                        f"Local path for repository {repo.name} does not appear to be a git repository: {repo.local_path}"
-                    )
+        errors.extend(url_errors)
+
+        # Check local paths exist if provided, concurrently since each check waits on
+        # the filesystem (notably on network mounts)
+        if len(local_repos) > 1:
+            workers = min(_MAX_PATH_CHECK_WORKERS, len(local_repos))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                path_errors = list(executor.map(_check_local_path, local_repos))
+        else:
+            path_errors = [_check_local_path(repo) for repo in local_repos]
+        errors.extend(error for error in path_errors if error)
 
         # Check component groups reference valid repositories
         for group_name, repos in self.config.component_groups.items():
             for repo_name in repos:
-                if repo_name not in names:
+                if repo_name not in name_counts:
                     errors.append(
                         f"Component group '{group_name}' references "
                         f"unknown repository: {repo_name}"
@@ -1,6 +1,8 @@
 """Pytest configuration and fixtures."""
 
 import asyncio
+import os
+import shutil
 from pathlib import Path
 from typing import AsyncGenerator, Generator
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -8,11 +10,19 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
 
-from sdlc_agents.config import Settings
+from sdlc_agents.config import Settings, settings as global_settings
 from sdlc_agents.llm.base import LLMMessage, LLMProvider, LLMResponse, MessageRole
 from sdlc_agents.memory.clickhouse_memory import ClickHouseMemory
 
 
+@pytest.fixture(autouse=True)
+def isolated_workspace(tmp_path: Path, monkeypatch: MonkeyPatch) -> Path:
+    """Keep build logs and the LLM response cache out of the working tree."""
+    workspace = tmp_path / "workspace"
+    monkeypatch.setattr(global_settings, "workspace_dir", workspace)
+    return workspace
+
+
 @pytest.fixture
 def mock_settings(tmp_path: Path, monkeypatch: MonkeyPatch) -> Settings:
     """Create mock settings for testing."""
@@ -86,6 +96,7 @@ def mock_clickhouse_memory(monkeypatch: MonkeyPatch) -> MagicMock:
     mock_memory.store_work_item = MagicMock()
     mock_memory.get_work_item = MagicMock(return_value=None)
     mock_memory.search_memories = MagicMock(return_value=[])
+    mock_memory.get_cached_analysis = MagicMock(return_value=None)
 
     return mock_memory
 
@@ -127,6 +138,12 @@ def mock_ado_client() -> MagicMock:
         "definition": "Test-CI",
     }
 
+    mock_client.get_latest_builds.side_effect = lambda names, branch="main": {
+        name: {**mock_client.get_build.return_value, "definition": name} for name in names
+    }
+    mock_client.get_work_items_batch.return_value = {}
+    mock_client.split_feature_into_stories = AsyncMock(return_value=[])
+
     mock_client.queue_build.return_value = {
         "id": 2,
         "build_number": "20250101.2",
@@ -201,31 +218,36 @@ component_groups:
     return config_path
 
 
-@pytest.fixture
-async def mock_git_repo(tmp_path: Path) -> Path:
-    """Create a mock git repository."""
-    repo_path = tmp_path / "test-repo"
-    repo_path.mkdir()
-
-    # Create basic Maven structure
-    (repo_path / "pom.xml").write_text("""
+# Basic Maven project written into every mock repository
+_MOCK_REPO_FILES = {
+    "pom.xml": b"""
 <project>
     <modelVersion>4.0.0</modelVersion>
     <groupId>com.test</groupId>
     <artifactId>test-app</artifactId>
     <version>1.0.0</version>
 </project>
-""")
+""",
+    "src/main/java/Main.java": b"public class Main {}",
+    "src/test/java/MainTest.java": b"public class MainTest {}",
+}
 
-    src_main = repo_path / "src" / "main" / "java"
-    src_main.mkdir(parents=True)
-    (src_main / "Main.java").write_text("public class Main {}")
 
-    src_test = repo_path / "src" / "test" / "java"
-    src_test.mkdir(parents=True)
-    (src_test / "MainTest.java").write_text("public class MainTest {}")
+@pytest.fixture(scope="session")
+def mock_git_repo_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the mock repository once per session."""
+    template = tmp_path_factory.mktemp("mock-repo-template") / "test-repo"
+    for relative_path, content in _MOCK_REPO_FILES.items():
+        path = template / relative_path
+        os.makedirs(path.parent, exist_ok=True)
+        path.write_bytes(content)
+    return template
 
-    return repo_path
+
+@pytest.fixture
+async def mock_git_repo(tmp_path: Path, mock_git_repo_template: Path) -> Path:
+    """Create a mock git repository, copied from the session template so tests can modify it."""
+    return Path(shutil.copytree(mock_git_repo_template, tmp_path / "test-repo"))
 
 
 @pytest.fixture(scope="session")
@@ -1,8 +1,16 @@
 """Tests for Azure DevOps client."""
 
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from unittest.mock import MagicMock, patch
 
+from azure.devops.client import Client
+
+from sdlc_agents.circuit_breaker import CircuitBreaker
+from sdlc_agents.integrations import ado_client
 from sdlc_agents.integrations.ado_client import ADOClient
 
 
@@ -184,7 +192,7 @@ class TestADOClient:
         mock_post.return_value = mock_post_response
 
         client = ADOClient("test-org", "test-project", "test-pat")
-        stories = client.split_feature_into_stories(12345, 3)
+        stories = asyncio.run(client.split_feature_into_stories(12345, 3))
 
         assert len(stories) == 3
         assert all(story["type"] == "User Story" for story in stories)
@@ -251,3 +259,250 @@ class TestADOClient:
         work_item = client.get_work_item(12345)
 
         assert work_item is None
+
+
+@pytest.mark.unit
+class TestADOBatchCalls:
+    """Tests for batched ADO lookups."""
+
+    @pytest.fixture
+    def client(self):
+        """ADO client with mocked SDK clients and no connection."""
+        client = ADOClient.__new__(ADOClient)
+        client.work_item_client = MagicMock()
+        client.build_client = MagicMock()
+        client._cache = {}
+        client._cache_lock = threading.Lock()
+        client._definition_cache = {}
+        client._breaker = CircuitBreaker("test", is_failure=ado_client._is_outage)
+        return client
+
+    @staticmethod
+    def _sdk_work_item(work_item_id, child_ids=()):
+        relations = [
+            MagicMock(rel="System.LinkTypes.Hierarchy-Forward", url=f"https://ado/workItems/{i}")
+            for i in child_ids
+        ]
+        return MagicMock(
+            id=work_item_id,
+            fields={"System.Title": f"Item {work_item_id}"},
+            relations=relations,
+        )
+
+    def test_default_client_shared(self, monkeypatch):
+        """Test that get_default() builds one client and reuses it."""
+        monkeypatch.setattr(ADOClient, "_default", None)
+        with patch.object(ADOClient, "__init__", return_value=None) as mock_init:
+            first = ADOClient.get_default()
+            assert ADOClient.get_default() is first
+
+        mock_init.assert_called_once()
+
+    def test_work_items_batched_in_chunks(self, client):
+        """Test that work items are fetched 200 IDs per request."""
+        client.work_item_client.get_work_items_batch.side_effect = lambda request, project: [
+            self._sdk_work_item(i) for i in request.ids
+        ]
+
+        work_items = client.get_work_items_batch(list(range(1, 251)))
+
+        assert client.work_item_client.get_work_items_batch.call_count == 2
+        assert len(work_items) == 250
+        assert work_items[250]["title"] == "Item 250"
+
+    def test_work_item_child_ids(self, client):
+        """Test that child links are exposed as IDs."""
+        client.work_item_client.get_work_item.return_value = self._sdk_work_item(1, [2, 3])
+
+        assert client.get_work_item(1)["child_ids"] == [2, 3]
+
+    def test_latest_builds_single_query(self, client):
+        """Test that latest builds for all definitions come from one builds query."""
+        api = MagicMock(id=10)
+        api.name = "api"
+        web = MagicMock(id=11)
+        web.name = "web"
+        client.build_client.get_definitions.return_value = [api, web]
+        client.build_client.get_builds.return_value = [
+            MagicMock(id=1, result="succeeded", definition=api),
+        ]
+
+        latest = client.get_latest_builds(["api", "web", "unknown"])
+
+        client.build_client.get_builds.assert_called_once()
+        assert client.build_client.get_builds.call_args.kwargs["definitions"] == [10, 11]
+        assert latest["api"]["result"] == "succeeded"
+        assert latest["web"] is None
+        assert latest["unknown"] is None
+
+    def test_create_without_fetch_skips_reread(self, client):
+        """Test that fetch=False returns the created item without another GET."""
+        client.work_item_client.create_work_item.return_value = self._sdk_work_item(7)
+
+        work_item = client.create_work_item("Task", "Item 7", fetch=False)
+
+        assert work_item["id"] == 7
+        assert work_item["title"] == "Item 7"
+        client.work_item_client.get_work_item.assert_not_called()
+
+    def test_work_item_reads_cached_until_updated(self, client):
+        """Test that repeat reads hit the cache and updates invalidate it."""
+        client.work_item_client.get_work_item.return_value = self._sdk_work_item(1)
+        client.work_item_client.update_work_item.return_value = self._sdk_work_item(1)
+
+        client.get_work_item(1)["children"] = []
+        assert "children" not in client.get_work_item(1)
+        assert client.work_item_client.get_work_item.call_count == 1
+
+        client.update_work_item(1, {"System.State": "Active"}, fetch=False)
+        client.get_work_item(1)
+        assert client.work_item_client.get_work_item.call_count == 2
+
+    def test_summary_fields_projection(self, client):
+        """Test that a field projection skips relations and is cached separately."""
+        client.work_item_client.get_work_item.return_value = self._sdk_work_item(1, [2])
+
+        client.get_work_item(1, fields=ADOClient.SUMMARY_FIELDS)
+        assert client.work_item_client.get_work_item.call_args.kwargs == {
+            "id": 1,
+            "fields": list(ADOClient.SUMMARY_FIELDS),
+        }
+
+        client.get_work_item(1)
+        assert client.work_item_client.get_work_item.call_args.kwargs["expand"] == "Relations"
+
+        client.update_work_item(1, {"System.State": "Active"}, fetch=False)
+        assert client._cache == {}
+
+    def test_only_completed_builds_cached(self, client):
+        """Test that running builds are re-read while finished builds are cached."""
+        client.build_client.get_build.return_value = MagicMock(id=1, status="inProgress")
+        client.get_build(1)
+        client.build_client.get_build.return_value = MagicMock(id=1, status="completed")
+        client.get_build(1)
+        client.get_build(1)
+
+        assert client.build_client.get_build.call_count == 2
+
+    def test_cache_safe_across_threads(self, client, monkeypatch):
+        """Test that concurrent reads of expiring entries and clears don't race."""
+        from sdlc_agents.config import settings
+
+        # Every entry is already expired when read back, so readers delete it
+        monkeypatch.setattr(settings, "ado_cache_ttl_seconds", 0.0)
+
+        def worker(i):
+            for _ in range(200):
+                client._cached(f"wi:{i % 4}", lambda: {"id": i})
+                client.clear_cache(r"^wi:[02]")
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(worker, range(8)))
+
+    def test_clear_cache_by_pattern(self, client):
+        """Test that clear_cache() drops only keys matching the pattern."""
+        client._cache = {"wi:1": (float("inf"), {}), "build:1": (float("inf"), {})}
+
+        client.clear_cache(r"^wi:")
+
+        assert list(client._cache) == ["build:1"]
+
+    def test_queue_build_caches_definition(self, client):
+        """Test that the definition is looked up once for repeated queues."""
+        definition = MagicMock(id=10)
+        definition.name = "api"
+        client.build_client.get_definitions.return_value = [definition]
+        client.build_client.queue_build.return_value = MagicMock(id=1)
+        client.build_client.get_build.return_value = MagicMock(id=1, status="notStarted")
+
+        client.queue_build("api")
+        client.queue_build("api", branch="develop")
+
+        client.build_client.get_definitions.assert_called_once()
+        build = client.build_client.queue_build.call_args.kwargs["build"]
+        assert build.definition.id == 10
+        assert build.source_branch == "refs/heads/develop"
+
+    def test_queue_build_parameters_are_json(self, client):
+        """Test that build parameters are sent as a JSON object string."""
+        client._definition_cache["api"] = (10, "api")
+        client.build_client.queue_build.return_value = MagicMock(id=1)
+        client.build_client.get_build.return_value = MagicMock(id=1, status="notStarted")
+
+        client.queue_build("api", skipTests="true", label="café")
+
+        build = client.build_client.queue_build.call_args.kwargs["build"]
+        assert build.parameters == '{"skipTests":"true","label":"café"}'
+
+    @pytest.mark.asyncio
+    async def test_split_feature_links_every_story(self, client):
+        """Test that all stories are created before any is linked."""
+        calls = []
+        client.get_work_item = MagicMock(return_value={"id": 1, "title": "Feature"})
+        client.create_work_item = MagicMock(
+            side_effect=lambda **kwargs: calls.append("create") or {"id": kwargs["title"]}
+        )
+        client.link_work_items = MagicMock(side_effect=lambda *args: calls.append("link") or True)
+
+        stories = await client.split_feature_into_stories(1, 3)
+
+        assert len(stories) == 3
+        assert calls == ["create"] * 3 + ["link"] * 3
+        linked = {c.args[0] for c in client.link_work_items.call_args_list}
+        assert linked == {story["id"] for story in stories}
+
+    def test_sdk_clients_share_pooled_session(self, client):
+        """Test that SDK clients send through the shared keep-alive session."""
+        client._session = MagicMock()
+        sdk_client = Client(base_url="https://dev.azure.com/test-org")
+
+        client._use_session(sdk_client)
+
+        assert sdk_client._client.config.keep_alive is True
+        assert sdk_client._client.config.pipeline._sender.driver.session is client._session
+
+    @pytest.mark.asyncio
+    async def test_worker_threads_share_pooled_session(self, client):
+        """Test that requests sent from worker threads use the shared session too."""
+        from msrest.universal_http import ClientRequest
+
+        client._session = MagicMock()
+        sdk_client = Client(base_url="https://dev.azure.com/test-org")
+        client._use_session(sdk_client)
+        driver = sdk_client._client.config.pipeline._sender.driver
+
+        await asyncio.to_thread(
+            driver.send, ClientRequest("GET", "https://dev.azure.com/test-org/_apis")
+        )
+
+        client._session.request.assert_called_once()
+
+    def test_missing_work_items_do_not_open_circuit(self, client):
+        """Test that ADO rejecting a request is not counted as an outage."""
+        from azure.devops.exceptions import AzureDevOpsServiceError
+
+        not_found = AzureDevOpsServiceError(
+            MagicMock(inner_exception=None, message="VS402323: Work item 99999 does not exist")
+        )
+        client.work_item_client.get_work_item.side_effect = not_found
+
+        for _ in range(client._breaker.failure_threshold + 1):
+            assert client._fetch_work_item(99999) is None
+
+        assert not client._breaker.is_open
+        assert client.work_item_client.get_work_item.call_count == 6
+
+    def test_server_errors_open_circuit(self, client):
+        """Test that 5xx responses open the circuit and later calls fail fast."""
+        from azure.devops.exceptions import AzureDevOpsClientRequestError
+
+        client.build_client.get_build.side_effect = AzureDevOpsClientRequestError(
+            "Operation returned a 503 status code."
+        )
+
+        for build_id in range(client._breaker.failure_threshold):
+            assert client._fetch_build(build_id) is None
+        assert client._breaker.is_open
+
+        assert client._fetch_build(99) is None
+        assert client.build_client.get_build.call_count == client._breaker.failure_threshold
@@ -1,5 +1,7 @@
 """Tests for agent classes."""
 
+import asyncio
+
 import pytest
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -7,8 +9,17 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from sdlc_agents.agents.base import Agent, AgentCapability
 from sdlc_agents.agents.orchestrator import OrchestratorAgent
 from sdlc_agents.agents.requirements_agent import RequirementsAgent
-from sdlc_agents.agents.code_repo_agent import CodeRepositoryAgent
-from sdlc_agents.agents.build_monitor_agent import BuildMonitorAgent
+from sdlc_agents.agents.code_repo_agent import CodeRepositoryAgent, _scan_repo
+from sdlc_agents.agents.build_monitor_agent import (
+    BuildMonitorAgent,
+    _FLAKY_RE,
+    _JsonObjectScanner,
+    _PrioritySemaphore,
+    _ado_semaphore,
+    _extract_json_object,
+    _log_fingerprint,
+    _preclassify_failure,
+)
 from sdlc_agents.agents.release_manager_agent import ReleaseManagerAgent
 
 
@@ -131,6 +142,144 @@ class TestBaseAgent:
         assert mock_clickhouse_memory.log_action.called
 
 
+@pytest.mark.unit
+class TestAgentMemoryCache:
+    """Tests for the in-process memory cache and background memory writes."""
+
+    @staticmethod
+    def _make_agent(llm_provider, memory):
+        class TestAgent(Agent):
+            async def process_task(self, task):
+                return {"status": "completed"}
+
+        return TestAgent(
+            agent_id="test-agent",
+            name="Test Agent",
+            capabilities=[AgentCapability.ORCHESTRATION],
+            system_prompt="You are a test agent",
+            llm_provider=llm_provider,
+            memory=memory,
+        )
+
+    @pytest.mark.asyncio
+    async def test_new_session_skips_clickhouse(
+        self, mock_llm_provider, mock_clickhouse_memory
+    ):
+        """Test that a fresh session never reads memories back from ClickHouse."""
+        agent = self._make_agent(mock_llm_provider, mock_clickhouse_memory)
+
+        await agent.observe("First observation")
+        await agent.think("Hello, agent")
+
+        mock_clickhouse_memory.get_recent_memories.assert_not_called()
+        recent = agent._recent_memories()
+        assert recent[0].memory_type == "conversation"
+        assert recent[1].content == "First observation"
+
+    @pytest.mark.asyncio
+    async def test_resumed_session_populates_once(
+        self, mock_llm_provider, mock_clickhouse_memory
+    ):
+        """Test that a resumed session is loaded from ClickHouse on first use only."""
+        agent = self._make_agent(mock_llm_provider, mock_clickhouse_memory)
+        agent.session_id = "resumed-session"
+
+        await agent.think("First")
+        await agent.think("Second")
+
+        assert mock_clickhouse_memory.get_recent_memories.call_count == 1
+        assert len(agent._recent_memories()) == 2
+
+    @pytest.mark.asyncio
+    async def test_prompt_prefix_reused_until_new_memory(
+        self, mock_llm_provider, mock_clickhouse_memory
+    ):
+        """Test that the system and memory-context messages are cached between calls."""
+        agent = self._make_agent(mock_llm_provider, mock_clickhouse_memory)
+        await agent.observe("Something happened")
+
+        first = agent._memory_context_message()
+        assert first is agent._memory_context_message()
+        assert "Something happened" in first.content
+
+        await agent.observe("Something else happened")
+
+        assert agent._memory_context_message() is not first
+
+    @pytest.mark.asyncio
+    async def test_think_stream_records_partial_response(
+        self, mock_llm_provider, mock_clickhouse_memory
+    ):
+        """Test that closing a stream early still records what was generated."""
+        agent = self._make_agent(mock_llm_provider, mock_clickhouse_memory)
+
+        stream = agent.think_stream("Hello, agent")
+        async for chunk in stream:
+            break
+        await stream.aclose()
+
+        assert agent._recent_memories()[0].content == "User: Hello, agent\nAssistant: Mock "
+
+    def test_context_message_reused_for_same_dict(
+        self, mock_llm_provider, mock_clickhouse_memory
+    ):
+        """Test that a repeated context dict reuses its rendered message."""
+        agent = self._make_agent(mock_llm_provider, mock_clickhouse_memory)
+        context = {"pr_id": 100, "branch": "feature/test"}
+
+        first = agent._context_message(context)
+        assert agent._context_message(context) is first
+        assert first.content == "Context:\npr_id: 100\nbranch: feature/test"
+
+        context["pr_id"] = 101
+        assert "pr_id: 101" in agent._context_message(context).content
+
+    @pytest.mark.asyncio
+    async def test_think_cache_skips_llm_on_repeat(
+        self, tmp_path, monkeypatch, mock_llm_provider, mock_clickhouse_memory
+    ):
+        """Test that think(cache=True) answers a repeated prompt from disk."""
+        from sdlc_agents.config import settings
+
+        monkeypatch.setattr(settings, "workspace_dir", tmp_path)
+        agent = self._make_agent(mock_llm_provider, mock_clickhouse_memory)
+
+        first = await agent.think("Split feature 1", cache=True)
+        with patch.object(
+            type(mock_llm_provider), "generate", side_effect=AssertionError("not cached")
+        ):
+            second = await agent.think("Split feature 1", cache=True)
+
+        assert second.content == first.content
+
+    @pytest.mark.asyncio
+    async def test_think_defers_writes_until_cleanup(
+        self, mock_llm_provider, mock_clickhouse_memory
+    ):
+        """Test that think() schedules memory writes and cleanup() waits for them."""
+        agent = self._make_agent(mock_llm_provider, mock_clickhouse_memory)
+
+        await agent.think("Hello, agent")
+        assert agent._pending_writes
+
+        await agent.cleanup()
+
+        assert not agent._pending_writes
+        mock_clickhouse_memory.store_memory_async.assert_awaited_once()
+        mock_clickhouse_memory.log_action_async.assert_awaited_once()
+        mock_clickhouse_memory.flush.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cleanup_leaves_shared_llm_open(self, mock_llm_provider, mock_clickhouse_memory):
+        """Test that one agent's cleanup doesn't close the provider other agents share."""
+        agent = self._make_agent(mock_llm_provider, mock_clickhouse_memory)
+
+        with patch.object(type(mock_llm_provider), "close", AsyncMock(), create=True) as close:
+            await agent.cleanup()
+
+        close.assert_not_awaited()
+
+
 @pytest.mark.unit
 class TestOrchestratorAgent:
     """Tests for Orchestrator Agent."""
@@ -203,6 +352,80 @@ class TestOrchestratorAgent:
             assert mock_process.called
 
 
+@pytest.mark.unit
+class TestStoryFanOut:
+    """Tests for delegating a story to several code agents."""
+
+    @pytest.fixture
+    def orchestrator(self, mock_llm_provider, mock_clickhouse_memory, mock_ado_client):
+        """Orchestrator with a requirements agent reporting two affected repos."""
+        with (
+            patch(
+                "sdlc_agents.agents.orchestrator.ADOClient",
+                **{"get_default.return_value": mock_ado_client},
+            ),
+            patch("sdlc_agents.agents.base.get_llm_provider", return_value=mock_llm_provider),
+            patch(
+                "sdlc_agents.agents.base.get_default_memory",
+                return_value=mock_clickhouse_memory,
+            ),
+        ):
+            orchestrator = OrchestratorAgent()
+
+        requirements = MagicMock(agent_id="requirements")
+        requirements.process_task = AsyncMock(
+            return_value={"affected_repos": ["api", "web"], "requirements": "reqs"}
+        )
+        orchestrator.active_agents["requirements"] = requirements
+        return orchestrator
+
+    @staticmethod
+    def _code_agent(repo, process_task):
+        agent = MagicMock(agent_id=f"code_repo_{repo}")
+        agent.name = f"Code Agent ({repo})"
+        agent.process_task = process_task
+        return agent
+
+    @pytest.mark.asyncio
+    async def test_repos_run_concurrently(self, orchestrator):
+        """Test that code agents for different repos run at the same time."""
+        started = 0
+        both_started = asyncio.Event()
+
+        async def process_task(task):
+            nonlocal started
+            started += 1
+            if started == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            return {"success": True}
+
+        orchestrator._build_sema = asyncio.Semaphore(2)
+        for repo in ("api", "web"):
+            orchestrator.active_agents[f"code_repo_{repo}"] = self._code_agent(repo, process_task)
+
+        result = await orchestrator._implement_story({"story_id": 12345})
+
+        assert result["code_results"] == [{"success": True}, {"success": True}]
+
+    @pytest.mark.asyncio
+    async def test_failed_repo_does_not_fail_batch(self, orchestrator):
+        """Test that one repo raising still returns results for the others."""
+        orchestrator.active_agents["code_repo_api"] = self._code_agent(
+            "api", AsyncMock(side_effect=RuntimeError("clone failed"))
+        )
+        orchestrator.active_agents["code_repo_web"] = self._code_agent(
+            "web", AsyncMock(return_value={"success": True})
+        )
+
+        result = await orchestrator._implement_story({"story_id": 12345})
+
+        assert result["code_results"] == [
+            {"success": False, "error": "clone failed"},
+            {"success": True},
+        ]
+
+
 @pytest.mark.unit
 class TestRequirementsAgent:
     """Tests for Requirements Agent."""
@@ -251,6 +474,53 @@ class TestRequirementsAgent:
         assert result["status"] in ["completed", "failed"]
 
 
+@pytest.mark.unit
+class TestRequirementsParsing:
+    """Tests for keyword extraction from requirements analyses."""
+
+    @pytest.fixture
+    def agent(self, mock_llm_provider, mock_clickhouse_memory, mock_ado_client):
+        """Requirements agent wired to mocks."""
+        with (
+            patch(
+                "sdlc_agents.agents.requirements_agent.ADOClient",
+                **{"get_default.return_value": mock_ado_client},
+            ),
+            patch("sdlc_agents.agents.base.get_llm_provider", return_value=mock_llm_provider),
+            patch(
+                "sdlc_agents.agents.base.get_default_memory",
+                return_value=mock_clickhouse_memory,
+            ),
+        ):
+            yield RequirementsAgent()
+
+    def test_affected_repos_in_keyword_order(self, agent):
+        """Test that repos are reported once each, in keyword order, overlaps included."""
+        analysis = "Update the Web UI and the mobile app; the WEBACKEND service and the API."
+
+        assert agent._extract_affected_repos(analysis) == ["backend", "api", "web", "mobile"]
+        assert agent._extract_affected_repos("Nothing relevant") == ["main"]
+
+    def test_affected_repos_prefers_entities(self, agent):
+        """Test that ORG/PRODUCT entities narrow repos when spaCy is available."""
+        entities = [
+            MagicMock(text="Mobile App", label_="PRODUCT"),
+            MagicMock(text="the web", label_="DATE"),
+        ]
+        nlp = MagicMock(return_value=MagicMock(ents=entities))
+
+        with patch("sdlc_agents.agents.requirements_agent._get_nlp", return_value=nlp):
+            assert agent._extract_affected_repos("Ship Mobile App on the web") == ["mobile"]
+
+    def test_complexity_counts_distinct_indicators(self, agent):
+        """Test that repeated indicators count once."""
+        assert agent._estimate_complexity("Refactor, refactor, refactor") == "Medium"
+        assert agent._estimate_complexity("Complex migration across multiple services") == (
+            "Very High"
+        )
+        assert agent._estimate_complexity("Small tweak") == "Low"
+
+
 @pytest.mark.unit
 class TestCodeRepositoryAgent:
     """Tests for Code Repository Agent."""
@@ -348,6 +618,488 @@ class TestCodeRepositoryAgent:
             assert result["exit_code"] == 0
 
 
+@pytest.mark.unit
+class TestRepoScan:
+    """Tests for the single-pass repository scan."""
+
+    def test_scan_counts_projects_and_prunes_build_dirs(self, tmp_path):
+        """Test counting Maven modules while skipping build output."""
+        for module in ("", "core/", "api/"):
+            (tmp_path / module / "src" / "main" / "java").mkdir(parents=True)
+            (tmp_path / module / "pom.xml").write_text("<project/>")
+        (tmp_path / "core" / "src" / "test" / "java").mkdir(parents=True)
+
+        # Copies under build output and VCS metadata must not be counted
+        (tmp_path / "target" / "src" / "main" / "java").mkdir(parents=True)
+        (tmp_path / "target" / "pom.xml").write_text("<project/>")
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "pom.xml").write_text("<project/>")
+        for metadata in (".idea", ".mvn/wrapper"):
+            (tmp_path / metadata / "src" / "main" / "java").mkdir(parents=True)
+            (tmp_path / metadata / "pom.xml").write_text("<project/>")
+
+        assert _scan_repo(tmp_path) == (3, 3, 1)
+
+
+@pytest.fixture
+def code_agent(tmp_path, monkeypatch, mock_llm_provider, mock_clickhouse_memory):
+    """Code repository agent wired to mocks, with a temporary workspace."""
+    from sdlc_agents.config import settings
+
+    monkeypatch.setattr(settings, "workspace_dir", tmp_path / "workspace")
+    repo_path = tmp_path / "repo"
+    repo_path.mkdir()
+    with (
+        patch("sdlc_agents.agents.code_repo_agent.ADOClient"),
+        patch("sdlc_agents.agents.base.get_llm_provider", return_value=mock_llm_provider),
+        patch(
+            "sdlc_agents.agents.base.get_default_memory",
+            return_value=mock_clickhouse_memory,
+        ),
+    ):
+        yield CodeRepositoryAgent("test-repo", "https://example.com/repo.git", repo_path)
+
+
+@pytest.mark.unit
+class TestMavenBuild:
+    """Tests for running Maven builds."""
+
+    @pytest.mark.asyncio
+    async def test_output_goes_to_log_files(self, code_agent):
+        """Test that Maven output is written to disk and only the tail is returned."""
+
+        async def fake_exec(*args, stdout, stderr, **kwargs):
+            process = MagicMock(returncode=0)
+            process.stdout = asyncio.StreamReader()
+            process.stdout.feed_data(b"x" * 100_000 + b"\nBUILD SUCCESS\n")
+            process.stdout.feed_eof()
+            process.wait = AsyncMock(return_value=0)
+            return process
+
+        with patch(
+            "sdlc_agents.agents.code_repo_agent.asyncio.create_subprocess_exec",
+            side_effect=fake_exec,
+        ):
+            result = await code_agent._run_maven_build()
+
+        assert result["success"] is True
+        assert result["stdout"].endswith("BUILD SUCCESS\n")
+        assert len(result["stdout"]) == 65536
+        assert Path(result["stdout_path"]).stat().st_size > 100_000
+        assert result["errors"] == []
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_and_reaps_process(self, code_agent, monkeypatch):
+        """Test that a build exceeding the timeout is killed and waited for."""
+        from sdlc_agents.config import settings
+
+        monkeypatch.setattr(settings, "build_timeout", 0.05)
+        killed = asyncio.Event()
+        process = MagicMock(returncode=None)
+        process.stdout = asyncio.StreamReader()
+        process.kill.side_effect = killed.set
+
+        async def wait():
+            await killed.wait()
+
+        process.wait = AsyncMock(side_effect=wait)
+
+        with patch(
+            "sdlc_agents.agents.code_repo_agent.asyncio.create_subprocess_exec",
+            AsyncMock(return_value=process),
+        ):
+            result = await code_agent._run_maven_build()
+
+        assert result["error"] == "Build timed out"
+        process.kill.assert_called_once()
+        assert process.wait.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_maven_flags_and_opts(self, code_agent):
+        """Test that builds run in parallel, without transfer progress and with MAVEN_OPTS."""
+        from sdlc_agents.config import settings
+
+        async def fake_exec(*args, stdout, stderr, **kwargs):
+            process = MagicMock(returncode=0)
+            process.stdout = asyncio.StreamReader()
+            process.stdout.feed_eof()
+            process.wait = AsyncMock(return_value=0)
+            return process
+
+        with patch(
+            "sdlc_agents.agents.code_repo_agent.asyncio.create_subprocess_exec",
+            side_effect=fake_exec,
+        ) as mock_exec:
+            await code_agent._run_maven_build()
+
+        args = mock_exec.call_args.args
+        assert args[1:4] == ("-T", settings.maven_thread_factor, "-ntp")
+        assert mock_exec.call_args.kwargs["env"]["MAVEN_OPTS"] == settings.maven_opts
+
+    @pytest.mark.asyncio
+    async def test_error_lines_collected_while_streaming(self, code_agent):
+        """Test that only error lines are kept, across chunk boundaries and capped."""
+        output = b"".join(
+            b"[INFO] compiling\n" * 5000 + b"[ERROR] Foo.java:[%d] cannot find symbol\r\n" % i
+            for i in range(300)
+        ) + b"[INFO] BUILD FAILURE"
+
+        async def fake_exec(*args, stdout, stderr, **kwargs):
+            process = MagicMock(returncode=1)
+            process.stdout = asyncio.StreamReader()
+            process.stdout.feed_data(output)
+            process.stdout.feed_eof()
+            process.wait = AsyncMock(return_value=1)
+            return process
+
+        with patch(
+            "sdlc_agents.agents.code_repo_agent.asyncio.create_subprocess_exec",
+            side_effect=fake_exec,
+        ):
+            result = await code_agent._run_maven_build()
+
+        assert result["success"] is False
+        assert len(result["errors"]) == 200
+        assert result["errors"][0] == "[ERROR] Foo.java:[101] cannot find symbol"
+        assert result["errors"][-1] == "[INFO] BUILD FAILURE"
+        assert Path(result["stdout_path"]).read_bytes() == output
+
+
+@pytest.mark.unit
+class TestGitOperations:
+    """Tests for git operations against a local origin."""
+
+    @pytest.mark.asyncio
+    async def test_create_branch_from_latest_origin_main(self, code_agent, tmp_path):
+        """Test that a feature branch starts at the remote main tip."""
+        from git import Repo
+
+        origin = Repo.init(tmp_path / "origin", initial_branch="main")
+        (tmp_path / "origin" / "README.md").write_text("v1")
+        origin.index.add(["README.md"])
+        origin.index.commit("Initial commit")
+
+        code_agent.repo = Repo.clone_from(origin.working_dir, code_agent.repo_path)
+
+        # origin moves ahead after the clone
+        (tmp_path / "origin" / "README.md").write_text("v2")
+        origin.index.add(["README.md"])
+        latest = origin.index.commit("Second commit")
+
+        await code_agent._create_branch("feature/1-test")
+
+        assert code_agent.repo.active_branch.name == "feature/1-test"
+        assert code_agent.repo.head.commit.hexsha == latest.hexsha
+
+    @pytest.mark.asyncio
+    async def test_create_branch_reuses_existing_branch(self, code_agent, tmp_path):
+        """Test that an existing feature branch is checked out, not reset to main."""
+        from git import Repo
+
+        origin = Repo.init(tmp_path / "origin", initial_branch="main")
+        (tmp_path / "origin" / "README.md").write_text("v1")
+        origin.index.add(["README.md"])
+        origin.index.commit("Initial commit")
+        code_agent.repo = Repo.clone_from(origin.working_dir, code_agent.repo_path)
+        code_agent._configure_git()
+
+        await code_agent._create_branch("feature/1-test")
+        (code_agent.repo_path / "App.java").write_text("class App {}")
+        await code_agent._commit_changes("Work in progress")
+        work = code_agent.repo.head.commit
+        code_agent.repo.git.checkout("main")
+
+        await code_agent._create_branch("feature/1-test")
+
+        assert code_agent.repo.active_branch.name == "feature/1-test"
+        assert code_agent.repo.head.commit == work
+
+    @pytest.mark.asyncio
+    async def test_initialize_repo_clones_and_configures(self, code_agent, tmp_path):
+        """Test that a missing checkout is cloned and given the agent identity."""
+        from git import Repo
+
+        from sdlc_agents.config import settings
+
+        origin = Repo.init(tmp_path / "origin", initial_branch="main")
+        (tmp_path / "origin" / "README.md").write_text("v1")
+        origin.index.add(["README.md"])
+        origin.index.commit("Initial commit")
+        code_agent.repo_url = origin.working_dir
+        code_agent.repo_path = tmp_path / "clone"
+
+        assert await code_agent.initialize_repo() is True
+
+        assert (tmp_path / "clone" / "README.md").read_text() == "v1"
+        reader = code_agent.repo.config_reader("repository")
+        assert reader.get_value("user", "name") == settings.git_user_name
+
+    @pytest.mark.asyncio
+    async def test_commit_changes_includes_new_and_deleted_files(self, code_agent):
+        """Test that committing stages additions and deletions."""
+        from git import Repo
+
+        repo = Repo.init(code_agent.repo_path, initial_branch="main")
+        (code_agent.repo_path / "Old.java").write_text("class Old {}")
+        repo.index.add(["Old.java"])
+        repo.index.commit("Initial commit")
+        code_agent.repo = repo
+        code_agent._configure_git()
+
+        (code_agent.repo_path / "Old.java").unlink()
+        (code_agent.repo_path / "New.java").write_text("class New {}")
+        await code_agent._commit_changes("Replace Old with New")
+
+        head = repo.head.commit
+        assert head.message.strip() == "Replace Old with New"
+        assert [blob.path for blob in head.tree.blobs] == ["New.java"]
+        assert not repo.is_dirty(untracked_files=True)
+
+    @pytest.mark.asyncio
+    async def test_commit_changes_skips_clean_tree(self, code_agent):
+        """Test that committing a clean tree is a no-op rather than an error."""
+        from git import Repo
+
+        repo = Repo.init(code_agent.repo_path, initial_branch="main")
+        (code_agent.repo_path / "App.java").write_text("class App {}")
+        repo.index.add(["App.java"])
+        initial = repo.index.commit("Initial commit")
+        code_agent.repo = repo
+
+        await code_agent._commit_changes("Nothing changed")
+
+        assert repo.head.commit == initial
+
+    @pytest.mark.asyncio
+    async def test_commit_changes_without_configured_identity(self, code_agent, monkeypatch):
+        """Test that committing works when git has no user.name/user.email."""
+        from git import Repo
+
+        from sdlc_agents.config import settings
+
+        # Hide any global or system identity from git
+        monkeypatch.setenv("GIT_CONFIG_GLOBAL", "/dev/null")
+        monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+        repo = Repo.init(code_agent.repo_path, initial_branch="main")
+        code_agent.repo = repo
+
+        (code_agent.repo_path / "App.java").write_text("class App {}")
+        await code_agent._commit_changes("Add App")
+
+        assert repo.head.commit.author.name == settings.git_user_name
+        assert repo.head.commit.committer.email == settings.git_user_email
+
+    def test_read_blob_reuses_batch_process(self, code_agent):
+        """Test that blob reads share one cat-file process."""
+        from git import Repo
+
+        repo = Repo.init(code_agent.repo_path, initial_branch="main")
+        (code_agent.repo_path / "pom.xml").write_text("<project/>")
+        (code_agent.repo_path / "README.md").write_text("readme")
+        repo.index.add(["pom.xml", "README.md"])
+        repo.index.commit("Initial commit")
+        code_agent.repo = repo
+
+        assert code_agent.read_blob("HEAD", "pom.xml") == b"<project/>"
+        batch = repo.git.cat_file_all
+        assert code_agent.read_blob("main", "README.md") == b"readme"
+        assert repo.git.cat_file_all is batch
+
+
+@pytest.mark.unit
+class TestBuildLogParsing:
+    """Tests for build monitor parsing helpers."""
+
+    def test_extract_nested_json(self):
+        """Test extracting a nested JSON object from surrounding prose."""
+        content = 'Here you go:\n```json\n{"a": {"b": "}"}, "c": [1]}\n```\nDone }'
+
+        assert _extract_json_object(content) == '{"a": {"b": "}"}, "c": [1]}'
+
+    def test_scanner_completes_across_chunks(self):
+        """Test that a streamed object is detected when its closing brace arrives."""
+        scanner = _JsonObjectScanner()
+
+        assert scanner.feed("Sure: {\"a\": {\"b\"") is None
+        assert scanner.feed(': "x}"}') is None
+        assert scanner.feed('}\nMore text') == '{"a": {"b": "x}"}}'
+
+    def test_extract_json_missing(self):
+        """Test that unbalanced or absent JSON yields None."""
+        assert _extract_json_object("no json here") is None
+        assert _extract_json_object('{"a": 1') is None
+
+    def test_preclassify_intermittent_failure(self):
+        """Test that repeated network errors are classified without the LLM."""
+        logs = "npm ERR! ECONNRESET\nRetrying...\nnpm ERR! socket hang up"
+
+        analysis = _preclassify_failure(logs)
+
+        assert analysis["failure_type"] == "intermittent_failure"
+        assert analysis["is_intermittent"] is True
+        assert analysis["recommended_action"] == "retry"
+
+    def test_preclassify_compilation_error(self):
+        """Test that compiler errors are classified without the LLM."""
+        analysis = _preclassify_failure("src/app.ts(3,5): error TS2304: Cannot find name 'x'")
+
+        assert analysis["failure_type"] == "compilation_error"
+        assert analysis["is_intermittent"] is False
+
+    def test_preclassify_ambiguous_logs(self):
+        """Test that ambiguous logs are left for the LLM."""
+        assert _preclassify_failure("Tests run: 10, Failures: 1") is None
+        assert _preclassify_failure("ETIMEDOUT once") is None
+
+    def test_flaky_keywords_case_insensitive(self):
+        """Test the free-text intermittent failure fallback."""
+        assert _FLAKY_RE.search("This looks like a FLAKY test")
+        assert _FLAKY_RE.search("Probably a Race Condition in setup")
+        assert not _FLAKY_RE.search("Missing semicolon on line 3")
+
+    def test_log_fingerprint_ignores_run_specific_noise(self):
+        """Test that timestamps, temp paths and IDs don't change the fingerprint."""
+        first = "2025-01-01T10:00:00.123Z ERROR build 12345 failed in /tmp/build-abc/Foo.java"
+        second = "2025-02-03T11:22:33.456Z ERROR build 67890 failed in /tmp/build-xyz/Foo.java"
+
+        assert _log_fingerprint(first) == _log_fingerprint(second)
+        assert _log_fingerprint(first) != _log_fingerprint("ERROR compilation failed")
+
+
+@pytest.mark.unit
+class TestBuildTracking:
+    """Tests for build monitor build tracking and statistics."""
+
+    @pytest.fixture
+    def agent(self, mock_llm_provider, mock_clickhouse_memory, mock_ado_client):
+        """Build monitor agent wired to mocks."""
+        with (
+            patch(
+                "sdlc_agents.agents.build_monitor_agent.ADOClient",
+                **{"get_default.return_value": mock_ado_client},
+            ),
+            patch("sdlc_agents.agents.base.get_llm_provider", return_value=mock_llm_provider),
+            patch(
+                "sdlc_agents.agents.base.get_default_memory",
+                return_value=mock_clickhouse_memory,
+            ),
+        ):
+            yield BuildMonitorAgent()
+
+    def test_agent_uses_slots(self, agent):
+        """Test that agents carry no instance __dict__ and frozen capabilities."""
+        assert not hasattr(agent, "__dict__")
+        assert isinstance(agent.capabilities, frozenset)
+        assert AgentCapability.BUILD_MONITORING in agent.capabilities
+
+    @pytest.mark.asyncio
+    async def test_cached_analysis_read_off_event_loop(self, agent, mock_clickhouse_memory):
+        """Test that the analysis cache lookup runs in a worker thread."""
+        import threading
+
+        lookup_threads = []
+
+        def get_cached_analysis(fingerprint):
+            lookup_threads.append(threading.current_thread())
+            return {"is_intermittent": False, "failure_type": "test"}
+
+        mock_clickhouse_memory.get_cached_analysis.side_effect = get_cached_analysis
+
+        result = await agent._analyze_build_failure({
+            "build_id": 1,
+            "build_logs": "Tests run: 10, Failures: 1",
+        })
+
+        assert result["failure_type"] == "test"
+        assert lookup_threads and lookup_threads[0] is not threading.current_thread()
+
+    @pytest.mark.asyncio
+    async def test_retry_continues_chain(self, agent):
+        """Test that a retried build inherits and increments the retry count."""
+        agent._track_build(1, pr_id=100)
+
+        result = await agent._retry_build({"build_id": 1})
+
+        assert result["success"] is True
+        assert result["retry_count"] == 1
+        assert agent.monitored_builds[2] == {
+            "pr_id": 100,
+            "status": "inProgress",
+            "retry_count": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_wait_for_build_backs_off_until_complete(self, agent, mock_ado_client):
+        """Test that polling backs off exponentially until the build completes."""
+        mock_ado_client.get_build.side_effect = [
+            {"id": 1, "status": "inProgress", "result": None},
+            {"id": 1, "status": "inProgress", "result": None},
+            {"id": 1, "status": "completed", "result": "succeeded"},
+        ]
+
+        with patch(
+            "sdlc_agents.agents.build_monitor_agent.asyncio.sleep", new=AsyncMock()
+        ) as mock_sleep:
+            build = await agent._wait_for_build(1)
+
+        assert build["status"] == "completed"
+        assert [c.args[0] for c in mock_sleep.await_args_list] == [1.0, 2.0, 4.0]
+
+    @pytest.mark.asyncio
+    async def test_priority_semaphore_serves_lowest_key_first(self):
+        """Test that freed slots go to the most urgent waiter."""
+        sem = _PrioritySemaphore(1)
+        order = []
+
+        async def worker(name, priority):
+            async with sem.slot(priority):
+                order.append(name)
+
+        await sem.acquire()
+        tasks = [
+            asyncio.create_task(worker("fresh", (0.0, 1))),
+            asyncio.create_task(worker("nearly_done", (-0.9, 2))),
+        ]
+        await asyncio.sleep(0)
+        sem.release()
+        await asyncio.gather(*tasks)
+
+        assert order == ["nearly_done", "fresh"]
+
+    def test_ado_semaphore_reads_limit_on_first_use(self, monkeypatch):
+        """Test that the shared ADO limit comes from settings at first use, not import."""
+        from sdlc_agents.config import settings
+
+        monkeypatch.setattr(settings, "ado_max_concurrency", 2)
+        _ado_semaphore.cache_clear()
+        try:
+            assert _ado_semaphore()._value == 2
+            assert _ado_semaphore() is _ado_semaphore()
+        finally:
+            _ado_semaphore.cache_clear()
+
+    def test_build_statistics(self, agent):
+        """Test build statistics over tracked builds."""
+        agent._track_build(1, pr_id=100)
+        agent._track_build(2, pr_id=101, status="completed", retry_count=2)
+        agent._track_build(3, pr_id=102, status="completed")
+
+        assert agent.get_build_statistics() == {
+            "total_monitored": 3,
+            "builds_retried": 1,
+            "active_monitors": 1,
+        }
+
+        # Re-tracking a build replaces its row instead of double counting
+        agent._track_build(1, pr_id=100, status="completed", retry_count=1)
+
+        assert agent.get_build_statistics() == {
+            "total_monitored": 3,
+            "builds_retried": 2,
+            "active_monitors": 0,
+        }
+
+
 @pytest.mark.unit
 class TestBuildMonitorAgent:
     """Tests for Build Monitor Agent."""
@@ -519,3 +1271,88 @@ class TestReleaseManagerAgent:
 
         assert result["status"] == "completed"
         assert "release_notes" in result
+
+
+@pytest.mark.unit
+class TestReleaseReadiness:
+    """Tests for release readiness checks."""
+
+    @pytest.mark.asyncio
+    async def test_readiness_from_latest_builds(
+        self, mock_llm_provider, mock_clickhouse_memory, mock_ado_client
+    ):
+        """Test that each component is judged on its latest completed build."""
+        with (
+            patch(
+                "sdlc_agents.agents.release_manager_agent.ADOClient",
+                **{"get_default.return_value": mock_ado_client},
+            ),
+            patch("sdlc_agents.agents.base.get_llm_provider", return_value=mock_llm_provider),
+            patch(
+                "sdlc_agents.agents.base.get_default_memory",
+                return_value=mock_clickhouse_memory,
+            ),
+        ):
+            agent = ReleaseManagerAgent()
+
+        mock_ado_client.get_latest_builds.side_effect = None
+        mock_ado_client.get_latest_builds.return_value = {
+            "backend-api": {"result": "succeeded"},
+            "frontend-web": {"result": "failed"},
+            "worker": None,
+        }
+
+        result = await agent._verify_release_readiness({
+            "components": ["backend-api", "frontend-web", "worker"],
+            "source_branch": "main",
+        })
+
+        mock_ado_client.get_latest_builds.assert_called_once_with(
+            ["backend-api", "frontend-web", "worker"], "main"
+        )
+        assert result["ready"] is False
+        assert [check["ready"] for check in result["checks"]] == [True, False, False]
+        assert result["checks"][1]["issues"] == ["Build not passing: failed"]
+        assert result["checks"][2]["issues"] == ["No completed build on main"]
+
+
+@pytest.mark.unit
+class TestReleaseNotes:
+    """Tests for release notes generation."""
+
+    @pytest.mark.asyncio
+    async def test_header_rendered_around_llm_body(
+        self, mock_llm_provider, mock_clickhouse_memory, mock_ado_client
+    ):
+        """Test that the date, components and branch don't depend on the model."""
+        from datetime import date
+
+        with (
+            patch(
+                "sdlc_agents.agents.release_manager_agent.ADOClient",
+                **{"get_default.return_value": mock_ado_client},
+            ),
+            patch("sdlc_agents.agents.base.get_llm_provider", return_value=mock_llm_provider),
+            patch(
+                "sdlc_agents.agents.base.get_default_memory",
+                return_value=mock_clickhouse_memory,
+            ),
+        ):
+            agent = ReleaseManagerAgent()
+
+        body = "## 🎉 New Features\n- [Login](link): Added login"
+        think = AsyncMock(return_value=MagicMock(content=body))
+        with patch.object(ReleaseManagerAgent, "think", think):
+            result = await agent._generate_release_notes({
+                "components": ["backend-api", "frontend-web"],
+                "source_branch": "develop",
+            })
+
+        prompt = think.call_args.args[0]
+        assert "release_date" not in prompt
+        assert result["notes"] == (
+            "# Release Notes\n\n"
+            f"**Release Date**: {date.today().isoformat()}\n"
+            "**Components**: backend-api, frontend-web\n"
+            "**Source Branch**: develop\n\n" + body
+        )
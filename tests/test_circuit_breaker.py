@@ -0,0 +1,88 @@
+"""Tests for the circuit breaker."""
+
+import pytest
+
+from sdlc_agents import circuit_breaker
+from sdlc_agents.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+@pytest.mark.unit
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Controllable monotonic clock."""
+        now = [1000.0]
+        monkeypatch.setattr(circuit_breaker.time, "monotonic", lambda: now[0])
+        return now
+
+    @staticmethod
+    def _fail(breaker):
+        with pytest.raises(ValueError):
+            with breaker:
+                raise ValueError("service down")
+
+    def test_opens_after_threshold(self, clock):
+        """Test that the circuit opens after enough failures in the window."""
+        breaker = CircuitBreaker("svc", failure_threshold=3)
+
+        for _ in range(3):
+            self._fail(breaker)
+
+        assert breaker.is_open
+        with pytest.raises(CircuitOpenError):
+            with breaker:
+                pytest.fail("call should not run while the circuit is open")
+
+    def test_old_failures_expire(self, clock):
+        """Test that failures outside the window are not counted."""
+        breaker = CircuitBreaker("svc", failure_threshold=3, window_seconds=30)
+
+        self._fail(breaker)
+        self._fail(breaker)
+        clock[0] += 31
+        self._fail(breaker)
+
+        assert not breaker.is_open
+
+    def test_probe_after_cooldown(self, clock):
+        """Test that one probe runs after the cooldown and its outcome decides."""
+        breaker = CircuitBreaker("svc", failure_threshold=1, cooldown_seconds=60)
+        self._fail(breaker)
+
+        clock[0] += 61
+        self._fail(breaker)
+        assert breaker.is_open
+
+        clock[0] += 61
+        with breaker:
+            pass
+        assert not breaker.is_open
+
+    @pytest.mark.asyncio
+    async def test_async_context_manager(self, clock):
+        """Test that the async form records outcomes the same way."""
+        breaker = CircuitBreaker("svc", failure_threshold=1)
+
+        with pytest.raises(ValueError):
+            async with breaker:
+                raise ValueError("service down")
+
+        with pytest.raises(CircuitOpenError):
+            async with breaker:
+                pass
+
+    def test_rejected_requests_not_counted(self, clock):
+        """Test that exceptions is_failure rejects do not open the circuit."""
+        breaker = CircuitBreaker(
+            "svc", failure_threshold=1, is_failure=lambda e: not isinstance(e, KeyError)
+        )
+
+        with pytest.raises(KeyError):
+            with breaker:
+                raise KeyError("not found")
+        assert not breaker.is_open
+
+        self._fail(breaker)
+        assert breaker.is_open
@@ -0,0 +1,41 @@
+"""Tests for configuration loading."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+_SRC = Path(__file__).resolve().parent.parent / "src"
+
+
+@pytest.mark.unit
+class TestSettings:
+    """Tests for the lazily loaded global settings."""
+
+    def test_importing_cli_does_not_load_settings(self):
+        """Test that the environment is only read once a setting is used."""
+        script = (
+            "import sdlc_agents.cli\n"
+            "from sdlc_agents.config import get_settings, settings\n"
+            "assert get_settings.cache_info().misses == 0\n"
+            "settings.log_level\n"
+            "assert get_settings.cache_info().misses == 1\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            env={"PYTHONPATH": str(_SRC)},
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0, result.stderr
+
+    def test_writes_reach_the_settings_instance(self, monkeypatch):
+        """Test that assigning through the global updates the shared instance."""
+        from sdlc_agents.config import get_settings, settings
+
+        monkeypatch.setattr(settings, "max_retries", 7)
+
+        assert get_settings().max_retries == 7
+        assert settings.max_retries == 7
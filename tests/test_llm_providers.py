@@ -1,12 +1,26 @@
 """Tests for LLM providers."""
 
+import asyncio
+import json
+import os
+import time
+
+import orjson
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from sdlc_agents.llm.base import LLMMessage, LLMResponse, MessageRole
+from sdlc_agents.llm.base import (
+    LLMMessage,
+    LLMResponse,
+    MessageEncoder,
+    MessageRole,
+    RequestLimiter,
+)
+from sdlc_agents.llm.batcher import BatchScheduler
+from sdlc_agents.llm.cache import ResponseCache
 from sdlc_agents.llm.ollama_provider import OllamaProvider
 from sdlc_agents.llm.openai_provider import OpenAIProvider
-from sdlc_agents.llm.factory import get_llm_provider
+from sdlc_agents.llm.factory import get_llm_provider, reset_llm_provider
 
 
 @pytest.mark.unit
@@ -44,6 +58,32 @@ class TestOllamaProvider:
             assert response.tokens_used == 50
             assert response.finish_reason == "stop"
 
+    @pytest.mark.asyncio
+    async def test_stream_generate_splits_chunks(self):
+        """Test that NDJSON lines split across network chunks are reassembled."""
+        provider = OllamaProvider("http://localhost:11434", "test-model")
+
+        async def iter_any():
+            for chunk in (
+                b'{"message":{"content":"Hel"}}\n{"mess',
+                b'age":{"content":"lo"}}\n\nnot json\n',
+                b'{"done":true}',
+            ):
+                yield chunk
+
+        mock_response = MagicMock()
+        mock_response.raise_for_status = MagicMock()
+        mock_response.content.iter_any = iter_any
+        mock_session = MagicMock()
+        mock_session.post.return_value.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_session.post.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        with patch.object(provider, "_get_session", AsyncMock(return_value=mock_session)):
+            messages = [LLMMessage(role=MessageRole.USER, content="Hello")]
+            chunks = [chunk async for chunk in provider.stream_generate(messages)]
+
+        assert chunks == ["Hel", "lo"]
+
     @pytest.mark.asyncio
     async def test_health_check(self):
         """Test health check."""
@@ -107,11 +147,175 @@ class TestOpenAIProvider:
         """Test health check."""
         provider = OpenAIProvider("test-api-key", "gpt-4")
 
-        with patch.object(provider.client.models, "list") as mock_list:
-            mock_list.return_value = []
-
+        with patch.object(provider.client.models, "retrieve", AsyncMock()) as mock_retrieve:
             result = await provider.health_check()
             assert result is True
+            assert await provider.health_check() is True
+
+        mock_retrieve.assert_called_once()
+        assert mock_retrieve.call_args.args == ("gpt-4",)
+
+    def test_keeps_sdk_read_timeout(self):
+        """Test that long completions get the SDK's default read timeout."""
+        import openai
+
+        provider = OpenAIProvider("test-api-key", "gpt-4")
+
+        assert provider.client._client.timeout.read == openai.DEFAULT_TIMEOUT.read
+
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_open_circuit(self):
+        """Test that 4xx responses are re-raised without tripping the circuit breaker."""
+        import httpx
+        import openai
+
+        provider = OpenAIProvider("test-api-key", "gpt-4")
+        messages = [LLMMessage(role=MessageRole.USER, content="Hello")]
+        response = httpx.Response(400, request=httpx.Request("POST", "https://api.openai.com"))
+        bad_request = openai.BadRequestError("bad request", response=response, body=None)
+
+        with patch.object(provider.client.chat.completions, "create", side_effect=bad_request):
+            for _ in range(provider._breaker.failure_threshold + 1):
+                with pytest.raises(openai.BadRequestError):
+                    await provider.generate(messages)
+
+        assert not provider._breaker.is_open
+
+
+@pytest.mark.unit
+class TestLLMResponse:
+    """Tests for LLM responses."""
+
+    def test_raw_serialized_on_demand(self):
+        """Test that the raw provider response is only dumped when requested."""
+        source = MagicMock()
+        source.model_dump.return_value = {"id": "resp-1"}
+        response = LLMResponse(content="Hi", model="gpt-4", raw_source=source)
+
+        source.model_dump.assert_not_called()
+        assert response.raw() == {"id": "resp-1"}
+        assert response.raw() == {"id": "resp-1"}
+        source.model_dump.assert_called_once()
+
+
+@pytest.mark.unit
+class TestMessageEncoder:
+    """Tests for the chat message encoder."""
+
+    def test_reuses_identical_prefix(self):
+        """Test that a repeated prefix of the same messages keeps its dicts."""
+        encoder = MessageEncoder()
+        system = LLMMessage(role=MessageRole.SYSTEM, content="You are helpful")
+        first = encoder.encode([system, LLMMessage(role=MessageRole.USER, content="Hi")])
+        second = encoder.encode([system, LLMMessage(role=MessageRole.USER, content="Bye")])
+
+        assert second[0] is first[0]
+        assert first[1]["content"] == "Hi"
+        assert second == [
+            {"role": "system", "content": "You are helpful"},
+            {"role": "user", "content": "Bye"},
+        ]
+
+    def test_equal_but_distinct_messages_reencoded(self):
+        """Test that only identical message objects are reused."""
+        encoder = MessageEncoder()
+        first = encoder.encode([LLMMessage(role=MessageRole.USER, content="Hi")])
+        second = encoder.encode([LLMMessage(role=MessageRole.USER, content="Hi")])
+
+        assert second == first
+        assert second[0] is not first[0]
+
+    def test_roles_serialize_as_strings(self):
+        """Test that the role members in encoded dicts serialize as plain strings."""
+        encoded = MessageEncoder().encode([LLMMessage(role=MessageRole.USER, content="Hi")])
+
+        assert json.dumps(encoded) == '[{"role": "user", "content": "Hi"}]'
+        assert orjson.loads(orjson.dumps(encoded)) == [{"role": "user", "content": "Hi"}]
+
+
+@pytest.mark.unit
+class TestRequestLimiter:
+    """Tests for the provider request limiter."""
+
+    @pytest.mark.asyncio
+    async def test_caps_concurrent_requests(self):
+        """Test that no more than max_concurrency requests run at once."""
+        limiter = RequestLimiter(max_concurrency=2)
+        running = peak = 0
+
+        async def request():
+            nonlocal running, peak
+            async with limiter:
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(request() for _ in range(6)))
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_spaces_requests_per_minute(self):
+        """Test that request starts are spaced by the rate limit."""
+        limiter = RequestLimiter(max_concurrency=10, requests_per_minute=600)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        for _ in range(3):
+            async with limiter:
+                pass
+
+        assert loop.time() - start >= 0.19
+
+
+@pytest.mark.unit
+class TestOpenAIBatchJob:
+    """Tests for OpenAI Batch API jobs."""
+
+    @staticmethod
+    def _result_line(custom_id, content):
+        return (
+            b'{"custom_id":"%s","response":{"status_code":200,"body":{"model":"gpt-4",'
+            b'"choices":[{"message":{"content":"%s"},"finish_reason":"stop"}],'
+            b'"usage":{"total_tokens":5}}}}' % (custom_id.encode(), content.encode())
+        )
+
+    @pytest.mark.asyncio
+    async def test_results_returned_in_input_order(self):
+        """Test that a completed job's output is mapped back by custom_id."""
+        provider = OpenAIProvider("test-key", "gpt-4")
+        provider.client = MagicMock()
+        provider.client.files.create = AsyncMock(return_value=MagicMock(id="file-in"))
+        provider.client.batches.create = AsyncMock(
+            return_value=MagicMock(id="batch-1", status="in_progress")
+        )
+        provider.client.batches.retrieve = AsyncMock(
+            return_value=MagicMock(id="batch-1", status="completed", output_file_id="file-out")
+        )
+        provider.client.files.content = AsyncMock(return_value=MagicMock(
+            content=self._result_line("1", "second") + b"\n" + self._result_line("0", "first")
+        ))
+        batch = [[LLMMessage(role=MessageRole.USER, content=text)] for text in ("a", "b")]
+
+        responses = await provider.generate_batch_job(batch, poll_interval=0)
+
+        assert [response.content for response in responses] == ["first", "second"]
+        uploaded = provider.client.files.create.call_args.kwargs["file"][1]
+        assert len(uploaded.splitlines()) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_job_raises(self):
+        """Test that a job ending in failure raises."""
+        provider = OpenAIProvider("test-key", "gpt-4")
+        provider.client = MagicMock()
+        provider.client.files.create = AsyncMock(return_value=MagicMock(id="file-in"))
+        provider.client.batches.create = AsyncMock(
+            return_value=MagicMock(id="batch-1", status="failed", output_file_id=None)
+        )
+
+        with pytest.raises(RuntimeError, match="status failed"):
+            await provider.generate_batch_job([[LLMMessage(role=MessageRole.USER, content="a")]])
 
 
 @pytest.mark.unit
@@ -137,6 +341,30 @@ class TestLLMFactory:
         provider = get_llm_provider()
         assert isinstance(provider, OpenAIProvider)
 
+    def test_provider_shared(self, monkeypatch):
+        """Test that the same configuration reuses one provider."""
+        from sdlc_agents.config import settings
+
+        monkeypatch.setattr(settings, "llm_provider", "openai")
+        monkeypatch.setattr(settings, "openai_api_key", "test-key")
+
+        provider = get_llm_provider()
+        assert get_llm_provider() is provider
+        assert provider.client.max_retries == 3
+
+        monkeypatch.setattr(settings, "openai_model", "other-model")
+        assert get_llm_provider() is not provider
+
+    def test_reset_llm_provider(self, monkeypatch):
+        """Test that reset_llm_provider() drops the shared provider."""
+        from sdlc_agents.config import settings
+
+        monkeypatch.setattr(settings, "llm_provider", "ollama")
+
+        provider = get_llm_provider()
+        reset_llm_provider()
+        assert get_llm_provider() is not provider
+
     def test_missing_openai_key(self, monkeypatch):
         """Test error when OpenAI key is missing."""
         from sdlc_agents.config import settings
@@ -146,3 +374,122 @@ class TestLLMFactory:
 
         with pytest.raises(ValueError, match="OpenAI API key not configured"):
             get_llm_provider()
+
+
+@pytest.mark.unit
+class TestBatchScheduler:
+    """Tests for the LLM batching scheduler."""
+
+    @pytest.mark.asyncio
+    async def test_deduplicates_identical_requests(self, mock_llm_provider):
+        """Test identical concurrent requests share one provider call."""
+        scheduler = BatchScheduler()
+        mock_llm_provider.generate = AsyncMock(
+            return_value=LLMResponse(content="shared", model="mock-model")
+        )
+        messages = [LLMMessage(role=MessageRole.USER, content="Same question")]
+
+        responses = await asyncio.gather(
+            *(scheduler.submit(mock_llm_provider, messages, 0.3) for _ in range(3))
+        )
+
+        assert [r.content for r in responses] == ["shared"] * 3
+        assert mock_llm_provider.generate.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_coalesces_concurrent_requests(self, mock_llm_provider):
+        """Test distinct concurrent requests are sent as one batch."""
+        scheduler = BatchScheduler()
+        batch_spy = AsyncMock(wraps=mock_llm_provider.generate_batch)
+        mock_llm_provider.generate_batch = batch_spy
+
+        responses = await asyncio.gather(
+            scheduler.submit(
+                mock_llm_provider, [LLMMessage(role=MessageRole.USER, content="first")]
+            ),
+            scheduler.submit(
+                mock_llm_provider, [LLMMessage(role=MessageRole.USER, content="second")]
+            ),
+        )
+
+        assert responses[0].content == "Mock response to: first"
+        assert responses[1].content == "Mock response to: second"
+        assert batch_spy.await_count == 1
+        assert len(batch_spy.await_args[0][0]) == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_is_isolated(self, mock_llm_provider):
+        """Test one failing request does not fail the rest of its batch."""
+        scheduler = BatchScheduler()
+        original_generate = mock_llm_provider.generate
+
+        async def flaky_generate(messages, **kwargs):
+            if messages[-1].content == "bad":
+                raise RuntimeError("boom")
+            return await original_generate(messages, **kwargs)
+
+        mock_llm_provider.generate = flaky_generate
+
+        good, bad = await asyncio.gather(
+            scheduler.submit(
+                mock_llm_provider, [LLMMessage(role=MessageRole.USER, content="good")]
+            ),
+            scheduler.submit(
+                mock_llm_provider, [LLMMessage(role=MessageRole.USER, content="bad")]
+            ),
+            return_exceptions=True,
+        )
+
+        assert good.content == "Mock response to: good"
+        assert isinstance(bad, RuntimeError)
+
+
+@pytest.mark.unit
+class TestResponseCache:
+    """Tests for the disk-backed LLM response cache."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that a stored response is returned for the same key."""
+        cache = ResponseCache(tmp_path / "llm-cache")
+        key = ResponseCache.make_key("system", "prompt", "test-model", 0.7)
+
+        assert cache.get(key) is None
+
+        cache.put(key, LLMResponse(content="Answer", model="test-model", tokens_used=5))
+        cached = cache.get(key)
+
+        assert cached.content == "Answer"
+        assert cached.tokens_used == 5
+        assert list((tmp_path / "llm-cache").iterdir()) == [tmp_path / "llm-cache" / f"{key}.json"]
+
+    def test_key_covers_all_inputs(self):
+        """Test that changing any input changes the key."""
+        base = ResponseCache.make_key("system", "prompt", "model", 0.7)
+
+        assert ResponseCache.make_key("system", "prompt", "model", 0.7) == base
+        assert ResponseCache.make_key("other", "prompt", "model", 0.7) != base
+        assert ResponseCache.make_key("system", "prompt", "model", 0.3) != base
+        assert ResponseCache.make_key("system", "prompt", "model", 0.7, "ctx") != base
+
+    def test_expired_entry_is_a_miss(self, tmp_path):
+        """Test that entries older than the TTL are dropped on lookup."""
+        cache = ResponseCache(tmp_path, ttl_seconds=60)
+        key = ResponseCache.make_key("system", "prompt", "test-model", 0.7)
+        cache.put(key, LLMResponse(content="Answer", model="test-model"))
+        assert cache.get(key) is not None
+
+        old = time.time() - 120
+        os.utime(tmp_path / f"{key}.json", (old, old))
+
+        assert cache.get(key) is None
+        assert not (tmp_path / f"{key}.json").exists()
+
+    def test_failed_write_leaves_no_temp_file(self, tmp_path):
+        """Test that a failed write cleans up its temporary file."""
+        cache = ResponseCache(tmp_path)
+        key = ResponseCache.make_key("system", "prompt", "test-model", 0.7)
+
+        with patch("sdlc_agents.llm.cache.os.replace", side_effect=OSError("disk full")):
+            cache.put(key, LLMResponse(content="Answer", model="test-model"))
+
+        assert list(tmp_path.iterdir()) == []
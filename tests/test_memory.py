@@ -1,11 +1,19 @@
 """Tests for memory system."""
 
-from datetime import datetime
+import asyncio
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from sdlc_agents.memory.clickhouse_memory import ClickHouseMemory, MemoryEntry
+from sdlc_agents.memory import clickhouse_memory
+from sdlc_agents.memory.clickhouse_memory import ClickHouseMemory, MemoryEntry, get_default_memory
+
+
+@pytest.fixture(autouse=True)
+def fresh_schema_state(monkeypatch):
+    """Make every test's ClickHouseMemory run schema initialization."""
+    monkeypatch.setattr(clickhouse_memory, "_initialized_schemas", set())
 
 
 @pytest.mark.unit
@@ -16,7 +24,7 @@ class TestMemoryEntry:
         """Test creating a memory entry."""
         entry = MemoryEntry(
             agent_id="test-agent",
-            timestamp=datetime.now(),
+            timestamp=time.time_ns(),
             memory_type="conversation",
             content="Test content",
             metadata={"key": "value"},
@@ -29,6 +37,21 @@ class TestMemoryEntry:
         assert entry.metadata == {"key": "value"}
         assert entry.session_id == "session-123"
 
+    def test_content_preview_truncated_once(self):
+        """Test that the content preview is computed at creation time."""
+        entry = MemoryEntry(
+            agent_id="test-agent",
+            timestamp=time.time_ns(),
+            memory_type="conversation",
+            content="x" * 500,
+            metadata={},
+        )
+
+        assert entry.content_preview == "x" * 200
+        assert len(entry.content) == 500
+        # Slotted: no per-instance __dict__
+        assert not hasattr(entry, "__dict__")
+
 
 @pytest.mark.unit
 class TestClickHouseMemory:
@@ -48,6 +71,42 @@ class TestClickHouseMemory:
         assert any("CREATE DATABASE" in str(call) for call in calls)
         assert any("CREATE TABLE" in str(call) for call in calls)
 
+    @patch("clickhouse_connect.get_client")
+    def test_schema_initialized_once(self, mock_get_client):
+        """Test that another instance for the same database skips the DDL."""
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+
+        ClickHouseMemory()
+        ddl_count = mock_client.command.call_count
+        ClickHouseMemory()
+
+        assert ddl_count > 0
+        assert mock_client.command.call_count == ddl_count
+
+    @patch("clickhouse_connect.get_client")
+    def test_migrates_string_metadata(self, mock_get_client):
+        """Test that a JSON String metadata column is replaced by a Map."""
+        mock_client = MagicMock()
+        mock_client.command.side_effect = (
+            lambda sql, **kwargs: "String" if "system.columns" in sql else None
+        )
+        mock_get_client.return_value = mock_client
+
+        ClickHouseMemory()
+
+        calls = [call.args[0] for call in mock_client.command.call_args_list]
+        assert any("RENAME COLUMN metadata TO metadata_json" in sql for sql in calls)
+        assert any("ADD COLUMN metadata Map" in sql for sql in calls)
+
+    def test_metadata_map_values_are_strings(self):
+        """Test that metadata values are converted for the Map column."""
+        assert ClickHouseMemory._metadata_map({"model": "m", "tokens": 5, "stream": True}) == {
+            "model": "m",
+            "tokens": "5",
+            "stream": "true",
+        }
+
     @patch("clickhouse_connect.get_client")
     def test_store_memory(self, mock_get_client):
         """Test storing a memory entry."""
@@ -58,18 +117,24 @@ class TestClickHouseMemory:
 
         entry = MemoryEntry(
             agent_id="test-agent",
-            timestamp=datetime.now(),
+            timestamp=time.time_ns(),
             memory_type="observation",
             content="Test observation",
             metadata={"test": "data"},
         )
 
         memory.store_memory(entry)
+        memory.flush_buffered()
 
         # Verify insert was called
         assert mock_client.insert.called
         call_args = mock_client.insert.call_args
         assert "agent_memory" in call_args[0][0]
+        # Nanosecond timestamps are written as DateTime64(3) millisecond ticks
+        assert call_args.kwargs["column_oriented"] is True
+        assert call_args[0][1][1] == [entry.timestamp // 1_000_000]
+        # Metadata is written as a Map, non-string values JSON-encoded
+        assert call_args[0][1][5] == [{"test": "data"}]
 
     @patch("clickhouse_connect.get_client")
     def test_get_recent_memories(self, mock_get_client):
@@ -77,19 +142,19 @@ class TestClickHouseMemory:
         mock_client = MagicMock()
         mock_get_client.return_value = mock_client
 
-        # Mock query result
-        mock_result = MagicMock()
-        mock_result.result_rows = [
+        # Mock query result, as streamed by query_rows_stream()
+        rows = [
             (
                 "test-agent",
-                datetime.now(),
+                time.time_ns(),
                 "conversation",
                 "Test content",
-                '{"key": "value"}',
+                "Test",
+                {"key": "value"},
                 "session-123",
             )
         ]
-        mock_client.query.return_value = mock_result
+        mock_client.query_rows_stream.return_value.__enter__.return_value = rows
 
         memory = ClickHouseMemory()
         memories = memory.get_recent_memories("test-agent", limit=10)
@@ -98,6 +163,9 @@ class TestClickHouseMemory:
         assert memories[0].agent_id == "test-agent"
         assert memories[0].memory_type == "conversation"
         assert memories[0].content == "Test content"
+        assert memories[0].metadata == {"key": "value"}
+        # The stored preview is used as-is
+        assert memories[0].content_preview == "Test"
 
     @patch("clickhouse_connect.get_client")
     def test_log_action(self, mock_get_client):
@@ -111,15 +179,40 @@ class TestClickHouseMemory:
             agent_id="test-agent",
             action_type="code_generation",
             target="test.py",
-            parameters={"language": "python"},
+            parameters={"language": "python", 1: "numeric key"},
             result={"success": True},
             success=True,
             duration_ms=1500,
         )
+        memory.flush_buffered()
 
         assert mock_client.insert.called
         call_args = mock_client.insert.call_args
         assert "agent_actions" in call_args[0][0]
+        # JSON columns hold compact JSON; non-string keys become strings as with json.dumps
+        assert call_args[0][1][4] == ['{"language":"python","1":"numeric key"}']
+        # Action logs are batched server-side without waiting for the insert
+        assert call_args.kwargs["settings"]["async_insert"] == 1
+        assert call_args.kwargs["settings"]["wait_for_async_insert"] == 0
+
+    @patch("clickhouse_connect.get_client")
+    def test_agent_statistics_cacheable(self, mock_get_client):
+        """Test that statistics queries use a bucketed window and the query cache."""
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+
+        # Rows as streamed by query_rows_stream()
+        rows = [("code_generation", 4, 120.0, 3, 1)]
+        mock_client.query_rows_stream.return_value.__enter__.return_value = rows
+
+        memory = ClickHouseMemory()
+        stats = memory.get_agent_statistics("test-agent", hours=2)
+
+        assert stats["code_generation"]["failed"] == 1
+        call = mock_client.query_rows_stream.call_args
+        assert "now()" not in call.args[0]
+        assert call.kwargs["parameters"]["since"] % 60 == 0
+        assert call.kwargs["settings"]["use_query_cache"] == 1
 
     @patch("clickhouse_connect.get_client")
     def test_search_memories(self, mock_get_client):
@@ -127,18 +220,19 @@ class TestClickHouseMemory:
         mock_client = MagicMock()
         mock_get_client.return_value = mock_client
 
-        mock_result = MagicMock()
-        mock_result.result_rows = [
+        # Rows as streamed by query_rows_stream()
+        rows = [
             (
                 "test-agent",
-                datetime.now(),
+                time.time_ns(),
                 "observation",
                 "Test search result",
-                "{}",
+                "Test search result",
+                {},
                 None,
             )
         ]
-        mock_client.query.return_value = mock_result
+        mock_client.query_rows_stream.return_value.__enter__.return_value = rows
 
         memory = ClickHouseMemory()
         results = memory.search_memories("test-agent", "search", limit=50)
@@ -146,6 +240,13 @@ class TestClickHouseMemory:
         assert len(results) == 1
         assert results[0].content == "Test search result"
 
+        # Case-folded LIKE pattern, so the ngram index on lowerUTF8(content) applies
+        memory.search_memories("test-agent", "100% Done_")
+        sql = mock_client.query_rows_stream.call_args.args[0]
+        assert "lowerUTF8(content) LIKE" in sql
+        parameters = mock_client.query_rows_stream.call_args.kwargs["parameters"]
+        assert parameters["pattern"] == r"%100\% done\_%"
+
     @patch("clickhouse_connect.get_client")
     def test_store_work_item(self, mock_get_client):
         """Test storing a work item."""
@@ -163,7 +264,250 @@ class TestClickHouseMemory:
             assigned_agent="test-agent",
             metadata={"priority": "high"},
         )
+        memory.flush_buffered()
 
         assert mock_client.insert.called
         call_args = mock_client.insert.call_args
         assert "work_items" in call_args[0][0]
+        assert call_args.kwargs["settings"] is None
+
+    @patch("clickhouse_connect.get_client")
+    def test_get_work_item_sees_buffered_store(self, mock_get_client):
+        """Test that a stored work item is inserted before it is read back."""
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        calls = []
+
+        def record_query(sql, **kwargs):
+            calls.append(("query", sql))
+            return MagicMock(result_rows=[])
+
+        mock_client.insert.side_effect = lambda table, *a, **kw: calls.append(("insert", table))
+        mock_client.query.side_effect = record_query
+
+        memory = ClickHouseMemory()
+        memory.store_work_item(
+            work_item_id="12345",
+            item_type="User Story",
+            title="Test Story",
+            description="",
+            state="New",
+        )
+        memory.get_work_item("12345")
+
+        assert [kind for kind, _ in calls] == ["insert", "query"]
+        assert "work_items" in calls[0][1]
+        assert memory._writers["work_items"].buffer_len == 0
+
+    @patch("clickhouse_connect.get_client")
+    def test_get_work_item_latest_version(self, mock_get_client):
+        """Test that a work item is read as its latest version via argMax."""
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+
+        mock_result = MagicMock()
+        mock_result.result_rows = [
+            ("12345", "ts", "User Story", "Story", "Desc", "Active", None, '{"a": 1}')
+        ]
+        mock_client.query.return_value = mock_result
+
+        memory = ClickHouseMemory()
+        item = memory.get_work_item("12345")
+
+        assert item["state"] == "Active"
+        assert item["metadata"] == {"a": 1}
+        sql = mock_client.query.call_args.args[0]
+        assert "argMax(state, timestamp)" in sql
+        assert "ORDER BY" not in sql
+
+        mock_result.result_rows = []
+        assert memory.get_work_item("missing") is None
+
+    @patch("clickhouse_connect.get_client")
+    def test_store_cached_analysis(self, mock_get_client):
+        """Test caching a build failure analysis."""
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+
+        memory = ClickHouseMemory()
+        memory.store_cached_analysis("abc123", {"failure_type": "test_failure"})
+
+        assert mock_client.insert.called
+        call_args = mock_client.insert.call_args
+        assert "build_analysis_cache" in call_args[0][0]
+        row = call_args[0][1][0]
+        assert row[0] == "abc123"
+        assert row[2] > row[1]
+
+    @patch("clickhouse_connect.get_client")
+    def test_get_cached_analysis(self, mock_get_client):
+        """Test retrieving a cached build failure analysis."""
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+
+        mock_result = MagicMock()
+        mock_result.result_rows = [('{"failure_type": "test_failure"}',)]
+        mock_client.query.return_value = mock_result
+
+        memory = ClickHouseMemory()
+
+        assert memory.get_cached_analysis("abc123") == {"failure_type": "test_failure"}
+
+        mock_result.result_rows = []
+        assert memory.get_cached_analysis("missing") is None
+
+    @pytest.mark.asyncio
+    @patch("clickhouse_connect.get_client")
+    async def test_buffered_writes_batch_into_one_insert(self, mock_get_client):
+        """Test that buffered memories are flushed as a single insert."""
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+
+        memory = ClickHouseMemory()
+
+        for i in range(3):
+            await memory.store_memory_async(
+                MemoryEntry(
+                    agent_id="test-agent",
+                    timestamp=time.time_ns(),
+                    memory_type="observation",
+                    content=f"Observation {i}",
+                    metadata={},
+                )
+            )
+
+        assert not mock_client.insert.called
+
+        await memory.flush()
+
+        assert mock_client.insert.call_count == 1
+        call_args = mock_client.insert.call_args
+        assert "agent_memory" in call_args[0][0]
+        # One column per table column, each holding all three rows
+        assert [len(column) for column in call_args[0][1]] == [3] * 7
+
+    @pytest.mark.asyncio
+    async def test_async_flush_keeps_loop_responsive(self):
+        """Test that a slow insert doesn't block other tasks on the event loop."""
+        client = MagicMock()
+        client.insert.side_effect = lambda *args, **kwargs: time.sleep(0.2)
+        writer = clickhouse_memory.AsyncBufferedWriter(
+            client, "db.table", ["a"], flush_interval=60
+        )
+        writer.put_nowait((1,))
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker_task = asyncio.create_task(ticker())
+        await writer.close()
+        ticker_task.cancel()
+
+        client.insert.assert_called_once()
+        assert ticks > 5
+
+    @patch("clickhouse_connect.get_client")
+    def test_sync_writes_batch_into_one_insert(self, mock_get_client):
+        """Test that synchronous stores are buffered until flushed or closed."""
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+
+        memory = ClickHouseMemory()
+
+        for i in range(3):
+            memory.store_work_item(
+                work_item_id=str(i),
+                item_type="User Story",
+                title=f"Story {i}",
+                description="",
+                state="New",
+            )
+
+        assert not mock_client.insert.called
+
+        memory.close()
+
+        assert mock_client.insert.call_count == 1
+        call_args = mock_client.insert.call_args
+        assert "work_items" in call_args[0][0]
+        assert call_args[0][1][0] == ["0", "1", "2"]
+
+    def test_buffered_writer_flushes_when_full(self):
+        """Test that a full buffer is inserted without waiting for the timer."""
+        client = MagicMock()
+        writer = clickhouse_memory.BufferedWriter(
+            client, "db.table", ["a"], max_rows=2, flush_interval=60
+        )
+
+        writer.put([1])
+        assert not client.insert.called
+
+        writer.put([2])
+        client.insert.assert_called_once_with(
+            "db.table", [[1, 2]], column_names=["a"], column_oriented=True, settings=None
+        )
+
+    def test_buffered_writer_sorts_batches(self):
+        """Test that a batch is sorted by the sort key before it is inserted."""
+        client = MagicMock()
+        writer = clickhouse_memory.BufferedWriter(
+            client, "db.table", ["agent_id", "timestamp"], sort_key=clickhouse_memory.LOG_SORT_KEY
+        )
+
+        for row in (["b", 1], ["a", 2], ["a", 1]):
+            writer.put(row)
+        writer.flush()
+
+        assert client.insert.call_args[0][1] == [["a", "a", "b"], [1, 2, 1]]
+
+    def test_buffered_writer_flushes_on_timer(self):
+        """Test that buffered rows are inserted after the flush interval."""
+        client = MagicMock()
+        writer = clickhouse_memory.BufferedWriter(
+            client, "db.table", ["a"], flush_interval=0.01, min_interval=0
+        )
+
+        writer.put([1])
+        deadline = time.monotonic() + 2
+        while not client.insert.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        client.insert.assert_called_once_with(
+            "db.table", [[1]], column_names=["a"], column_oriented=True, settings=None
+        )
+
+    def test_buffered_writer_limits_timed_insert_rate(self):
+        """Test that timed flushes wait for the minimum interval since the last insert."""
+        client = MagicMock()
+        writer = clickhouse_memory.BufferedWriter(
+            client, "db.table", ["a"], flush_interval=0.01, min_interval=60
+        )
+        writer.last_flush = time.monotonic()
+
+        writer.put([1])
+        time.sleep(0.1)
+        assert not client.insert.called
+        assert writer.buffer_len == 1
+
+        # Explicit flushes are never deferred
+        writer.flush()
+        assert client.insert.call_count == 1
+        assert writer.buffer_len == 0
+
+    @patch("clickhouse_connect.get_client")
+    def test_default_memory_is_shared(self, mock_get_client, monkeypatch):
+        """Test that agents share a single memory store and client."""
+        monkeypatch.setattr(clickhouse_memory, "_default_memory", None)
+
+        first = get_default_memory()
+        second = get_default_memory()
+
+        assert first is second
+        assert mock_get_client.call_count == 1
+        assert mock_get_client.call_args.kwargs["pool_mgr"] is not None
+        assert mock_get_client.call_args.kwargs["compress"] == "lz4"
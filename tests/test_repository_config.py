@@ -76,6 +76,57 @@ class TestRepositoryConfigManager:
         assert config.repositories[1].name == "test-frontend"
         assert "full_stack" in config.component_groups
 
+    def test_load_parses_unchanged_file_once(self, sample_repository_config, monkeypatch):
+        """Test that loads of an unchanged file reuse the parsed configuration."""
+        calls = []
+        real_load = yaml.load
+        monkeypatch.setattr(
+            yaml, "load", lambda *args, **kwargs: calls.append(1) or real_load(*args, **kwargs)
+        )
+
+        first = RepositoryConfigManager(sample_repository_config).load()
+        second = RepositoryConfigManager(sample_repository_config).load()
+
+        assert len(calls) == 1
+        assert second == first
+        # Each manager gets its own copy to modify
+        assert second is not first
+        first.repositories.clear()
+        assert len(second.repositories) == 3
+
+    def test_reload_of_unchanged_file_reuses_copy(self, sample_repository_config, monkeypatch):
+        """Test that a manager doesn't deep-copy an unchanged file on every load."""
+        manager = RepositoryConfigManager(sample_repository_config)
+        first = manager.load()
+
+        copies = []
+        real_copy = type(first).model_copy
+        monkeypatch.setattr(
+            type(first),
+            "model_copy",
+            lambda self, **kwargs: copies.append(1) or real_copy(self, **kwargs),
+        )
+
+        assert manager.load() is first
+        assert copies == []
+
+        manager.add_repository(name="new-repo", url="https://test.com/new-repo")
+        assert len(manager.load().repositories) == 3
+        assert copies == [1]
+
+    def test_load_picks_up_changes(self, tmp_path):
+        """Test that a modified file is parsed again."""
+        config_path = tmp_path / "repos.yaml"
+        config_path.write_text("repositories:\n  - name: one\n    url: https://one.com\n")
+        assert len(RepositoryConfigManager(config_path).load().repositories) == 1
+
+        config_path.write_text(
+            "repositories:\n"
+            "  - name: one\n    url: https://one.com\n"
+            "  - name: two\n    url: https://two.com\n"
+        )
+        assert len(RepositoryConfigManager(config_path).load().repositories) == 2
+
     def test_load_nonexistent_file(self, tmp_path):
         """Test loading from nonexistent file."""
         manager = RepositoryConfigManager(tmp_path / "nonexistent.yaml")
@@ -95,6 +146,42 @@ class TestRepositoryConfigManager:
         assert all(repo.enabled for repo in enabled)
         assert "disabled-repo" not in [repo.name for repo in enabled]
 
+    def test_enabled_repositories_shared(self, sample_repository_config):
+        """Test that enabled repositories are computed once and refreshed on add."""
+        manager = RepositoryConfigManager(sample_repository_config)
+        manager.load()
+
+        first = manager.get_enabled_repositories()
+        assert manager.get_enabled_repositories() is first
+
+        manager.add_repository(name="new-repo", url="https://test.com/new-repo")
+        assert len(manager.get_enabled_repositories()) == len(first) + 1
+
+    def test_in_place_edits_picked_up_on_save(self, tmp_path, sample_repository_config):
+        """Test that toggling an entry in place is reflected once it is saved."""
+        manager = RepositoryConfigManager(sample_repository_config)
+        manager.load()
+        first = manager.get_enabled_repositories()
+
+        first[0].enabled = False
+        manager.config_path = tmp_path / "saved.yaml"
+        manager.save()
+
+        assert len(manager.get_enabled_repositories()) == len(first) - 1
+        assert manager.get_repository(first[0].name) is first[0]
+
+    def test_component_groups_read_only(self, sample_repository_config):
+        """Test that component groups are returned as a read-only view."""
+        manager = RepositoryConfigManager(sample_repository_config)
+        manager.load()
+
+        groups = manager.get_all_component_groups()
+
+        assert "full_stack" in groups
+        assert manager.get_all_component_groups() is groups
+        with pytest.raises(TypeError):
+            groups["new"] = []
+
     def test_get_repository(self, sample_repository_config):
         """Test getting a specific repository."""
         manager = RepositoryConfigManager(sample_repository_config)
@@ -106,6 +193,16 @@ class TestRepositoryConfigManager:
         assert repo.name == "test-backend"
         assert repo.url == "https://dev.azure.com/test/project/_git/backend"
 
+    def test_get_repository_after_add(self, tmp_path):
+        """Test that lookups see repositories added after the first lookup."""
+        manager = RepositoryConfigManager(tmp_path / "repos.yaml")
+        manager.load()
+        assert manager.get_repository("new-repo") is None
+
+        manager.add_repository(name="new-repo", url="https://test.com/new-repo")
+
+        assert manager.get_repository("new-repo").url == "https://test.com/new-repo"
+
     def test_get_nonexistent_repository(self, sample_repository_config):
         """Test getting a nonexistent repository."""
         manager = RepositoryConfigManager(sample_repository_config)
@@ -241,3 +338,28 @@ component_groups:
 
         assert len(errors) > 0
         assert any("nonexistent" in error for error in errors)
+
+    def test_validate_local_paths(self, tmp_path):
+        """Test validation of missing, non-directory and valid local paths."""
+        checkout = tmp_path / "checkout"
+        (checkout / ".git").mkdir(parents=True)
+        not_a_dir = tmp_path / "file.txt"
+        not_a_dir.write_text("")
+
+        manager = RepositoryConfigManager(tmp_path / "repos.yaml")
+        manager.config = RepositoriesConfiguration(
+            repositories=[
+                RepositoryConfig(name="ok", url="https://ok.com", local_path=str(checkout)),
+                RepositoryConfig(
+                    name="missing", url="https://missing.com", local_path=str(tmp_path / "nope")
+                ),
+                RepositoryConfig(name="file", url="https://file.com", local_path=str(not_a_dir)),
+            ]
+        )
+
+        errors = manager.validate()
+
+        assert errors == [
+            f"Local path for repository missing does not exist: {tmp_path / 'nope'}",
+            f"Local path for repository file is not a directory: {not_a_dir}",
+        ]